@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Inventory of counted rows instead of individual units.
+Items with the same name, sell_in and quality evolve identically, so they
+are stored once as a (name, sell_in, quality, count) row and each row is
+updated once per day. Rows that reach the same state (e.g. two batches of
+a normal item that both hit quality 0) are merged, so memory and update
+time follow the number of distinct states rather than the number of units.
+
+Usage:
+    inventory = AggregatedInventory(items)
+    inventory.update_quality()
+    items = inventory.to_items()
+"""
+
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from gilded_rose import GildedRose, Item, QualityUpdater
+
+
+class CountedItem(Item):
+    """An Item standing for count identical units."""
+
+    def __init__(self, name: str, sell_in: int, quality: int, count: int = 1):
+        super().__init__(name, sell_in, quality)
+        self.count = count
+
+    def __repr__(self) -> str:
+        return f"{self.name}, {self.sell_in}, {self.quality} x{self.count}"
+
+
+State = Tuple[str, int, int]
+
+
+class AggregatedInventory:
+    """
+    Counted rows aged by an internal GildedRose.
+    Strategies see each row as a single item, so built-in and custom
+    strategies work unchanged as long as they depend only on the item's
+    name, sell_in and quality.
+    """
+
+    def __init__(self, items: Iterable[Item] = ()):
+        self._rows: List[CountedItem] = []
+        self._by_state: Dict[State, CountedItem] = {}
+        self._gilded_rose = GildedRose(self._rows)
+        for item in items:
+            self.add(item.name, item.sell_in, item.quality)
+
+    @property
+    def rows(self) -> List[CountedItem]:
+        """One row per distinct (name, sell_in, quality)."""
+        return self._rows
+
+    @property
+    def unit_count(self) -> int:
+        """Number of individual units represented."""
+        return sum(row.count for row in self._rows)
+
+    def add(self, name: str, sell_in: int, quality: int, count: int = 1) -> None:
+        """Add count units, joining an existing row in the same state."""
+        if count <= 0:
+            raise ValueError(f"count must be positive, got {count}")
+        row = self._by_state.get((name, sell_in, quality))
+        if row is not None:
+            row.count += count
+            return
+        row = CountedItem(name, sell_in, quality, count)
+        self._by_state[(name, sell_in, quality)] = row
+        self._gilded_rose.add_item(row)
+
+    def register_strategy(self, item_name: str, updater: QualityUpdater) -> None:
+        self._gilded_rose.register_strategy(item_name, updater)
+
+    def update_quality(self) -> None:
+        """Age every row by one day, then merge rows that converged."""
+        self._gilded_rose.update_quality()
+        self._merge_rows()
+
+    def advance(self, days: int) -> None:
+        """Age every row by days at once, then merge rows that converged."""
+        self._gilded_rose.advance(days)
+        self._merge_rows()
+
+    def expand(self) -> Iterator[Item]:
+        """Yield one Item per unit, row by row."""
+        for row in self._rows:
+            for _ in range(row.count):
+                yield Item(row.name, row.sell_in, row.quality)
+
+    def to_items(self) -> List[Item]:
+        return list(self.expand())
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _merge_rows(self) -> None:
+        """Re-key every row by its new state and fold duplicates together."""
+        by_state: Dict[State, CountedItem] = {}
+        merged = False
+        for row in self._rows:
+            state = (row.name, row.sell_in, row.quality)
+            first = by_state.get(state)
+            if first is None:
+                by_state[state] = row
+            else:
+                first.count += row.count
+                row.count = 0
+                merged = True
+        self._by_state = by_state
+        if merged:
+            self._rows = [row for row in self._rows if row.count]
+            self._gilded_rose.items = self._rows
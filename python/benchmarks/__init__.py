@@ -0,0 +1 @@
+"""Performance benchmarks for the Gilded Rose update hot path."""
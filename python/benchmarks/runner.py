@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark runner for GildedRose.update_quality.
+Measures throughput (item-days per second) across inventory sizes, item
+mixes and multi-day runs, writes the results as JSON and fails when a
+result regresses against a stored baseline.
+
+Usage:
+    python -m benchmarks.runner --output results.json
+    python -m benchmarks.runner --sizes 1e3,1e4,1e5,1e6,1e7 --mixes realistic
+    python -m benchmarks.runner --baseline benchmarks/baseline.json --threshold 0.1
+    python -m benchmarks.runner --save-baseline benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from gilded_rose import GildedRose, Item
+
+
+NORMAL = "+5 Dexterity Vest"
+AGED_BRIE = "Aged Brie"
+BACKSTAGE_PASS = "Backstage passes to a TAFKAL80ETC concert"
+SULFURAS = "Sulfuras, Hand of Ragnaros"
+
+# Item-type weights for each mix
+MIXES = {
+    "all-normal": {NORMAL: 1},
+    "all-backstage": {BACKSTAGE_PASS: 1},
+    "realistic": {NORMAL: 70, AGED_BRIE: 10, BACKSTAGE_PASS: 15, SULFURAS: 5},
+}
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_DAYS = [1, 30]
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.10  # Allowed throughput drop before failing
+
+
+def build_inventory(size: int, mix: str, seed: int = 42) -> List[Item]:
+    """Deterministic inventory of the given size and item mix."""
+    rng = random.Random(seed)
+    names = list(MIXES[mix])
+    weights = list(MIXES[mix].values())
+    return [
+        Item(name, rng.randint(-10, 30), 80 if name == SULFURAS else rng.randint(0, 50))
+        for name in rng.choices(names, weights, k=size)
+    ]
+
+
+def time_update_quality(size: int, mix: str, days: int, repeat: int) -> float:
+    """
+    Best wall time of `repeat` runs of update_quality() called days times.
+    The inventory is rebuilt before every run and excluded from the timing.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        gilded_rose = GildedRose(build_inventory(size, mix))
+        start = time.perf_counter()
+        for _ in range(days):
+            gilded_rose.update_quality()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_key(size: int, mix: str, days: int) -> str:
+    """Stable identifier used to match results with the baseline."""
+    return f"update_quality/{mix}/{size}/{days}d"
+
+
+def run_benchmarks(
+    sizes: List[int],
+    mixes: List[str],
+    days: List[int],
+    repeat: int = DEFAULT_REPEAT,
+    timer: Callable[[int, str, int, int], float] = time_update_quality,
+    log: Callable[[str], None] = print,
+) -> Dict[str, dict]:
+    """Run every (size, mix, days) combination and return results by key."""
+    results = {}
+    for mix in mixes:
+        for size in sizes:
+            for day_count in days:
+                seconds = timer(size, mix, day_count, repeat)
+                throughput = size * day_count / seconds if seconds > 0 else float("inf")
+                key = benchmark_key(size, mix, day_count)
+                results[key] = {
+                    "size": size,
+                    "mix": mix,
+                    "days": day_count,
+                    "seconds": seconds,
+                    "item_days_per_second": throughput,
+                }
+                log(f"{key:<45} {seconds * 1000:>10.2f} ms {throughput:>14,.0f} item-days/s")
+    return results
+
+
+def find_regressions(
+    results: Dict[str, dict], baseline: Dict[str, dict], threshold: float = DEFAULT_THRESHOLD
+) -> List[str]:
+    """
+    Describe every benchmark whose throughput dropped by more than
+    threshold (a fraction) compared to the baseline.
+    Benchmarks missing from either side are ignored.
+    """
+    regressions = []
+    for key, result in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        current = result["item_days_per_second"]
+        expected = reference["item_days_per_second"]
+        if current < expected * (1 - threshold):
+            drop = 1 - current / expected
+            regressions.append(
+                f"{key}: {current:,.0f} item-days/s is {drop:.0%} below baseline {expected:,.0f}"
+            )
+    return regressions
+
+
+def load_results(path: str) -> Dict[str, dict]:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)["results"]
+
+
+def save_results(path: str, results: Dict[str, dict]) -> None:
+    document = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(document, handle, indent=2, sort_keys=True)
+
+
+def _parse_int_list(text: str) -> List[int]:
+    """Parse '1e3,10000' style lists into integers."""
+    return [int(float(value)) for value in text.split(",") if value]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark GildedRose.update_quality.")
+    parser.add_argument("--sizes", type=_parse_int_list, default=DEFAULT_SIZES)
+    parser.add_argument("--mixes", default=",".join(MIXES), help="comma-separated mixes")
+    parser.add_argument("--days", type=_parse_int_list, default=DEFAULT_DAYS)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--baseline", help="compare against a stored results file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--save-baseline", help="store these results as the new baseline")
+    arguments = parser.parse_args(argv)
+
+    mixes = arguments.mixes.split(",")
+    unknown = [mix for mix in mixes if mix not in MIXES]
+    if unknown:
+        parser.error(f"unknown mixes: {', '.join(unknown)} (choose from {', '.join(MIXES)})")
+
+    results = run_benchmarks(arguments.sizes, mixes, arguments.days, arguments.repeat)
+    if arguments.output:
+        save_results(arguments.output, results)
+    if arguments.save_baseline:
+        save_results(arguments.save_baseline, results)
+    if arguments.baseline:
+        regressions = find_regressions(results, load_results(arguments.baseline), arguments.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+"""
+Append-only daily change log for GildedRose.
+Most items change by the same (sell_in, quality) amount every day, so the
+log only stores an item when its daily change differs from the day
+before: expiry, a backstage urgency zone, a clamp at 0 or 50. Every other
+item is assumed to keep moving linearly.
+
+Records (little-endian):
+    file header   magic, version
+    record        kind, day, payload size, payload
+    CHECKPOINT    names, then name_id / sell_in / quality and the expected
+                  daily changes as int32 columns
+    DAY           (position gap, sell_in change, quality change) per
+                  changed item, as zigzag varints
+
+Replaying day D starts from the last checkpoint at or before D and only
+touches logged changes, instead of re-simulating every item every day.
+
+Usage:
+    with ChangeLog("inventory.log") as change_log:
+        gilded_rose = GildedRose(items, change_log=change_log)
+        gilded_rose.update_quality()
+    ChangeLogReader("inventory.log").state_at(1)
+"""
+
+import os
+import struct
+from array import array
+from itertools import compress, count
+from operator import ne, or_, sub
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+from gilded_rose import Item, NameRegistry, QualityUpdater
+from int_columns import to_bytes, to_ints
+
+
+MAGIC = b"GRCL"
+VERSION = 1
+FILE_HEADER = struct.Struct("<4sH")
+RECORD_HEADER = struct.Struct("<BiI")
+
+CHECKPOINT = 1
+DAY = 2
+
+CHECKPOINT_COLUMNS = 5  # name_ids, sell_in, quality, sell_in change, quality change
+
+
+class ChangeLog:
+    """
+    Writes the change log while GildedRose updates.
+    GildedRose calls checkpoint() whenever it (re)binds its items and
+    record_day() after every update_quality(); advance() writes a checkpoint
+    for the day it lands on.
+    """
+
+    def __init__(self, path: str, sync: bool = False):
+        """
+        Start a new log at path, or continue an existing one from its last
+        recorded day; a record cut short by a crash is dropped first.
+        sync=True also fsyncs after every record, so a day is durable once
+        update_quality() returns.
+        """
+        self.day = 0
+        self.sync = sync
+        if os.path.exists(path) and os.path.getsize(path):
+            reader = ChangeLogReader(path)  # Rejects files that are not change logs
+            self.day = reader.last_day
+            self._file = open(path, "r+b")
+            self._file.seek(reader.end_offset)
+            self._file.truncate()
+        else:
+            self._file = open(path, "wb")
+            self._file.write(FILE_HEADER.pack(MAGIC, VERSION))
+        # Last recorded state and daily change per item, as plain lists so
+        # whole columns can be diffed at C speed
+        self._sell_in: List[int] = []
+        self._quality: List[int] = []
+        self._sell_in_change: List[int] = []
+        self._quality_change: List[int] = []
+
+    def checkpoint(
+        self, items: List[Item], updaters: List[QualityUpdater], days: int = 0
+    ) -> None:
+        """Record the full state of items, days after the last recorded day."""
+        self.day += days
+        names = NameRegistry()
+        name_ids = array("i", [names.intern(item.name) for item in items])
+        self._sell_in = [item.sell_in for item in items]
+        self._quality = [item.quality for item in items]
+        self._sell_in_change = []
+        self._quality_change = []
+        for item, updater in zip(items, updaters):
+            sell_in_change, quality_change, window = updater.linear_window(
+                item.sell_in, item.quality
+            )
+            if window == 0:
+                sell_in_change = quality_change = 0
+            self._sell_in_change.append(sell_in_change)
+            self._quality_change.append(quality_change)
+
+        payload = bytearray()
+        _append_varint(payload, len(names))
+        for name in names:
+            encoded = name.encode("utf-8")
+            _append_varint(payload, len(encoded))
+            payload += encoded
+        _append_varint(payload, len(items))
+        for column in (name_ids, self._sell_in, self._quality,
+                       self._sell_in_change, self._quality_change):
+            payload += to_bytes(array("i", column))
+        self._write(CHECKPOINT, payload)
+
+    def record_day(self, items: List[Item], updaters: List[QualityUpdater]) -> None:
+        """
+        Record the items whose change since yesterday differs from their
+        last one. Changes are computed and compared column by column, so
+        only the logged items are visited one at a time.
+        """
+        if len(items) != len(self._sell_in):
+            self.checkpoint(items, updaters, days=1)
+            return
+        self.day += 1
+        sell_in = [item.sell_in for item in items]
+        quality = [item.quality for item in items]
+        sell_in_changes = list(map(sub, sell_in, self._sell_in))
+        quality_changes = list(map(sub, quality, self._quality))
+        payload = bytearray()
+        if sell_in_changes != self._sell_in_change or quality_changes != self._quality_change:
+            changed = compress(count(), map(
+                or_,
+                map(ne, sell_in_changes, self._sell_in_change),
+                map(ne, quality_changes, self._quality_change),
+            ))
+            last_position = -1
+            for position in changed:
+                _append_varint(payload, position - last_position)
+                _append_varint(payload, _zigzag(sell_in_changes[position]))
+                _append_varint(payload, _zigzag(quality_changes[position]))
+                last_position = position
+        self._sell_in, self._quality = sell_in, quality
+        self._sell_in_change, self._quality_change = sell_in_changes, quality_changes
+        self._write(DAY, payload)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "ChangeLog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _write(self, kind: int, payload: bytes) -> None:
+        self._file.write(RECORD_HEADER.pack(kind, self.day, len(payload)))
+        self._file.write(payload)
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+
+
+class LogRecord(NamedTuple):
+    kind: int
+    day: int
+    offset: int  # Payload position in the file
+    size: int
+
+
+# Called with (day, position, sell_in, quality) for every logged change
+ChangeVisitor = Callable[[int, int, int, int], None]
+
+
+class ChangeLogReader:
+    """Reconstructs historical states from a change log."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.records: List[LogRecord] = []
+        with open(path, "rb") as handle:
+            file_header = handle.read(FILE_HEADER.size)
+            if len(file_header) < FILE_HEADER.size:
+                raise ValueError("Not a change log: file too short")
+            magic, version = FILE_HEADER.unpack(file_header)
+            if magic != MAGIC:
+                raise ValueError("Not a change log: bad magic number")
+            if version != VERSION:
+                raise ValueError(f"Unsupported change log version {version}")
+            while True:
+                header = handle.read(RECORD_HEADER.size)
+                if len(header) < RECORD_HEADER.size:
+                    break  # End of file, or a record cut short by a crash
+                kind, day, size = RECORD_HEADER.unpack(header)
+                offset = handle.tell()
+                if handle.seek(size, os.SEEK_CUR) > os.fstat(handle.fileno()).st_size:
+                    break
+                self.records.append(LogRecord(kind, day, offset, size))
+
+    @property
+    def last_day(self) -> int:
+        return self.records[-1].day if self.records else 0
+
+    @property
+    def end_offset(self) -> int:
+        """File position just after the last complete record."""
+        if not self.records:
+            return FILE_HEADER.size
+        return self.records[-1].offset + self.records[-1].size
+
+    def state_at(self, day: int) -> List[Item]:
+        """The inventory as it was at the end of day."""
+        start = self._last_checkpoint_before(day)
+        return self._replay(start, day).items_at(day)
+
+    def changes(self, first_day: int, last_day: int) -> Iterator[Tuple[int, int, int, int]]:
+        """
+        (day, position, sell_in, quality) of every logged change in
+        [first_day, last_day], i.e. every item that left its daily pattern.
+        """
+        found = []
+
+        def visit(day: int, position: int, sell_in: int, quality: int) -> None:
+            if day >= first_day:
+                found.append((day, position, sell_in, quality))
+
+        self._replay(self._last_checkpoint_before(first_day), last_day, visit)
+        return iter(found)
+
+    def _last_checkpoint_before(self, day: int) -> int:
+        start = None
+        for index, record in enumerate(self.records):
+            if record.day > day:
+                break
+            if record.kind == CHECKPOINT:
+                start = index
+        if start is None:
+            raise ValueError(f"No checkpoint at or before day {day}")
+        return start
+
+    def _replay(
+        self, start: int, day: int, visit: Optional[ChangeVisitor] = None
+    ) -> "_ReplayState":
+        state = None
+        with open(self.path, "rb") as handle:
+            for record in self.records[start:]:
+                if record.day > day:
+                    break
+                handle.seek(record.offset)
+                payload = handle.read(record.size)
+                if record.kind == CHECKPOINT:
+                    state = _ReplayState.from_checkpoint(record.day, payload)
+                else:
+                    state.apply_day(record.day, payload, visit)
+        return state
+
+
+class _ReplayState:
+    """
+    Per-item anchors for replay: the state on anchor_day plus the daily
+    change that continues from there until the next logged change.
+    """
+
+    def __init__(self, names: List[str], name_ids, sell_in, quality,
+                 sell_in_change, quality_change, day: int):
+        self.names = names
+        self.name_ids = name_ids
+        self.sell_in = sell_in
+        self.quality = quality
+        self.sell_in_change = sell_in_change
+        self.quality_change = quality_change
+        self.anchor_day = array("i", [day]) * len(sell_in)
+
+    @classmethod
+    def from_checkpoint(cls, day: int, payload: bytes) -> "_ReplayState":
+        values = _VarintReader(payload)
+        names = []
+        for _ in range(values.next()):
+            size = values.next()
+            names.append(values.take(size).decode("utf-8"))
+        count = values.next()
+        columns = []
+        for _ in range(CHECKPOINT_COLUMNS):
+            columns.append(to_ints(values.take(count * 4), copy=True))
+        return cls(names, *columns, day=day)
+
+    def apply_day(self, day: int, payload: bytes, visit: Optional[ChangeVisitor]) -> None:
+        values = _VarintReader(payload)
+        position = -1
+        while not values.done():
+            position += values.next()
+            sell_in_change = _unzigzag(values.next())
+            quality_change = _unzigzag(values.next())
+            sell_in, quality = self.at(position, day - 1)
+            sell_in += sell_in_change
+            quality += quality_change
+            self.sell_in[position] = sell_in
+            self.quality[position] = quality
+            self.sell_in_change[position] = sell_in_change
+            self.quality_change[position] = quality_change
+            self.anchor_day[position] = day
+            if visit is not None:
+                visit(day, position, sell_in, quality)
+
+    def at(self, position: int, day: int) -> Tuple[int, int]:
+        elapsed = day - self.anchor_day[position]
+        return (
+            self.sell_in[position] + self.sell_in_change[position] * elapsed,
+            self.quality[position] + self.quality_change[position] * elapsed,
+        )
+
+    def items_at(self, day: int) -> List[Item]:
+        names = self.names
+        return [
+            Item(names[name_id], *self.at(position, day))
+            for position, name_id in enumerate(self.name_ids)
+        ]
+
+
+class _VarintReader:
+    """Sequential reader of unsigned LEB128 varints and raw byte runs."""
+
+    def __init__(self, data: bytes):
+        self._data = data
+        self._offset = 0
+
+    def next(self) -> int:
+        data, offset = self._data, self._offset
+        value = shift = 0
+        while True:
+            byte = data[offset]
+            offset += 1
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                self._offset = offset
+                return value
+            shift += 7
+
+    def take(self, size: int) -> bytes:
+        chunk = self._data[self._offset:self._offset + size]
+        self._offset += size
+        return chunk
+
+    def done(self) -> bool:
+        return self._offset >= len(self._data)
+
+
+def _append_varint(buffer: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _zigzag(value: int) -> int:
+    """Map signed to unsigned so small negative changes stay one byte."""
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
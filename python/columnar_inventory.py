@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+Columnar inventory engine for very large catalogs.
+Stores sell_in and quality in NumPy integer arrays next to a category code
+array, so one day of updates is a handful of vectorized masked operations
+per category instead of several Python method calls per item.
+Results are identical to the strategy classes in gilded_rose.
+"""
+
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from gilded_rose import (
+    AgedBrieUpdater,
+    BackstagePassUpdater,
+    ConjuredItemUpdater,
+    Item,
+    ItemUpdaterFactory,
+    NameRegistry,
+    NormalItemUpdater,
+    QualityUpdater,
+    SulfurasUpdater,
+)
+
+
+# Category codes stored in ColumnarInventory.categories
+NORMAL = 0
+AGED_BRIE = 1
+BACKSTAGE_PASS = 2
+SULFURAS = 3
+CONJURED = 4
+
+CATEGORY_BY_STRATEGY = {
+    NormalItemUpdater: NORMAL,
+    AgedBrieUpdater: AGED_BRIE,
+    BackstagePassUpdater: BACKSTAGE_PASS,
+    SulfurasUpdater: SULFURAS,
+    ConjuredItemUpdater: CONJURED,
+}
+
+MINIMUM_QUALITY = QualityUpdater.MINIMUM_QUALITY
+MAXIMUM_QUALITY = QualityUpdater.MAXIMUM_QUALITY
+DAYS_CRITICAL_ZONE = BackstagePassUpdater.DAYS_CRITICAL_ZONE
+DAYS_URGENT_ZONE = BackstagePassUpdater.DAYS_URGENT_ZONE
+
+
+def category_for(updater: QualityUpdater) -> int:
+    """
+    Map a strategy instance to its category code.
+    Only the exact built-in strategy types have a vectorized rule.
+    """
+    try:
+        return CATEGORY_BY_STRATEGY[type(updater)]
+    except KeyError:
+        raise ValueError(
+            f"No vectorized rule for strategy {type(updater).__name__}"
+        ) from None
+
+
+def category_codes(updater_factory: ItemUpdaterFactory) -> np.ndarray:
+    """Category code of every name interned in the factory, indexed by name id."""
+    return np.array(
+        [
+            category_for(updater_factory.get_updater_by_id(name_id))
+            for name_id in range(len(updater_factory.names))
+        ],
+        dtype=np.int8,
+    )
+
+
+class ColumnarInventory:
+    """
+    Inventory held as parallel NumPy columns.
+
+    - names: NameRegistry string table shared by all rows
+    - name_ids: int32 id of each row's name in the registry
+    - sell_in / quality: int64 columns mutated in place
+    - categories: int8 category codes (NORMAL, AGED_BRIE, ...)
+    """
+
+    def __init__(
+        self,
+        names: NameRegistry,
+        name_ids: np.ndarray,
+        sell_in: np.ndarray,
+        quality: np.ndarray,
+        categories: np.ndarray,
+    ):
+        if not len(name_ids) == len(sell_in) == len(quality) == len(categories):
+            raise ValueError("All columns must have the same length")
+        self.names = names
+        self.name_ids = np.asarray(name_ids, dtype=np.int32)
+        self.sell_in = np.asarray(sell_in, dtype=np.int64)
+        self.quality = np.asarray(quality, dtype=np.int64)
+        self.categories = np.asarray(categories, dtype=np.int8)
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[Item],
+        updater_factory: Optional[ItemUpdaterFactory] = None,
+    ) -> "ColumnarInventory":
+        """
+        Build the columns from Item objects.
+        Names are interned in the factory's registry and categories are
+        resolved once per name id, then gathered with one array index.
+        """
+        factory = updater_factory or ItemUpdaterFactory()
+        intern = factory.names.intern
+        name_ids, sell_in, quality = [], [], []
+        for item in items:
+            name_ids.append(intern(item.name))
+            sell_in.append(item.sell_in)
+            quality.append(item.quality)
+        name_ids = np.array(name_ids, dtype=np.int32)
+        return cls(
+            factory.names,
+            name_ids,
+            np.array(sell_in),
+            np.array(quality),
+            category_codes(factory)[name_ids],
+        )
+
+    def to_items(self) -> List[Item]:
+        """Materialize the columns back into Item objects."""
+        names = self.names.names
+        return [
+            Item(names[name_id], sell_in, quality)
+            for name_id, sell_in, quality in zip(
+                self.name_ids.tolist(), self.sell_in.tolist(), self.quality.tolist()
+            )
+        ]
+
+    def __len__(self) -> int:
+        return len(self.name_ids)
+
+    def update_quality(self) -> None:
+        """
+        Apply one day to every row.
+        Mirrors the strategies: quality first, then sell_in, then the
+        post-expiration rule evaluated on the new sell_in.
+        """
+        sell_in, quality, categories = self.sell_in, self.quality, self.categories
+        normal = categories == NORMAL
+        aged_brie = categories == AGED_BRIE
+        backstage = categories == BACKSTAGE_PASS
+        conjured = categories == CONJURED
+        aging = categories != SULFURAS
+
+        daily_change = np.where(
+            sell_in < DAYS_CRITICAL_ZONE, 3, np.where(sell_in < DAYS_URGENT_ZONE, 2, 1)
+        )
+        daily_change[normal] = -1
+        daily_change[aged_brie] = 1
+        daily_change[conjured] = -ConjuredItemUpdater.DEGRADATION
+        np.copyto(quality, self._clip(quality + daily_change), where=aging)
+
+        sell_in[aging] -= 1
+        expired = aging & (sell_in < 0)
+        np.copyto(quality, self._clip(quality - 1), where=expired & normal)
+        np.copyto(
+            quality,
+            self._clip(quality - ConjuredItemUpdater.DEGRADATION),
+            where=expired & conjured,
+        )
+        np.copyto(quality, self._clip(quality + 1), where=expired & aged_brie)
+        quality[expired & backstage] = MINIMUM_QUALITY
+
+    def advance(self, days: int) -> None:
+        """
+        Apply several days at once using the same closed forms as the
+        strategies' advance(), evaluated column-wise.
+        """
+        if days < 0:
+            raise ValueError(f"days must be non-negative, got {days}")
+        if days == 0:
+            return
+        sell_in, quality, categories = self.sell_in, self.quality, self.categories
+        normal = categories == NORMAL
+        aged_brie = categories == AGED_BRIE
+        backstage = categories == BACKSTAGE_PASS
+        conjured = categories == CONJURED
+
+        unit_steps = days + np.maximum(0, days - np.maximum(sell_in, 0))
+        np.copyto(
+            quality,
+            np.maximum(MINIMUM_QUALITY, self._clip(quality - 1) - (unit_steps - 1)),
+            where=normal,
+        )
+        degradation = ConjuredItemUpdater.DEGRADATION
+        np.copyto(
+            quality,
+            np.maximum(
+                MINIMUM_QUALITY,
+                self._clip(quality - degradation) - degradation * (unit_steps - 1),
+            ),
+            where=conjured,
+        )
+        np.copyto(
+            quality,
+            np.minimum(MAXIMUM_QUALITY, self._clip(quality + 1) + (unit_steps - 1)),
+            where=aged_brie,
+        )
+        np.copyto(quality, self._advance_backstage_quality(days), where=backstage)
+
+        sell_in[categories != SULFURAS] -= days
+
+    def _advance_backstage_quality(self, days: int) -> np.ndarray:
+        """Closed-form backstage quality for every row (masked by the caller)."""
+        sell_in, quality = self.sell_in, self.quality
+        last_day_sell_in = sell_in - days + 1
+
+        def days_below(threshold: int) -> np.ndarray:
+            return np.maximum(0, np.minimum(sell_in, threshold - 1) - last_day_sell_in + 1)
+
+        first_day_increase = np.where(
+            sell_in < DAYS_CRITICAL_ZONE, 3, np.where(sell_in < DAYS_URGENT_ZONE, 2, 1)
+        )
+        total_increase = days + days_below(DAYS_URGENT_ZONE) + days_below(DAYS_CRITICAL_ZONE)
+        increased = np.minimum(
+            MAXIMUM_QUALITY,
+            self._clip(quality + first_day_increase) + (total_increase - first_day_increase),
+        )
+        return np.where(last_day_sell_in <= 0, MINIMUM_QUALITY, increased)
+
+    @staticmethod
+    def _clip(quality: np.ndarray) -> np.ndarray:
+        """Vectorized clamp_quality."""
+        return np.clip(quality, MINIMUM_QUALITY, MAXIMUM_QUALITY)
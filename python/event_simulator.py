@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Event-driven inventory simulation.
+Between regime changes (sell_in crossing 0, the backstage urgency zones,
+quality reaching a bound) every item changes linearly, as described by
+QualityUpdater.linear_window(). The simulator stores each item as an
+anchor state plus per-day rates and only does work on the day an item's
+regime ends, so the cost scales with the number of regime changes rather
+than items x days.
+"""
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+from gilded_rose import Item, ItemUpdaterFactory, QualityUpdater
+
+
+class TimingWheel:
+    """
+    Calendar of pending events bucketed by absolute day.
+    A heap of the days that have a bucket lets the simulator jump straight
+    to the next day with events, skipping quiet days entirely.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[int, List[int]] = {}
+        self._days: List[int] = []
+
+    def schedule(self, day: int, entry: int) -> None:
+        bucket = self._buckets.get(day)
+        if bucket is None:
+            bucket = self._buckets[day] = []
+            heapq.heappush(self._days, day)
+        bucket.append(entry)
+
+    def next_day(self) -> Optional[int]:
+        """Earliest day with pending events, or None."""
+        return self._days[0] if self._days else None
+
+    def pop_next(self) -> Tuple[int, List[int]]:
+        """Remove and return the earliest day and its entries."""
+        day = heapq.heappop(self._days)
+        return day, self._buckets.pop(day)
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+
+class EventDrivenSimulator:
+    """
+    Simulates many days over an inventory by processing regime changes.
+
+    Each item keeps (anchor_day, anchor_sell_in, anchor_quality) plus its
+    per-day changes; its state on any day inside the regime is computed
+    on demand. Items are written back only by materialize().
+    """
+
+    def __init__(self, items: List[Item], updater_factory: Optional[ItemUpdaterFactory] = None):
+        factory = updater_factory or ItemUpdaterFactory()
+        self.items = items
+        self.day = 0
+        self.events_processed = 0
+        self._updaters: List[QualityUpdater] = [factory.get_updater(item.name) for item in items]
+        self._anchor_day = [0] * len(items)
+        self._anchor_sell_in = [item.sell_in for item in items]
+        self._anchor_quality = [item.quality for item in items]
+        self._sell_in_change = [0] * len(items)
+        self._quality_change = [0] * len(items)
+        self._wheel = TimingWheel()
+        for index, item in enumerate(items):
+            self._start_regime(index, 0, item.sell_in, item.quality)
+
+    def run(self, days: int) -> None:
+        """Move the simulation forward by days, handling every regime change on the way."""
+        if days < 0:
+            raise ValueError(f"days must be non-negative, got {days}")
+        target_day = self.day + days
+        wheel = self._wheel
+        while wheel.next_day() is not None and wheel.next_day() <= target_day:
+            day, indexes = wheel.pop_next()
+            for index in indexes:
+                sell_in, quality = self._state_on(index, day)
+                self._start_regime(index, day, sell_in, quality)
+            self.events_processed += len(indexes)
+        self.day = target_day
+
+    def state(self, index: int) -> Tuple[int, int]:
+        """(sell_in, quality) of item index on the current day."""
+        return self._state_on(index, self.day)
+
+    def materialize(self) -> List[Item]:
+        """Write the current state into the items and return them."""
+        for index, item in enumerate(self.items):
+            item.sell_in, item.quality = self.state(index)
+        return self.items
+
+    def _state_on(self, index: int, day: int) -> Tuple[int, int]:
+        elapsed = day - self._anchor_day[index]
+        return (
+            self._anchor_sell_in[index] + self._sell_in_change[index] * elapsed,
+            self._anchor_quality[index] + self._quality_change[index] * elapsed,
+        )
+
+    def _start_regime(self, index: int, day: int, sell_in: int, quality: int) -> None:
+        """
+        Anchor item index at its state on day and schedule the end of its regime.
+        Without a linear window the next day is simulated exactly and treated
+        as a one-day regime.
+        """
+        updater = self._updaters[index]
+        sell_in_change, quality_change, days = updater.linear_window(sell_in, quality)
+        if days == 0:
+            scratch = Item(self.items[index].name, sell_in, quality)
+            updater.update_quality(scratch)
+            updater.update_sell_in(scratch)
+            sell_in_change = scratch.sell_in - sell_in
+            quality_change = scratch.quality - quality
+            days = 1
+        self._anchor_day[index] = day
+        self._anchor_sell_in[index] = sell_in
+        self._anchor_quality[index] = quality
+        self._sell_in_change[index] = sell_in_change
+        self._quality_change[index] = quality_change
+        if days != QualityUpdater.FOREVER:
+            self._wheel.schedule(day + days, index)
@@ -5,8 +5,13 @@ Applies Clean Code principles: semantic naming, single responsibility,
 DRY (Don't Repeat Yourself), and Strategy Pattern for extensibility.
 """
 
+import sys
 from abc import ABC, abstractmethod
-from typing import List
+from array import array
+from operator import is_not
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from name_matcher import LRUCache, NameMatcher
 
 
 class Item:
@@ -21,6 +26,20 @@ class Item:
         return f"{self.name}, {self.sell_in}, {self.quality}"
 
 
+class CompactItem:
+    """
+    Memory-lean variant of Item for very large inventories.
+    Same fields, constructor and repr, but stored in __slots__ instead of a
+    per-instance __dict__. Drop-in wherever an Item is expected.
+    """
+    
+    __slots__ = ("name", "sell_in", "quality")
+    
+    # Reuse Item's behavior so both variants can never drift apart
+    __init__ = Item.__init__
+    __repr__ = Item.__repr__
+
+
 class QualityUpdater(ABC):
     """
     Abstract base class implementing Strategy Pattern for quality updates.
@@ -29,6 +48,7 @@ class QualityUpdater(ABC):
     
     MINIMUM_QUALITY = 0
     MAXIMUM_QUALITY = 50
+    FOREVER = sys.maxsize  # linear_window() length of a regime that never ends
     
     @abstractmethod
     def update_quality(self, item: Item) -> None:
@@ -51,6 +71,95 @@ class QualityUpdater(ABC):
     def decrease_sell_in(self, item: Item) -> None:
         """Semantic method for sell_in decrement."""
         item.sell_in -= 1
+    
+    def step(self, sell_in: int, quality: int) -> Tuple[int, int]:
+        """
+        One full day as a pure function: (sell_in, quality) -> (sell_in, quality).
+        Built-in strategies implement it with a single call; this default
+        derives it from update_quality and update_sell_in on a scratch item.
+        """
+        scratch = Item("", sell_in, quality)
+        self.update_quality(scratch)
+        self.update_sell_in(scratch)
+        return scratch.sell_in, scratch.quality
+    
+    def has_native_step(self) -> bool:
+        """True when step() is implemented directly rather than derived."""
+        return type(self).step is not QualityUpdater.step
+    
+    def update_batch(self, items: Sequence[Item]) -> None:
+        """
+        Apply one full day to every item of this strategy.
+        Built-in strategies override it with a tight loop; this default
+        uses a native step() when there is one, else the per-item rules.
+        """
+        if self.has_native_step():
+            step = self.step
+            for item in items:
+                item.sell_in, item.quality = step(item.sell_in, item.quality)
+            return
+        for item in items:
+            self.update_quality(item)
+            self.update_sell_in(item)
+    
+    # Methods that restate the daily rules in a faster form
+    FUSED_METHODS = ("step", "update_batch", "advance", "linear_window")
+    # Methods the daily rules are made of, including the built-ins' helpers
+    RULE_METHODS = (
+        "update_quality",
+        "update_sell_in",
+        "clamp_quality",
+        "is_expired",
+        "decrease_sell_in",
+        "_degrade_quality_before_expiration",
+        "_degrade_quality_additional_after_expiration",
+        "_improve_quality_before_expiration",
+        "_improve_quality_additional_after_expiration",
+        "_increase_quality_by_urgency",
+        "_calculate_quality_increase",
+        "_expire_backstage_pass",
+    )
+    
+    def __init_subclass__(cls, **kwargs):
+        """
+        A subclass that redefines any of the daily rules gets the generic
+        version of every fused method it does not redefine itself, so it
+        never inherits a parent's fused day, closed form or linear window.
+        """
+        super().__init_subclass__(**kwargs)
+        redefines_rules = any(name in cls.__dict__ for name in QualityUpdater.RULE_METHODS)
+        if redefines_rules:
+            for method_name in QualityUpdater.FUSED_METHODS:
+                if method_name not in cls.__dict__:
+                    setattr(cls, method_name, getattr(QualityUpdater, method_name))
+    
+    def advance(self, item: Item, days: int) -> None:
+        """
+        Age the item by several days at once.
+        Default replays the daily rules; built-in strategies override it
+        with a closed form whose cost does not depend on days.
+        """
+        for _ in range(days):
+            self.update_quality(item)
+            self.update_sell_in(item)
+    
+    def linear_window(self, sell_in: int, quality: int) -> Tuple[int, int, int]:
+        """
+        Describe the current regime as (sell_in_change, quality_change, days):
+        for the next `days` days, each day changes sell_in and quality by
+        exactly these amounts (days may be FOREVER).
+        days == 0 means no linear regime is known and the next day has to be
+        simulated with the daily rules; this is the default for custom strategies.
+        """
+        return 0, 0, 0
+    
+    def is_frozen(self, item: Item) -> bool:
+        """True when no future update changes the item at all."""
+        return self.linear_window(item.sell_in, item.quality) == (0, 0, self.FOREVER)
+    
+    def count_expired_days(self, sell_in: int, days: int) -> int:
+        """Number of the next days that end with the item past its sell_in date."""
+        return max(0, days - max(sell_in, 0))
 
 
 class NormalItemUpdater(QualityUpdater):
@@ -59,8 +168,10 @@ class NormalItemUpdater(QualityUpdater):
     Degrades quality by 1 before expiration, 2 after.
     """
     
+    DEGRADATION = 1  # Quality lost per day before expiration; doubled after it
+    
     def update_quality(self, item: Item) -> None:
-        """Decrease quality by 1 before expiration, 2 after."""
+        """Decrease quality by DEGRADATION before expiration, twice that after."""
         self._degrade_quality_before_expiration(item)
     
     def update_sell_in(self, item: Item) -> None:
@@ -70,13 +181,72 @@ class NormalItemUpdater(QualityUpdater):
         if self.is_expired(item):
             self._degrade_quality_additional_after_expiration(item)
     
+    def step(self, sell_in: int, quality: int) -> Tuple[int, int]:
+        """Fused day: clamp after the first degradation, floor after the second."""
+        degradation = self.DEGRADATION
+        quality = max(self.MINIMUM_QUALITY, min(quality - degradation, self.MAXIMUM_QUALITY))
+        sell_in -= 1
+        if sell_in < 0:
+            quality = max(self.MINIMUM_QUALITY, quality - degradation)
+        return sell_in, quality
+    
+    def update_batch(self, items: Sequence[Item]) -> None:
+        """step() inlined over the whole batch."""
+        degradation = self.DEGRADATION
+        minimum, maximum = self.MINIMUM_QUALITY, self.MAXIMUM_QUALITY
+        for item in items:
+            quality = item.quality - degradation
+            if quality > maximum:
+                quality = maximum
+            sell_in = item.sell_in - 1
+            if sell_in < 0:
+                quality -= degradation
+            item.sell_in = sell_in
+            item.quality = quality if quality > minimum else minimum
+    
+    def advance(self, item: Item, days: int) -> None:
+        """
+        Closed form: one step of DEGRADATION per day plus one per expired day.
+        Only the first step can hit the upper clamp, the rest only the lower one.
+        """
+        if days <= 0:
+            return
+        steps = days + self.count_expired_days(item.sell_in, days)
+        first_step_quality = self.clamp_quality(item.quality - self.DEGRADATION)
+        item.quality = max(
+            self.MINIMUM_QUALITY, first_step_quality - self.DEGRADATION * (steps - 1)
+        )
+        item.sell_in -= days
+    
+    def linear_window(self, sell_in: int, quality: int) -> Tuple[int, int, int]:
+        """
+        -DEGRADATION per day until the sell_in date, twice that after it, as
+        long as quality stays within bounds. Worthless items stay at 0 forever.
+        """
+        if quality == self.MINIMUM_QUALITY:
+            return -1, 0, self.FOREVER
+        if not self.MINIMUM_QUALITY < quality <= self.MAXIMUM_QUALITY:
+            return 0, 0, 0
+        if sell_in >= 1:
+            return -1, -self.DEGRADATION, min(sell_in, quality // self.DEGRADATION)
+        return -1, -2 * self.DEGRADATION, quality // (2 * self.DEGRADATION)
+    
     def _degrade_quality_before_expiration(self, item: Item) -> None:
-        """Quality decreases by 1 before sell_in date."""
-        item.quality = self.clamp_quality(item.quality - 1)
+        """Quality decreases by DEGRADATION before sell_in date."""
+        item.quality = self.clamp_quality(item.quality - self.DEGRADATION)
     
     def _degrade_quality_additional_after_expiration(self, item: Item) -> None:
         """Quality degrades one more time after becoming expired."""
-        item.quality = self.clamp_quality(item.quality - 1)
+        item.quality = self.clamp_quality(item.quality - self.DEGRADATION)
+
+
+class ConjuredItemUpdater(NormalItemUpdater):
+    """
+    Strategy for Conjured items.
+    Degrades twice as fast as normal items: 2 before expiration, 4 after.
+    """
+    
+    DEGRADATION = 2
 
 
 class AgedBrieUpdater(QualityUpdater):
@@ -96,6 +266,54 @@ class AgedBrieUpdater(QualityUpdater):
         if self.is_expired(item):
             self._improve_quality_additional_after_expiration(item)
     
+    def step(self, sell_in: int, quality: int) -> Tuple[int, int]:
+        """Fused day: clamp after the first improvement, cap after the second."""
+        maximum = self.MAXIMUM_QUALITY
+        quality = max(self.MINIMUM_QUALITY, min(quality + 1, maximum))
+        sell_in -= 1
+        if sell_in < 0 and quality < maximum:
+            quality += 1
+        return sell_in, quality
+    
+    def update_batch(self, items: Sequence[Item]) -> None:
+        """step() inlined over the whole batch."""
+        minimum, maximum = self.MINIMUM_QUALITY, self.MAXIMUM_QUALITY
+        for item in items:
+            quality = item.quality + 1
+            if quality < minimum:
+                quality = minimum
+            sell_in = item.sell_in - 1
+            if sell_in < 0:
+                quality += 1
+            item.sell_in = sell_in
+            item.quality = quality if quality < maximum else maximum
+    
+    def advance(self, item: Item, days: int) -> None:
+        """
+        Closed form: one unit of improvement per day plus one per expired day.
+        Only the first step can hit the lower clamp, the rest only the upper one.
+        """
+        if days <= 0:
+            return
+        improvement = days + self.count_expired_days(item.sell_in, days)
+        first_day_quality = self.clamp_quality(item.quality + 1)
+        item.quality = min(self.MAXIMUM_QUALITY, first_day_quality + (improvement - 1))
+        item.sell_in -= days
+    
+    def linear_window(self, sell_in: int, quality: int) -> Tuple[int, int, int]:
+        """
+        +1 per day until the sell_in date, +2 per day after it, as long as
+        quality stays within bounds. Aged Brie at maximum stays there forever.
+        """
+        if quality == self.MAXIMUM_QUALITY:
+            return -1, 0, self.FOREVER
+        if not self.MINIMUM_QUALITY <= quality < self.MAXIMUM_QUALITY:
+            return 0, 0, 0
+        headroom = self.MAXIMUM_QUALITY - quality
+        if sell_in >= 1:
+            return -1, 1, min(sell_in, headroom)
+        return -1, 2, headroom // 2
+    
     def _improve_quality_before_expiration(self, item: Item) -> None:
         """Quality increases by 1 before sell_in date."""
         item.quality = self.clamp_quality(item.quality + 1)
@@ -125,6 +343,77 @@ class BackstagePassUpdater(QualityUpdater):
         if self.is_expired(item):
             self._expire_backstage_pass(item)
     
+    def step(self, sell_in: int, quality: int) -> Tuple[int, int]:
+        """Fused day: tiered bonus, then worthless once the concert has passed."""
+        if sell_in <= 0:
+            return sell_in - 1, self.MINIMUM_QUALITY
+        if sell_in < self.DAYS_CRITICAL_ZONE:
+            quality += 3
+        elif sell_in < self.DAYS_URGENT_ZONE:
+            quality += 2
+        else:
+            quality += 1
+        return sell_in - 1, max(self.MINIMUM_QUALITY, min(quality, self.MAXIMUM_QUALITY))
+    
+    def update_batch(self, items: Sequence[Item]) -> None:
+        """step() inlined over the whole batch."""
+        minimum, maximum = self.MINIMUM_QUALITY, self.MAXIMUM_QUALITY
+        critical, urgent = self.DAYS_CRITICAL_ZONE, self.DAYS_URGENT_ZONE
+        for item in items:
+            sell_in = item.sell_in
+            if sell_in <= 0:
+                quality = minimum
+            else:
+                quality = item.quality + (3 if sell_in < critical else 2 if sell_in < urgent else 1)
+                quality = max(minimum, min(quality, maximum))
+            item.sell_in = sell_in - 1
+            item.quality = quality
+    
+    def advance(self, item: Item, days: int) -> None:
+        """
+        Closed form: any day starting at sell_in <= 0 ends with quality 0,
+        otherwise the tiered bonuses are summed per urgency zone.
+        """
+        if days <= 0:
+            return
+        last_day_sell_in = item.sell_in - days + 1
+        if last_day_sell_in <= 0:
+            item.quality = self.MINIMUM_QUALITY
+        else:
+            first_day_increase = self._calculate_quality_increase(item.sell_in)
+            total_increase = self._calculate_total_quality_increase(item.sell_in, days)
+            first_day_quality = self.clamp_quality(item.quality + first_day_increase)
+            item.quality = min(
+                self.MAXIMUM_QUALITY,
+                first_day_quality + (total_increase - first_day_increase),
+            )
+        item.sell_in -= days
+    
+    def linear_window(self, sell_in: int, quality: int) -> Tuple[int, int, int]:
+        """
+        The bonus is constant until sell_in leaves its urgency zone or quality
+        reaches the maximum. A pass at maximum stays there until the concert
+        day; a pass that already lost its value stays worthless forever.
+        The concert day itself (drop to 0) is never part of a window.
+        """
+        if sell_in <= 0:
+            if quality == self.MINIMUM_QUALITY:
+                return -1, 0, self.FOREVER
+            return 0, 0, 0
+        if quality == self.MAXIMUM_QUALITY:
+            return -1, 0, sell_in
+        if not self.MINIMUM_QUALITY <= quality < self.MAXIMUM_QUALITY:
+            return 0, 0, 0
+        quality_increase = self._calculate_quality_increase(sell_in)
+        if sell_in >= self.DAYS_URGENT_ZONE:
+            days_in_zone = sell_in - self.DAYS_URGENT_ZONE + 1
+        elif sell_in >= self.DAYS_CRITICAL_ZONE:
+            days_in_zone = sell_in - self.DAYS_CRITICAL_ZONE + 1
+        else:
+            days_in_zone = sell_in
+        headroom_days = (self.MAXIMUM_QUALITY - quality) // quality_increase
+        return -1, quality_increase, min(days_in_zone, headroom_days)
+    
     def _increase_quality_by_urgency(self, item: Item) -> None:
         """Increase quality based on days until concert (tiered bonuses)."""
         quality_increase = self._calculate_quality_increase(item.sell_in)
@@ -142,6 +431,20 @@ class BackstagePassUpdater(QualityUpdater):
         else:
             return 1  # More than 10 days: increase by 1
     
+    def _calculate_total_quality_increase(self, sell_in: int, days: int) -> int:
+        """
+        Sum of the daily bonuses while sell_in walks from sell_in down to
+        sell_in - days + 1: +1 every day, +1 more inside each zone.
+        """
+        last_day_sell_in = sell_in - days + 1
+        urgent_days = self._count_days_below(last_day_sell_in, sell_in, self.DAYS_URGENT_ZONE)
+        critical_days = self._count_days_below(last_day_sell_in, sell_in, self.DAYS_CRITICAL_ZONE)
+        return days + urgent_days + critical_days
+    
+    def _count_days_below(self, lowest_sell_in: int, highest_sell_in: int, threshold: int) -> int:
+        """Count the sell_in values in [lowest, highest] that are below threshold."""
+        return max(0, min(highest_sell_in, threshold - 1) - lowest_sell_in + 1)
+    
     def _expire_backstage_pass(self, item: Item) -> None:
         """Backstage pass loses all value after concert."""
         item.quality = self.MINIMUM_QUALITY
@@ -160,6 +463,61 @@ class SulfurasUpdater(QualityUpdater):
     def update_sell_in(self, item: Item) -> None:
         """Sulfuras is legendary - sell_in never changes."""
         pass  # No operation - immutable
+    
+    def step(self, sell_in: int, quality: int) -> Tuple[int, int]:
+        """Sulfuras is legendary - a day changes nothing."""
+        return sell_in, quality
+    
+    def update_batch(self, items: Sequence[Item]) -> None:
+        """Sulfuras is legendary - nothing to do for any number of items."""
+        pass  # No operation - immutable
+    
+    def advance(self, item: Item, days: int) -> None:
+        """Sulfuras is legendary - no number of days changes it."""
+        pass  # No operation - immutable
+    
+    def linear_window(self, sell_in: int, quality: int) -> Tuple[int, int, int]:
+        """Sulfuras is legendary - nothing changes, forever."""
+        return 0, 0, self.FOREVER
+
+
+class NameRegistry:
+    """
+    Interns item names and gives each distinct name a small integer id.
+    Inventories repeat the same names many times, so storing ids instead of
+    strings saves memory and turns per-name lookups into list indexing.
+    """
+    
+    def __init__(self):
+        self._ids = {}
+        self._names: List[str] = []
+    
+    def intern(self, name: str) -> int:
+        """Return the id of name, assigning the next free id on first sight."""
+        name_id = self._ids.get(name)
+        if name_id is None:
+            name_id = len(self._names)
+            self._names.append(name)
+            self._ids[name] = name_id
+        return name_id
+    
+    def name_of(self, name_id: int) -> str:
+        """Return the name registered under name_id."""
+        return self._names[name_id]
+    
+    @property
+    def names(self) -> List[str]:
+        """All interned names, indexed by id."""
+        return self._names
+    
+    def __len__(self) -> int:
+        return len(self._names)
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
 
 
 class ItemUpdaterFactory:
@@ -167,22 +525,53 @@ class ItemUpdaterFactory:
     Factory Pattern for creating strategies.
     Implements Open/Closed Principle: open for extension, closed for modification.
     Adding new item types requires only adding a new strategy class.
+    
+    Strategies are stateless, so one shared instance serves every item.
+    Names are routed by exact match first, then by pattern (prefix, glob
+    or regex, see NameMatcher). Each resolved name is memoized in a
+    bounded LRU cache, and names interned in the factory's NameRegistry
+    can be dispatched by id, which is a plain list index; the matcher
+    runs once per distinct name.
     """
     
-    def __init__(self):
+    MAX_RESOLVED_NAMES = 4096  # Bound for catalogs with open-ended item names
+    
+    def __init__(self, names: Optional[NameRegistry] = None):
         """Initialize with all known item type strategies."""
+        backstage_pass_updater = BackstagePassUpdater()
         self._strategies = {
             "Aged Brie": AgedBrieUpdater(),
-            "Backstage passes to a TAFKAL80ETC concert": BackstagePassUpdater(),
+            "Backstage passes to a TAFKAL80ETC concert": backstage_pass_updater,
             "Sulfuras, Hand of Ragnaros": SulfurasUpdater(),
         }
+        self._patterns = NameMatcher()
+        self._patterns.add_prefix("Backstage passes to ", backstage_pass_updater)
+        self._patterns.add_prefix("Conjured", ConjuredItemUpdater())
+        self._default_updater = NormalItemUpdater()
+        self._resolved = LRUCache(self.MAX_RESOLVED_NAMES)
+        self.version = 0  # Bumped whenever the routing changes; lets caches detect stale results
+        self.names = names if names is not None else NameRegistry()
+        self._updaters_by_id: List[QualityUpdater] = []
     
     def get_updater(self, item_name: str) -> QualityUpdater:
         """
         Get the appropriate strategy for an item.
-        Returns NormalItemUpdater for unknown types (default).
+        Returns the shared NormalItemUpdater for unknown types (default).
         """
-        return self._strategies.get(item_name, NormalItemUpdater())
+        updater = self._resolved.get(item_name)
+        if updater is None:
+            updater = self._resolve(item_name)
+            self._remember(item_name, updater)
+        return updater
+    
+    def get_updater_by_id(self, name_id: int) -> QualityUpdater:
+        """
+        Get the strategy for a name interned in self.names.
+        Ids registered since the last call are resolved on demand.
+        """
+        if name_id >= len(self._updaters_by_id):
+            self._resolve_new_ids()
+        return self._updaters_by_id[name_id]
     
     def register_strategy(self, item_name: str, updater: QualityUpdater) -> None:
         """
@@ -190,6 +579,68 @@ class ItemUpdaterFactory:
         Allows runtime addition of new item types without modifying existing code.
         """
         self._strategies[item_name] = updater
+        self._forget_resolved()
+    
+    def register_prefix_strategy(self, prefix: str, updater: QualityUpdater) -> None:
+        """
+        Register a strategy for every name starting with prefix.
+        Longer prefixes win over shorter ones.
+        """
+        self._patterns.add_prefix(prefix, updater)
+        self._forget_resolved()
+    
+    def register_glob_strategy(self, pattern: str, updater: QualityUpdater) -> None:
+        """Register a strategy for names matching a shell-style pattern ("Conjured *")."""
+        self._patterns.add_glob(pattern, updater)
+        self._forget_resolved()
+    
+    def register_regex_strategy(self, pattern: str, updater: QualityUpdater) -> None:
+        """
+        Register a strategy for names fully matching a regular expression.
+        Globs and regexes are tried in registration order, before prefixes.
+        """
+        self._patterns.add_regex(pattern, updater)
+        self._forget_resolved()
+    
+    def map_strategies(self, transform: Callable[[QualityUpdater], QualityUpdater]) -> None:
+        """
+        Replace every strategy, including the default, by transform(strategy).
+        A strategy shared by several names is transformed once. Strategies
+        registered afterwards are not transformed.
+        """
+        transformed: Dict[int, QualityUpdater] = {}
+        
+        def replace(updater: QualityUpdater) -> QualityUpdater:
+            if id(updater) not in transformed:
+                transformed[id(updater)] = transform(updater)
+            return transformed[id(updater)]
+        
+        self._strategies = {name: replace(updater) for name, updater in self._strategies.items()}
+        self._patterns.map_values(replace)
+        self._default_updater = replace(self._default_updater)
+        self._forget_resolved()
+    
+    def _resolve(self, item_name: str) -> QualityUpdater:
+        """Look up the strategy for a name that is not cached yet."""
+        updater = self._strategies.get(item_name)
+        if updater is None:
+            updater = self._patterns.match(item_name)
+        return updater if updater is not None else self._default_updater
+    
+    def _resolve_new_ids(self) -> None:
+        """Extend the id-indexed strategy table to cover every interned name."""
+        new_names = self.names.names[len(self._updaters_by_id):]
+        self._updaters_by_id.extend(self._resolve(name) for name in new_names)
+    
+    def _remember(self, item_name: str, updater: QualityUpdater) -> None:
+        """Cache a resolved name; the least recently used one is evicted at the bound."""
+        self._resolved.put(item_name, updater)
+    
+    def _forget_resolved(self) -> None:
+        """Drop every cached resolution after the routing changed."""
+        self.version += 1
+        self._resolved.clear()
+        self._updaters_by_id.clear()
 
 
 class GildedRose:
@@ -205,21 +656,147 @@ class GildedRose:
     - No code duplication (shared logic in base class)
     """
     
-    def __init__(self, items: List[Item]):
+    def __init__(
+        self,
+        items: List[Item],
+        instrumentation=None,
+        index=None,
+        change_log=None,
+        updater_factory: Optional[ItemUpdaterFactory] = None,
+    ):
+        """
+        instrumentation: optional UpdateInstrumentation (see instrumentation.py).
+        When None, update_quality runs the plain loop with no extra per-item work.
+        index: optional InventoryIndex (see inventory_index.py) kept current
+        across updates for sell_in and quality range queries. It catches up
+        after each day, so it combines with instrumentation.
+        change_log: optional ChangeLog (see change_log.py) that records the
+        items whose daily change deviates from the previous day.
+        updater_factory: optional ItemUpdaterFactory to resolve strategies
+        with, e.g. one already configured or shared; a fresh one by default.
+        """
+        self.instrumentation = instrumentation
+        self.index = index
+        self.change_log = change_log
+        self._items: List[Item] = []
+        self._updaters: List[QualityUpdater] = []
+        self._bound_items: Optional[List[Item]] = None  # Rows the bindings were made for
+        self._groups: Dict[int, Tuple[QualityUpdater, List[Item]]] = {}
+        self._updater_factory = updater_factory if updater_factory is not None else ItemUpdaterFactory()
+        self._name_ids = array("i")
         self.items = items
-        self._updater_factory = ItemUpdaterFactory()
+    
+    @property
+    def items(self) -> List[Item]:
+        """Items in the inventory, each bound to its strategy."""
+        return self._items
+    
+    @items.setter
+    def items(self, items: List[Item]) -> None:
+        self._items = items
+        self._bind_updaters()
+    
+    def add_item(self, item: Item) -> None:
+        """Add an item and bind it to its strategy once."""
+        self._items.append(item)
+        name_id = self._updater_factory.names.intern(item.name)
+        self._name_ids.append(name_id)
+        self._updaters.append(self._updater_factory.get_updater_by_id(name_id))
+        # A store keeps its own row for the item; group that row, not the argument
+        self._add_to_group(self._items[-1], self._updaters[-1])
+        if self._bound_items is not None:
+            self._bound_items.append(self._items[-1])
+        if self.index is not None:
+            self.index.add(item, self._updaters[-1])
+    
+    def register_strategy(self, item_name: str, updater: QualityUpdater) -> None:
+        """
+        Register a strategy and re-bind the items affected by the new mapping.
+        Items keep their interned name ids, so only distinct names are resolved again.
+        """
+        self._updater_factory.register_strategy(item_name, updater)
+        self._bind_name_ids()
+    
+    def map_strategies(self, transform: Callable[[QualityUpdater], QualityUpdater]) -> None:
+        """
+        Replace every registered strategy by transform(strategy) and re-bind
+        the items. Strategies registered afterwards are not transformed.
+        """
+        self._updater_factory.map_strategies(transform)
+        self._bind_name_ids()
     
     def update_quality(self) -> None:
         """Update quality for all items in inventory."""
-        for item in self.items:
-            self._update_single_item(item)
+        self._ensure_bound()
+        self._run_day()
+        if self.change_log is not None:
+            self.change_log.record_day(self._items, self._updaters)
+    
+    def _run_day(self) -> None:
+        """One day through the instrumented or plain path, then the index catches up."""
+        if self.instrumentation is not None:
+            self.instrumentation.run_update(self._items, self._updaters)
+        else:
+            # Items are independent, so each strategy ages its whole group in one call
+            for updater, group in self._groups.values():
+                updater.update_batch(group)
+        if self.index is not None:
+            self.index.sync(self._items)
+    
+    def advance(self, days: int) -> None:
+        """
+        Age every item by the given number of days in a single pass.
+        Equivalent to calling update_quality() days times, but built-in
+        strategies jump straight to the final state.
+        """
+        if days < 0:
+            raise ValueError(f"days must be non-negative, got {days}")
+        self._ensure_bound()
+        for item, updater in zip(self._items, self._updaters):
+            updater.advance(item, days)
+        if self.index is not None:
+            self.index.sync(self._items, days)
+        if self.change_log is not None:
+            self.change_log.checkpoint(self._items, self._updaters, days)
+    
+    def _bind_updaters(self) -> None:
+        """
+        Intern each item's name and keep the ids in a parallel array.
+        An item's name never changes, so the binding stays valid across days.
+        """
+        intern = self._updater_factory.names.intern
+        self._name_ids = array("i", [intern(item.name) for item in self._items])
+        # Only list slots can be replaced in place; a store's rows are fixed
+        self._bound_items = list(self._items) if isinstance(self._items, list) else None
+        self._bind_name_ids()
+        if self.change_log is not None:
+            self.change_log.checkpoint(self._items, self._updaters)
+    
+    def _bind_name_ids(self) -> None:
+        """Resolve each item's strategy from its name id (list indexing only)."""
+        get_updater_by_id = self._updater_factory.get_updater_by_id
+        self._updaters = [get_updater_by_id(name_id) for name_id in self._name_ids]
+        self._groups = {}
+        for item, updater in zip(self._items, self._updaters):
+            self._add_to_group(item, updater)
+        if self.index is not None:
+            self.index.rebuild(self._items, self._updaters)
+    
+    def _add_to_group(self, item: Item, updater: QualityUpdater) -> None:
+        """File an item under its strategy for update_batch()."""
+        group = self._groups.get(id(updater))
+        if group is None:
+            group = self._groups[id(updater)] = (updater, [])
+        group[1].append(item)
     
-    def _update_single_item(self, item: Item) -> None:
+    def _ensure_bound(self) -> None:
         """
-        Update a single item using the appropriate strategy.
-        Delegates to the strategy pattern for type-specific logic.
-        Note: First update quality, then update sell_in (which may apply post-expiration logic).
+        Pick up items appended, removed or replaced in the list directly
+        instead of via add_item. Replacements are found by an identity
+        comparison with the bound rows, which runs at C speed.
         """
-        updater = self._updater_factory.get_updater(item.name)
-        updater.update_quality(item)
-        updater.update_sell_in(item)
+        items = self._items
+        if len(self._updaters) != len(items):
+            self._bind_updaters()
+        elif self._bound_items is not None and any(map(is_not, self._bound_items, items)):
+            self._bind_updaters()
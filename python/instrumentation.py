@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Optional instrumentation for GildedRose.update_quality.
+GildedRose checks once per call whether instrumentation is attached and,
+if so, hands the day over to UpdateInstrumentation.run_update(); the
+default path is untouched and costs nothing extra per item.
+
+Collected per strategy: items processed, clamps hit, expirations and
+backstage drops, plus the wall time of every update_quality call.
+Hooks receive an UpdateReport after each call for export to metrics.
+"""
+
+import copy
+import time
+from typing import Callable, Dict, List
+
+from gilded_rose import BackstagePassUpdater, Item, QualityUpdater
+
+
+class StrategyCounters:
+    """Event counters for one strategy."""
+
+    __slots__ = ("processed", "clamps", "expirations", "backstage_drops")
+
+    def __init__(self):
+        self.processed = 0        # Items updated
+        self.clamps = 0           # clamp_quality calls that changed the value
+        self.expirations = 0      # Items whose sell_in crossed below 0
+        self.backstage_drops = 0  # Backstage passes that lost their value at the concert
+
+    def add(self, other: "StrategyCounters") -> None:
+        for field in self.__slots__:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+
+    def as_dict(self) -> Dict[str, int]:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"StrategyCounters({self.as_dict()})"
+
+
+class UpdateReport:
+    """Outcome of one instrumented update_quality call."""
+
+    def __init__(self, duration: float, items: int, counters: Dict[str, StrategyCounters]):
+        self.duration = duration  # Seconds
+        self.items = items
+        self.counters = counters  # Strategy class name -> counters for this call
+
+
+UpdateHook = Callable[[UpdateReport], None]
+
+
+class UpdateInstrumentation:
+    """
+    Collects counters and timings for GildedRose.update_quality.
+
+    Usage:
+        instrumentation = UpdateInstrumentation()
+        instrumentation.add_hook(lambda report: export(report.duration))
+        GildedRose(items, instrumentation=instrumentation).update_quality()
+    """
+
+    def __init__(self):
+        self.counters: Dict[str, StrategyCounters] = {}  # Cumulative, by strategy class name
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.last_report = None
+        self._hooks: List[UpdateHook] = []
+        self._counting_twins = {}  # id(updater) -> (updater, twin)
+        self._active_counters = StrategyCounters()
+
+    def add_hook(self, hook: UpdateHook) -> None:
+        """Call hook with an UpdateReport after every update_quality."""
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: UpdateHook) -> None:
+        self._hooks.remove(hook)
+
+    def run_update(self, items: List[Item], updaters: List[QualityUpdater]) -> UpdateReport:
+        """
+        Apply one day to (item, updater) pairs while counting events.
+        Produces exactly the same item states as the uninstrumented loop.
+        """
+        call_counters: Dict[str, StrategyCounters] = {}
+        start = time.perf_counter()
+        for item, updater in zip(items, updaters):
+            strategy_name = type(updater).__name__
+            counters = call_counters.get(strategy_name)
+            if counters is None:
+                counters = call_counters[strategy_name] = StrategyCounters()
+            self._active_counters = counters
+            twin = self._counting_twin(updater)
+
+            sell_in_before = item.sell_in
+            quality_before = item.quality
+            twin.update_quality(item)
+            twin.update_sell_in(item)
+
+            counters.processed += 1
+            if item.sell_in < 0 <= sell_in_before:
+                counters.expirations += 1
+            if (isinstance(updater, BackstagePassUpdater) and item.sell_in < 0
+                    and quality_before > item.quality == updater.MINIMUM_QUALITY):
+                counters.backstage_drops += 1
+        duration = time.perf_counter() - start
+
+        report = UpdateReport(duration, len(items), call_counters)
+        self._record(report)
+        return report
+
+    def _counting_twin(self, updater: QualityUpdater) -> QualityUpdater:
+        """
+        Return a copy of updater whose clamp_quality also counts the clamps
+        that changed a value. Strategies are stateless, so a twin behaves
+        exactly like the original; it is built once per strategy instance.
+        """
+        entry = self._counting_twins.get(id(updater))
+        if entry is None:
+            twin = copy.copy(updater)
+            clamp_quality = updater.clamp_quality
+
+            def counting_clamp_quality(quality: int) -> int:
+                clamped = clamp_quality(quality)
+                if clamped != quality:
+                    self._active_counters.clamps += 1
+                return clamped
+
+            twin.clamp_quality = counting_clamp_quality
+            # Keep the original alive so its id cannot be reused by another object
+            entry = self._counting_twins[id(updater)] = (updater, twin)
+        return entry[1]
+
+    def _record(self, report: UpdateReport) -> None:
+        self.calls += 1
+        self.total_seconds += report.duration
+        self.last_report = report
+        for name, counters in report.counters.items():
+            self.counters.setdefault(name, StrategyCounters()).add(counters)
+        for hook in self._hooks:
+            hook(report)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Little-endian int32 columns as stored by the on-disk formats
+(inventory_snapshot.py, change_log.py), converted to and from array('i').
+"""
+
+import sys
+from array import array
+
+
+COLUMN_ITEM_SIZE = 4
+NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def to_ints(section: memoryview, copy: bool):
+    """View (or copy of) a little-endian int32 section."""
+    if not copy:
+        return section.cast("i")
+    values = array("i")
+    values.frombytes(section)
+    if not NATIVE_LITTLE_ENDIAN:
+        values.byteswap()
+    return values
+
+
+def to_bytes(values: array) -> bytes:
+    """Little-endian bytes of an int32 array."""
+    if NATIVE_LITTLE_ENDIAN:
+        return values.tobytes()
+    swapped = array("i", values)
+    swapped.byteswap()
+    return swapped.tobytes()
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+Secondary index over an inventory by sell_in and quality ranges.
+Answers questions such as "which items expire within 3 days" or "which
+items are below quality 10" without scanning every item.
+
+Every aging item loses exactly one sell_in per day, so the index keys it
+by its sell-by day (sell_in + days elapsed), which does not change from
+one day to the next. After the items are aged, sync() recomputes the
+keys as one column and compares it with the indexed one, so only items
+whose sell_in did not move by exactly one a day are re-keyed.
+
+Most qualities change every day, so quality is not bucketed per item:
+the first quality query after a day re-sorts the positions by quality.
+The previous order is nearly sorted already, which makes that sort cheap.
+
+Usage:
+    index = InventoryIndex()
+    gilded_rose = GildedRose(items, index=index)
+    gilded_rose.update_quality()
+    index.query(sell_in_max=3)
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import compress, count
+from operator import ne
+from typing import Dict, Iterator, List, Optional, Sequence, Set
+
+from gilded_rose import Item, QualityUpdater
+
+
+class BucketIndex:
+    """Integer keys mapped to sets of positions, with sorted keys for range scans."""
+
+    def __init__(self):
+        self._buckets: Dict[int, Set[int]] = {}
+        self._keys: List[int] = []
+
+    def add(self, key: int, position: int) -> None:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = set()
+            insort(self._keys, key)
+        bucket.add(position)
+
+    def remove(self, key: int, position: int) -> None:
+        bucket = self._buckets[key]
+        bucket.discard(position)
+        if not bucket:
+            del self._buckets[key]
+            del self._keys[bisect_left(self._keys, key)]
+
+    def move(self, old_key: int, new_key: int, position: int) -> None:
+        self.remove(old_key, position)
+        self.add(new_key, position)
+
+    def in_range(self, low: Optional[int], high: Optional[int]) -> Iterator[int]:
+        """Positions whose key lies in [low, high]; None means unbounded."""
+        keys = self._keys
+        start = 0 if low is None else bisect_left(keys, low)
+        stop = len(keys) if high is None else bisect_right(keys, high)
+        for key in keys[start:stop]:
+            yield from self._buckets[key]
+
+
+class CategoryIndex:
+    """Indexes of one strategy category."""
+
+    def __init__(self):
+        self.sell_by = BucketIndex()        # Aging items, keyed by sell_in + day
+        self.fixed_sell_in = BucketIndex()  # Frozen items (Sulfuras), keyed by sell_in
+
+
+class InventoryIndex:
+    """
+    Range index over sell_in and quality, per strategy category.
+    GildedRose keeps it current: it calls sync() after aging the items and
+    rebuild() when items or strategies are re-bound.
+    """
+
+    def __init__(self):
+        self.day = 0
+        self._items: List[Item] = []
+        self._categories: Dict[str, CategoryIndex] = {}
+        self._category_of: List[CategoryIndex] = []
+        self._aging: List[int] = []  # 1 for items keyed by sell-by day, 0 for frozen ones
+        self._keys: List[int] = []   # Indexed sell-by day, or sell_in of frozen items
+        self._quality_order: List[int] = []  # Positions by quality, once sorted
+        self._sorted_qualities: Optional[List[int]] = None  # None when the order is stale
+
+    def rebuild(self, items: List[Item], updaters: List[QualityUpdater]) -> None:
+        """Index every item from scratch."""
+        self.day = 0
+        self._items = items
+        self._categories = {}
+        self._category_of = []
+        self._aging, self._keys = [], []
+        self._quality_order = []
+        self._sorted_qualities = None
+        for item, updater in zip(items, updaters):
+            self.add(item, updater)
+
+    def add(self, item: Item, updater: QualityUpdater) -> None:
+        """Index an item appended at the end of the inventory."""
+        position = len(self._category_of)
+        name = type(updater).__name__
+        category = self._categories.get(name)
+        if category is None:
+            category = self._categories[name] = CategoryIndex()
+        aging = 0 if updater.is_frozen(item) else 1
+        key = item.sell_in + self.day * aging
+        self._category_of.append(category)
+        self._aging.append(aging)
+        self._keys.append(key)
+        self._quality_order.append(position)
+        self._sorted_qualities = None
+        (category.sell_by if aging else category.fixed_sell_in).add(key, position)
+
+    def sync(self, items: Sequence[Item], days: int = 1) -> None:
+        """
+        Catch up with items that were aged by days since the last sync:
+        re-key the items whose sell-by day moved and mark the quality
+        order stale.
+        """
+        day = self.day + days
+        keys = [item.sell_in + day * aging for item, aging in zip(items, self._aging)]
+        if keys != self._keys:
+            category_of, aging = self._category_of, self._aging
+            changed = list(compress(count(), map(ne, keys, self._keys)))
+            for position, old, new in zip(
+                changed, map(self._keys.__getitem__, changed), map(keys.__getitem__, changed)
+            ):
+                category = category_of[position]
+                (category.sell_by if aging[position] else category.fixed_sell_in).move(old, new, position)
+            self._keys = keys
+        self._sorted_qualities = None
+        self.day = day
+
+    def query(
+        self,
+        sell_in_min: Optional[int] = None,
+        sell_in_max: Optional[int] = None,
+        quality_min: Optional[int] = None,
+        quality_max: Optional[int] = None,
+        category: Optional[str] = None,
+    ) -> List[Item]:
+        """
+        Items whose sell_in and quality lie within the given inclusive
+        ranges (None = unbounded), optionally limited to one strategy
+        category such as "BackstagePassUpdater". Returned in inventory order.
+        """
+        if category is None:
+            categories = list(self._categories.values())
+        else:
+            categories = [self._categories[category]] if category in self._categories else []
+        if sell_in_min is None and sell_in_max is None:
+            positions = self._quality_range(quality_min, quality_max)
+            if category is not None:
+                category_of = self._category_of
+                positions = [position for position in positions if category_of[position] in categories]
+            return [self._items[position] for position in sorted(positions)]
+        found = set()
+        for index in categories:
+            found.update(self._sell_in_range(index, sell_in_min, sell_in_max))
+        items = [self._items[position] for position in sorted(found)]
+        if quality_min is not None or quality_max is not None:
+            items = [item for item in items if _within(item.quality, quality_min, quality_max)]
+        return items
+
+    def expiring_within(self, days: int, category: Optional[str] = None) -> List[Item]:
+        """Items not yet expired whose sell_in is at most days."""
+        return self.query(sell_in_min=0, sell_in_max=days, category=category)
+
+    def below_quality(self, quality: int, category: Optional[str] = None) -> List[Item]:
+        """Items with quality strictly below the given value."""
+        return self.query(quality_max=quality - 1, category=category)
+
+    def _quality_range(self, low: Optional[int], high: Optional[int]) -> List[int]:
+        """Positions whose quality lies in [low, high], re-sorting them first if stale."""
+        if self._sorted_qualities is None:
+            qualities = [item.quality for item in self._items]
+            self._quality_order.sort(key=qualities.__getitem__)
+            self._sorted_qualities = list(map(qualities.__getitem__, self._quality_order))
+        sorted_qualities = self._sorted_qualities
+        start = 0 if low is None else bisect_left(sorted_qualities, low)
+        stop = len(sorted_qualities) if high is None else bisect_right(sorted_qualities, high)
+        return self._quality_order[start:stop]
+
+    def _sell_in_range(
+        self, index: CategoryIndex, low: Optional[int], high: Optional[int]
+    ) -> Iterator[int]:
+        day = self.day
+        yield from index.sell_by.in_range(
+            None if low is None else low + day, None if high is None else high + day
+        )
+        yield from index.fixed_sell_in.in_range(low, high)
+
+
+def _within(value: int, low: Optional[int], high: Optional[int]) -> bool:
+    return (low is None or value >= low) and (high is None or value <= high)
@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+"""
+Asyncio service holding named inventories in memory.
+
+Concurrent requests for one inventory are queued and handled as a batch:
+consecutive updates are merged into a single GildedRose.advance() call,
+and queries are answered from the state at their place in the queue.
+Batches above offload_threshold item-days run in an executor so the event
+loop keeps serving other connections. Only one batch per inventory is in
+flight at a time, so GildedRose is never used from two threads at once.
+Thread pools age the inventory in place; any other executor (e.g. a
+ProcessPoolExecutor) gets a pickled copy and sends back the new sell_in
+and quality of every item, which the loop applies to the original.
+
+The JSON Lines server speaks one request per line, e.g.
+    {"op": "create", "inventory": "main", "items": [["Aged Brie", 2, 0]]}
+    {"op": "update", "inventory": "main", "days": 1}
+    {"op": "query", "inventory": "main"}
+    {"op": "stats"}
+and answers {"ok": true, ...} or {"ok": false, "error": "..."} per line.
+
+Usage:
+    python inventory_service.py --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from bisect import bisect_left
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from gilded_rose import GildedRose, Item
+
+
+DEFAULT_BATCH_WINDOW = 0.001       # Seconds to wait for more requests before a batch runs
+DEFAULT_OFFLOAD_THRESHOLD = 50_000  # Item-days above which a batch leaves the event loop
+
+# Upper bounds of the latency buckets in milliseconds; the last bucket is open
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+Operation = Tuple[str, Any]  # ("update", days) or ("query", None)
+
+
+class LatencyHistogram:
+    """Request latencies counted in fixed millisecond buckets."""
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS_MS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total_seconds = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect_left(self.bounds, seconds * 1000)] += 1
+        self.count += 1
+        self.total_seconds += seconds
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound (ms) of the bucket holding the given fraction of requests."""
+        if not self.count:
+            return 0.0
+        threshold = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= threshold:
+                return bound
+        return float("inf")
+
+    def as_dict(self) -> Dict[str, Any]:
+        labels = [f"<={bound}ms" for bound in self.bounds] + [f">{self.bounds[-1]}ms"]
+        return {
+            "count": self.count,
+            "mean_ms": self.total_seconds * 1000 / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p99_ms": self.percentile(0.99),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class _Inventory:
+    """One named inventory and its queue of pending requests."""
+
+    def __init__(self, items: List[Item]):
+        self.gilded_rose = GildedRose(items)
+        self.day = 0
+        self.pending: List[Tuple[Operation, asyncio.Future]] = []
+        self.drainer: Optional[asyncio.Task] = None
+
+
+class InventoryService:
+    """
+    In-memory inventories with batched, non-blocking updates.
+
+    executor: where heavy batches run (None = the loop's default thread pool);
+    process pools need picklable strategies.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+        offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+    ):
+        self.executor = executor
+        self.batch_window = batch_window
+        self.offload_threshold = offload_threshold
+        self.latency: Dict[str, LatencyHistogram] = {
+            "update": LatencyHistogram(),
+            "query": LatencyHistogram(),
+            "batch": LatencyHistogram(),
+        }
+        self.batches = 0
+        self.batched_requests = 0
+        self._inventories: Dict[str, _Inventory] = {}
+
+    def create(self, name: str, items: List[Item]) -> None:
+        if name in self._inventories:
+            raise ValueError(f"Inventory {name!r} already exists")
+        self._inventories[name] = _Inventory(items)
+
+    def names(self) -> List[str]:
+        return sorted(self._inventories)
+
+    async def update(self, name: str, days: int = 1) -> int:
+        """Age inventory name by days; returns its day count after this request."""
+        if days < 0:
+            raise ValueError(f"days must be non-negative, got {days}")
+        return await self._submit(name, ("update", days))
+
+    async def query(self, name: str) -> Tuple[int, List[Tuple[str, int, int]]]:
+        """(day, [(name, sell_in, quality), ...]) at this request's place in the queue."""
+        return await self._submit(name, ("query", None))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "inventories": len(self._inventories),
+            "batches": self.batches,
+            "batched_requests": self.batched_requests,
+            "latency": {name: histogram.as_dict() for name, histogram in self.latency.items()},
+        }
+
+    async def _submit(self, name: str, operation: Operation) -> Any:
+        inventory = self._inventories.get(name)
+        if inventory is None:
+            raise KeyError(f"Unknown inventory {name!r}")
+        start = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        inventory.pending.append((operation, future))
+        if inventory.drainer is None:
+            inventory.drainer = asyncio.ensure_future(self._drain(inventory))
+        try:
+            return await future
+        finally:
+            self.latency[operation[0]].record(time.perf_counter() - start)
+
+    async def _drain(self, inventory: _Inventory) -> None:
+        """Run batches for one inventory until its queue is empty."""
+        try:
+            await asyncio.sleep(self.batch_window)
+            while inventory.pending:
+                batch, inventory.pending = inventory.pending, []
+                await self._run_batch(inventory, batch)
+        finally:
+            inventory.drainer = None
+
+    async def _run_batch(
+        self, inventory: _Inventory, batch: List[Tuple[Operation, asyncio.Future]]
+    ) -> None:
+        operations = [operation for operation, _ in batch]
+        days = sum(argument for kind, argument in operations if kind == "update")
+        start = time.perf_counter()
+        try:
+            if days * len(inventory.gilded_rose.items) > self.offload_threshold:
+                results = await self._run_in_executor(inventory, operations)
+            else:
+                results = run_batch(inventory.gilded_rose, inventory.day, operations)
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        finally:
+            self.latency["batch"].record(time.perf_counter() - start)
+            self.batches += 1
+            self.batched_requests += len(batch)
+        inventory.day += days
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _run_in_executor(self, inventory: _Inventory, operations: List[Operation]) -> List[Any]:
+        """Thread pools age the inventory in place; other executors age a copy."""
+        loop = asyncio.get_running_loop()
+        if self.executor is None or isinstance(self.executor, ThreadPoolExecutor):
+            return await loop.run_in_executor(
+                self.executor, run_batch, inventory.gilded_rose, inventory.day, operations
+            )
+        results, states = await loop.run_in_executor(
+            self.executor, run_batch_detached, inventory.gilded_rose, inventory.day, operations
+        )
+        for item, (sell_in, quality) in zip(inventory.gilded_rose.items, states):
+            item.sell_in, item.quality = sell_in, quality
+        return results
+
+
+def run_batch(gilded_rose: GildedRose, day: int, operations: List[Operation]) -> List[Any]:
+    """
+    Apply operations in order, merging runs of updates into one advance().
+    Returns one result per operation: the day after an update, or
+    (day, rows) for a query.
+    """
+    results: List[Any] = []
+    unapplied_days = 0
+    for kind, argument in operations:
+        if kind == "update":
+            unapplied_days += argument
+            results.append(day + unapplied_days)
+            continue
+        if unapplied_days:
+            gilded_rose.advance(unapplied_days)
+            day += unapplied_days
+            unapplied_days = 0
+        rows = [(item.name, item.sell_in, item.quality) for item in gilded_rose.items]
+        results.append((day, rows))
+    if unapplied_days:
+        gilded_rose.advance(unapplied_days)
+    return results
+
+
+def run_batch_detached(
+    gilded_rose: GildedRose, day: int, operations: List[Operation]
+) -> Tuple[List[Any], List[Tuple[int, int]]]:
+    """
+    run_batch() on a copy of the inventory, e.g. in another process.
+    Also returns the final (sell_in, quality) of every item, in order.
+    """
+    results = run_batch(gilded_rose, day, operations)
+    return results, [(item.sell_in, item.quality) for item in gilded_rose.items]
+
+
+async def handle_connection(
+    service: InventoryService, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    """Answer JSON Lines requests on one connection, in order."""
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            writer.write(json.dumps(await _respond(service, line)).encode("utf-8") + b"\n")
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+async def _respond(service: InventoryService, line: bytes) -> Dict[str, Any]:
+    try:
+        request = json.loads(line)
+        operation = request["op"]
+        if operation == "create":
+            items = [Item(name, int(sell_in), int(quality))
+                     for name, sell_in, quality in request["items"]]
+            service.create(request["inventory"], items)
+            return {"ok": True}
+        if operation == "update":
+            day = await service.update(request["inventory"], int(request.get("days", 1)))
+            return {"ok": True, "day": day}
+        if operation == "query":
+            day, rows = await service.query(request["inventory"])
+            return {"ok": True, "day": day, "items": rows}
+        if operation == "stats":
+            return {"ok": True, "stats": service.stats()}
+        raise ValueError(f"Unknown op {operation!r}")
+    except (KeyError, TypeError, ValueError) as error:
+        return {"ok": False, "error": str(error)}
+
+
+async def start_server(
+    service: InventoryService, host: str = "127.0.0.1", port: int = 0
+) -> asyncio.AbstractServer:
+    """Start serving; port 0 picks a free port (see server.sockets)."""
+    return await asyncio.start_server(
+        lambda reader, writer: handle_connection(service, reader, writer), host, port
+    )
+
+
+async def _serve(host: str, port: int) -> None:
+    server = await start_server(InventoryService(), host, port)
+    address = server.sockets[0].getsockname()
+    print(f"Serving inventories on {address[0]}:{address[1]}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve in-memory inventories over JSON Lines.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    arguments = parser.parse_args(argv)
+    asyncio.run(_serve(arguments.host, arguments.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Compact binary snapshots of an inventory.
+
+Layout (little-endian, every section 4-byte aligned):
+    header        magic, version, flags, item count, name count,
+                  string table size, day
+    name lengths  int32 per distinct name
+    string table  UTF-8 names, concatenated
+    name_ids      int32 per item
+    sell_in       int32 per item
+    quality       int32 per item
+    spare sell_in int32 per item, optional
+    spare quality int32 per item, optional
+
+With COMPRESSED set, everything after the header is zlib-compressed.
+The spare pair is added by MappedInventory, which writes each day there
+and then flips SPARE_SLOT; with the flag set the spare pair holds the
+current sell_in and quality.
+Uncompressed snapshots are loaded by memory-mapping the file: the columns
+are used in place by an ItemStore, so no Item objects are rebuilt.
+
+Usage:
+    save_snapshot(gilded_rose.items, "inventory.grs")
+    gilded_rose = GildedRose(load_snapshot("inventory.grs"))
+"""
+
+import mmap
+import struct
+import zlib
+from array import array
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from gilded_rose import Item, NameRegistry
+from int_columns import COLUMN_ITEM_SIZE, NATIVE_LITTLE_ENDIAN, to_bytes, to_ints
+from item_store import ItemStore
+
+
+MAGIC = b"GRSN"
+VERSION = 1
+COMPRESSED = 0x1
+SPARE_SLOT = 0x4
+
+HEADER = struct.Struct("<4sHHIIIi")
+
+
+class SnapshotHeader(NamedTuple):
+    version: int
+    flags: int
+    count: int
+    name_count: int
+    string_table_size: int
+    day: int
+
+    @property
+    def compressed(self) -> bool:
+        return bool(self.flags & COMPRESSED)
+
+    @property
+    def slot(self) -> int:
+        """0 when sell_in and quality are the main columns, 1 for the spare pair."""
+        return 1 if self.flags & SPARE_SLOT else 0
+
+
+def save_snapshot(items: Iterable[Item], path: str, compress: bool = False, day: int = 0) -> None:
+    """Write items to path; an ItemStore's columns are written without conversion."""
+    names, name_ids, sell_in, quality = _columns(items)
+    encoded_names = [name.encode("utf-8") for name in names]
+    string_table = b"".join(encoded_names)
+    body = b"".join([
+        to_bytes(array("i", [len(name) for name in encoded_names])),
+        _pad(string_table),
+        to_bytes(name_ids),
+        to_bytes(sell_in),
+        to_bytes(quality),
+    ])
+    flags = COMPRESSED if compress else 0
+    if compress:
+        body = zlib.compress(body)
+    header = HEADER.pack(
+        MAGIC, VERSION, flags, len(name_ids), len(names), len(string_table), day
+    )
+    with open(path, "wb") as handle:
+        handle.write(header)
+        handle.write(body)
+
+
+def read_snapshot_header(path: str) -> SnapshotHeader:
+    with open(path, "rb") as handle:
+        return parse_header(handle.read(HEADER.size))
+
+
+def load_snapshot(path: str) -> ItemStore:
+    """
+    Load a snapshot as an ItemStore.
+    Uncompressed files are memory-mapped copy-on-write: changes made
+    through the store stay private to this process and never reach the file.
+    Appending rows copies the columns out of the mapping first.
+    """
+    header = read_snapshot_header(path)
+    if header.compressed or not NATIVE_LITTLE_ENDIAN:
+        with open(path, "rb") as handle:
+            handle.seek(HEADER.size)
+            body = handle.read()
+        if header.compressed:
+            body = zlib.decompress(body)
+        return store_from_body(header, memoryview(body), copy=True)
+    with open(path, "rb") as handle:
+        mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_COPY)
+    return store_from_body(header, memoryview(mapping)[HEADER.size:], copy=False, growable=True)
+
+
+def _columns(items: Iterable[Item]) -> Tuple[List[str], array, array, array]:
+    """Names, name ids, sell_in and quality as int32 columns."""
+    if isinstance(items, ItemStore):
+        return (
+            items.names.names,
+            array("i", items.name_ids),
+            array("i", items.sell_in),
+            array("i", items.quality),
+        )
+    registry = NameRegistry()
+    name_ids, sell_in, quality = array("i"), array("i"), array("i")
+    for item in items:
+        name_ids.append(registry.intern(item.name))
+        sell_in.append(item.sell_in)
+        quality.append(item.quality)
+    return registry.names, name_ids, sell_in, quality
+
+
+def parse_header(data: bytes) -> SnapshotHeader:
+    """Validate and decode the fixed-size header at the start of a snapshot."""
+    if len(data) < HEADER.size:
+        raise ValueError("Not an inventory snapshot: file too short")
+    magic, version, flags, count, name_count, string_table_size, day = HEADER.unpack(data)
+    if magic != MAGIC:
+        raise ValueError("Not an inventory snapshot: bad magic number")
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+    return SnapshotHeader(version, flags, count, name_count, string_table_size, day)
+
+
+def store_from_body(
+    header: SnapshotHeader,
+    body: memoryview,
+    copy: bool,
+    growable: bool = False,
+    slot: Optional[int] = None,
+) -> ItemStore:
+    """
+    Slice the sections out of body (everything after the header). With
+    copy=False the int32 columns are memoryviews straight over body (the
+    mapped file); growable is passed to ItemStore.from_buffers. slot picks
+    the sell_in/quality pair and defaults to the one the header names.
+    """
+    lengths_size = header.name_count * COLUMN_ITEM_SIZE
+    name_lengths = to_ints(body[:lengths_size], copy=True)
+    string_table = bytes(body[_aligned(lengths_size):_aligned(lengths_size) + header.string_table_size])
+    registry = NameRegistry()
+    start = 0
+    for length in name_lengths:
+        registry.intern(string_table[start:start + length].decode("utf-8"))
+        start += length
+
+    if slot is None:
+        slot = header.slot
+    name_ids = to_ints(_column(header, body, 0), copy)
+    sell_in = to_ints(_column(header, body, 1 + 2 * slot), copy)
+    quality = to_ints(_column(header, body, 2 + 2 * slot), copy)
+    return ItemStore.from_buffers(registry, name_ids, sell_in, quality, growable)
+
+
+def column_offset(header: SnapshotHeader, column: int) -> int:
+    """
+    Offset in the body of an int32 column: 0 is name_ids, 1 and 2 are
+    sell_in and quality, 3 and 4 the spare pair. column_offset(header, 5)
+    is the size of a body that has the spare pair.
+    """
+    names_size = _aligned(header.name_count * COLUMN_ITEM_SIZE) + _aligned(header.string_table_size)
+    return names_size + column * header.count * COLUMN_ITEM_SIZE
+
+
+def _column(header: SnapshotHeader, body: memoryview, column: int) -> memoryview:
+    offset = column_offset(header, column)
+    section = body[offset:offset + header.count * COLUMN_ITEM_SIZE]
+    if len(section) != header.count * COLUMN_ITEM_SIZE:
+        raise ValueError("Truncated inventory snapshot")
+    return section
+
+
+def _aligned(size: int) -> int:
+    return (size + COLUMN_ITEM_SIZE - 1) // COLUMN_ITEM_SIZE * COLUMN_ITEM_SIZE
+
+
+def _pad(data: bytes) -> bytes:
+    return data + b"\0" * (_aligned(len(data)) - len(data))
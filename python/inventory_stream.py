@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming inventory pipeline.
+Ages items one at a time as they flow from a reader to a writer, so an
+export of any size is processed in constant memory. Supports CSV and
+JSON Lines files with the columns name, sell_in and quality.
+
+Usage:
+    python inventory_stream.py inventory.csv aged.csv --days 30
+"""
+
+import argparse
+import csv
+import json
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, TextIO
+
+from gilded_rose import Item, ItemUpdaterFactory
+
+
+FIELDNAMES = ["name", "sell_in", "quality"]
+DEFAULT_CHUNK_SIZE = 10_000  # Rows handed to the writer per call
+
+
+def update_stream(
+    items: Iterable[Item],
+    days: int = 1,
+    updater_factory: Optional[ItemUpdaterFactory] = None,
+) -> Iterator[Item]:
+    """
+    Age each item by days as it passes through, yielding it afterwards.
+    Nothing is buffered: one item is in flight at a time.
+    """
+    if days < 0:
+        raise ValueError(f"days must be non-negative, got {days}")
+    get_updater = (updater_factory or ItemUpdaterFactory()).get_updater
+    for item in items:
+        get_updater(item.name).advance(item, days)
+        yield item
+
+
+def read_csv(source: TextIO) -> Iterator[Item]:
+    """Lazily parse items from a CSV file with a name,sell_in,quality header."""
+    for row in csv.DictReader(source):
+        yield Item(row["name"], int(row["sell_in"]), int(row["quality"]))
+
+
+def write_csv(
+    items: Iterable[Item], target: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """Write items as CSV in chunks; returns the number of rows written."""
+    writer = csv.writer(target, lineterminator="\n")
+    writer.writerow(FIELDNAMES)
+    written = 0
+    for chunk in _chunked(items, chunk_size):
+        writer.writerows((item.name, item.sell_in, item.quality) for item in chunk)
+        written += len(chunk)
+    return written
+
+
+def read_jsonl(source: TextIO) -> Iterator[Item]:
+    """Lazily parse items from JSON Lines, skipping blank lines."""
+    for line in source:
+        if line.strip():
+            record = json.loads(line)
+            yield Item(record["name"], int(record["sell_in"]), int(record["quality"]))
+
+
+def write_jsonl(
+    items: Iterable[Item], target: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """Write items as JSON Lines in chunks; returns the number of rows written."""
+    written = 0
+    for chunk in _chunked(items, chunk_size):
+        target.write("".join(
+            json.dumps({"name": item.name, "sell_in": item.sell_in, "quality": item.quality})
+            + "\n"
+            for item in chunk
+        ))
+        written += len(chunk)
+    return written
+
+
+READERS = {".csv": read_csv, ".jsonl": read_jsonl}
+WRITERS = {".csv": write_csv, ".jsonl": write_jsonl}
+
+
+def age_file(source_path: str, target_path: str, days: int) -> int:
+    """Stream source_path through update_stream into target_path."""
+    reader = READERS[_extension(source_path)]
+    writer = WRITERS[_extension(target_path)]
+    with open(source_path, newline="", encoding="utf-8") as source, \
+            open(target_path, "w", newline="", encoding="utf-8") as target:
+        return writer(update_stream(reader(source), days), target)
+
+
+def _chunked(items: Iterable[Item], chunk_size: int) -> Iterator[List[Item]]:
+    """Group an iterable into lists of at most chunk_size items."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _extension(path: str) -> str:
+    """Return the supported file extension of path."""
+    for extension in READERS:
+        if path.endswith(extension):
+            return extension
+    raise ValueError(f"Unsupported inventory format: {path} (expected .csv or .jsonl)")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Age an inventory file by N days.")
+    parser.add_argument("source", help="input .csv or .jsonl file")
+    parser.add_argument("target", help="output .csv or .jsonl file")
+    parser.add_argument("--days", type=int, default=1, help="days to age (default: 1)")
+    arguments = parser.parse_args(argv)
+    written = age_file(arguments.source, arguments.target, arguments.days)
+    print(f"Aged {written} items by {arguments.days} days")
+
+
+if __name__ == "__main__":
+    main()
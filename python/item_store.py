@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Array-backed item storage for very large inventories.
+Names are interned in a string table and sell_in/quality live in
+array('i') buffers; callers get lightweight item views that read and
+write through to the buffers, so GildedRose works on a store unchanged.
+"""
+
+from array import array
+from typing import Iterable, Iterator, List, MutableSequence, Sequence
+
+from gilded_rose import Item, NameRegistry
+
+
+class StoredItem:
+    """
+    View of one row of an ItemStore.
+    Exposes the Item interface (name, sell_in, quality, repr) without
+    holding any item data itself.
+    """
+    
+    __slots__ = ("_store", "_index")
+    
+    def __init__(self, store: "ItemStore", index: int):
+        self._store = store
+        self._index = index
+    
+    @property
+    def name(self) -> str:
+        return self._store._name_table.name_of(self._store._name_ids[self._index])
+    
+    @property
+    def sell_in(self) -> int:
+        return self._store._sell_in[self._index]
+    
+    @sell_in.setter
+    def sell_in(self, value: int) -> None:
+        self._store._sell_in[self._index] = value
+    
+    @property
+    def quality(self) -> int:
+        return self._store._quality[self._index]
+    
+    @quality.setter
+    def quality(self, value: int) -> None:
+        self._store._quality[self._index] = value
+    
+    def __repr__(self) -> str:
+        return f"{self.name}, {self.sell_in}, {self.quality}"
+
+
+class ItemStore:
+    """
+    Columnar, list-like container of items.
+    
+    - Each distinct name is stored once in a NameRegistry string table
+    - name ids, sell_in and quality are packed 32-bit integer buffers
+    - Indexing and iteration hand out StoredItem views
+    """
+    
+    def __init__(self):
+        self._name_table = NameRegistry()
+        self._name_ids = array("i")
+        self._sell_in = array("i")
+        self._quality = array("i")
+        self._growable = True  # False while wrapping buffers that must not be detached
+    
+    @classmethod
+    def from_items(cls, items: Iterable[Item]) -> "ItemStore":
+        """Copy existing Item objects into a new store."""
+        store = cls()
+        for item in items:
+            store.append(item)
+        return store
+    
+    @classmethod
+    def from_buffers(
+        cls,
+        names: NameRegistry,
+        name_ids: Sequence[int],
+        sell_in: MutableSequence[int],
+        quality: MutableSequence[int],
+        growable: bool = False,
+    ) -> "ItemStore":
+        """
+        Wrap existing 32-bit integer buffers without copying them, e.g.
+        memoryviews over shared memory or a memory-mapped file.
+        Views write straight into the buffers. Such a store has a fixed
+        size unless growable is True, in which case the first append copies
+        the columns into arrays and detaches the store from the buffers.
+        """
+        if not len(name_ids) == len(sell_in) == len(quality):
+            raise ValueError("All columns must have the same length")
+        store = cls()
+        store._name_table = names
+        store._name_ids = name_ids
+        store._sell_in = sell_in
+        store._quality = quality
+        store._growable = growable
+        return store
+    
+    def add(self, name: str, sell_in: int, quality: int) -> StoredItem:
+        """Append a row and return its view."""
+        if not isinstance(self._sell_in, array):
+            self._detach_from_buffers()
+        self._name_ids.append(self._name_table.intern(name))
+        self._sell_in.append(sell_in)
+        self._quality.append(quality)
+        return StoredItem(self, len(self._sell_in) - 1)
+    
+    def append(self, item: Item) -> None:
+        """List-compatible append, so GildedRose.add_item works on a store."""
+        self.add(item.name, item.sell_in, item.quality)
+    
+    def _detach_from_buffers(self) -> None:
+        """Copy wrapped buffers into arrays so rows can be appended."""
+        if not self._growable:
+            raise ValueError(
+                "ItemStore wraps fixed-size buffers (shared memory or a mapped file); "
+                "rows cannot be added"
+            )
+        self._name_ids = array("i", self._name_ids)
+        self._sell_in = array("i", self._sell_in)
+        self._quality = array("i", self._quality)
+    
+    def to_items(self) -> List[Item]:
+        """Materialize every row as a regular Item."""
+        names = self._name_table.names
+        return [
+            Item(names[name_id], sell_in, quality)
+            for name_id, sell_in, quality in zip(self._name_ids, self._sell_in, self._quality)
+        ]
+    
+    @property
+    def sell_in(self) -> MutableSequence[int]:
+        """sell_in column, one entry per row."""
+        return self._sell_in
+    
+    @property
+    def quality(self) -> MutableSequence[int]:
+        """quality column, one entry per row."""
+        return self._quality
+    
+    @property
+    def names(self) -> NameRegistry:
+        """The string table: each distinct item name once."""
+        return self._name_table
+    
+    @property
+    def name_ids(self) -> Sequence[int]:
+        """Interned name id of every row."""
+        return self._name_ids
+    
+    def __len__(self) -> int:
+        return len(self._sell_in)
+    
+    def __getitem__(self, index: int) -> StoredItem:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ItemStore index out of range")
+        return StoredItem(self, index)
+    
+    def __iter__(self) -> Iterator[StoredItem]:
+        for index in range(len(self)):
+            yield StoredItem(self, index)
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Inventory aged in place inside a memory-mapped snapshot file.
+The sell_in and quality columns of an uncompressed snapshot (see
+inventory_snapshot.py) are mapped read-write and updated row by row, so
+no Item objects are built and the file is never rewritten. Only the pages
+the operating system needs are resident, which lets inventories larger
+than RAM be aged at disk speed.
+
+Days are double-buffered. On first open the file grows a spare pair of
+sell_in and quality columns, and the SPARE_SLOT header flag names the
+pair that holds the committed day. A day reads the committed pair, writes
+the other one and makes that range durable (flush + fsync) before the
+header flips the flag and bumps the day (flush + fsync of the header
+page). A crash at any point leaves the previous day intact, so nothing is
+copied aside beforehand and there is nothing to recover on open.
+
+Usage:
+    with MappedInventory("inventory.grs") as inventory:
+        inventory.update_quality()
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from typing import List, Optional, Tuple
+
+from gilded_rose import Item, ItemUpdaterFactory, QualityUpdater
+from int_columns import NATIVE_LITTLE_ENDIAN
+from inventory_snapshot import (
+    HEADER, SPARE_SLOT, SnapshotHeader, column_offset, parse_header, store_from_body,
+)
+from item_store import ItemStore
+
+
+FLAGS_OFFSET = 6  # Offsets of the flags and day fields inside HEADER
+DAY_OFFSET = 20
+FLAGS_FIELD = struct.Struct("<H")
+DAY_FIELD = struct.Struct("<i")
+
+
+class MappedInventory:
+    """
+    Read-write view of an uncompressed snapshot file.
+
+    The inventory owns the mapping: call close() (or use it as a context
+    manager) once done, after dropping any references to items.
+    """
+
+    def __init__(self, path: str, updater_factory: Optional[ItemUpdaterFactory] = None):
+        self._file = open(path, "r+b")
+        try:
+            header = parse_header(self._file.read(HEADER.size))
+            _check_mappable(header)
+            size = HEADER.size + column_offset(header, 5)
+            if os.fstat(self._file.fileno()).st_size < size:
+                self._file.truncate(size)  # Add the spare pair; made durable by the first commit
+            self._mapping = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_WRITE)
+        except Exception:
+            self._file.close()
+            raise
+        self._header = header
+        self._body = memoryview(self._mapping)[HEADER.size:]
+        self._stores: Tuple[ItemStore, ItemStore] = (
+            store_from_body(header, self._body, copy=False, slot=0),
+            store_from_body(header, self._body, copy=False, slot=1),
+        )
+        self._slot = header.slot
+        self.day = header.day
+        self._updater_factory = updater_factory or ItemUpdaterFactory()
+        self._bind_updaters()
+
+    @property
+    def items(self) -> ItemStore:
+        """The committed day, as views over the mapped columns."""
+        return self._stores[self._slot]
+
+    def register_strategy(self, item_name: str, updater: QualityUpdater) -> None:
+        self._updater_factory.register_strategy(item_name, updater)
+        self._bind_updaters()
+
+    def update_quality(self) -> None:
+        """Age every row by one day, then commit the day to disk."""
+        self.advance(1)
+
+    def advance(self, days: int) -> None:
+        """Age every row by days in one pass, committed as a single step."""
+        if days < 0:
+            raise ValueError(f"days must be non-negative, got {days}")
+        if days == 0:
+            return
+        current, spare = self.items, self._stores[1 - self._slot]
+        names = current.names.names
+        sell_ins, qualities = current.sell_in.tolist(), current.quality.tolist()
+        updaters = self._updaters
+        scratch = Item("", 0, 0)
+        for row, name_id in enumerate(current.name_ids):
+            scratch.name = names[name_id]
+            scratch.sell_in, scratch.quality = sell_ins[row], qualities[row]
+            updaters[name_id].advance(scratch, days)
+            sell_ins[row], qualities[row] = scratch.sell_in, scratch.quality
+        spare.sell_in[:] = array("i", sell_ins)
+        spare.quality[:] = array("i", qualities)
+        self._commit(days)
+
+    def close(self) -> None:
+        """Release the column views and unmap the file."""
+        if self._mapping.closed:
+            return
+        for store in self._stores:
+            for column in (store.name_ids, store.sell_in, store.quality):
+                column.release()
+        self._body.release()
+        self._mapping.close()
+        self._file.close()
+
+    def __enter__(self) -> "MappedInventory":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _bind_updaters(self) -> None:
+        """One strategy per distinct name in the file's string table."""
+        get_updater = self._updater_factory.get_updater
+        self._updaters: List[QualityUpdater] = [
+            get_updater(name) for name in self.items.names.names
+        ]
+
+    def _commit(self, days: int) -> None:
+        """
+        Make the freshly written pair durable, then point the header at it.
+        The header page is only synced once the columns it names are on disk.
+        """
+        slot = 1 - self._slot
+        start = HEADER.size + column_offset(self._header, 1 + 2 * slot)
+        stop = HEADER.size + column_offset(self._header, 3 + 2 * slot)
+        page_start = start - start % mmap.ALLOCATIONGRANULARITY
+        self._mapping.flush(page_start, stop - page_start)
+        os.fsync(self._file.fileno())
+
+        flags = self._header.flags & ~SPARE_SLOT | (SPARE_SLOT if slot else 0)
+        FLAGS_FIELD.pack_into(self._mapping, FLAGS_OFFSET, flags)
+        DAY_FIELD.pack_into(self._mapping, DAY_OFFSET, self.day + days)
+        self._mapping.flush(0, HEADER.size)
+        os.fsync(self._file.fileno())
+        self._slot = slot
+        self.day += days
+
+
+def _check_mappable(header: SnapshotHeader) -> None:
+    if header.compressed:
+        raise ValueError("Compressed snapshots cannot be updated in place")
+    if not NATIVE_LITTLE_ENDIAN:
+        raise ValueError("In-place updates need a little-endian host")
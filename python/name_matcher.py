@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Name routing helpers for ItemUpdaterFactory.
+NameMatcher maps item names to values through prefixes, globs and regular
+expressions. Prefixes live in a trie, so the longest matching prefix is
+found in one walk over the name; globs and regexes are compiled into
+alternations as they are registered, so a name is usually tested against
+all of them in a single match. A pattern that cannot join the current
+alternation (inline global flags, a group name already taken) starts
+the next one.
+LRUCache memoizes the results per distinct name.
+"""
+
+import fnmatch
+import re
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Pattern, Tuple
+
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+        self.misses += 1
+        return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        entries = self._entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+
+class PrefixTrie:
+    """Character trie returning the value of the longest registered prefix."""
+
+    _VALUE = ""  # Node key holding the value; no real character is empty
+
+    def __init__(self):
+        self._root: Dict[str, Any] = {}
+        self._size = 0
+
+    def insert(self, prefix: str, value: Any) -> None:
+        node = self._root
+        for character in prefix:
+            node = node.setdefault(character, {})
+        if self._VALUE not in node:
+            self._size += 1
+        node[self._VALUE] = value
+
+    def longest_match(self, name: str) -> Optional[Any]:
+        node = self._root
+        found = node.get(self._VALUE)
+        for character in name:
+            node = node.get(character)
+            if node is None:
+                break
+            if self._VALUE in node:
+                found = node[self._VALUE]
+        return found
+
+    def items(self) -> List[tuple]:
+        """(prefix, value) pairs in no particular order."""
+        pairs, stack = [], [("", self._root)]
+        while stack:
+            prefix, node = stack.pop()
+            for key, child in node.items():
+                if key == self._VALUE:
+                    pairs.append((prefix, child))
+                else:
+                    stack.append((prefix + key, child))
+        return pairs
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class NameMatcher:
+    """
+    Routes names by pattern: globs and regexes first, in registration
+    order, then the longest matching prefix. Regexes must match the
+    whole name and must not use numbered backreferences.
+    """
+
+    def __init__(self):
+        self._prefixes = PrefixTrie()
+        self._patterns: List[str] = []  # Regex source of every glob and regex
+        self._values: List[Any] = []
+        # (compiled, index of its first pattern, whether it is an alternation of _route groups)
+        self._chunks: List[Tuple[Pattern, int, bool]] = []
+
+    def add_prefix(self, prefix: str, value: Any) -> None:
+        self._prefixes.insert(prefix, value)
+
+    def add_glob(self, pattern: str, value: Any) -> None:
+        """Shell-style pattern such as "Backstage passes to *"."""
+        self.add_regex(fnmatch.translate(pattern), value)
+
+    def add_regex(self, pattern: str, value: Any) -> None:
+        compiled = re.compile(pattern)  # Report invalid patterns at registration
+        index = len(self._patterns)
+        self._patterns.append(pattern)
+        self._values.append(value)
+        chunks = self._chunks
+        if chunks and chunks[-1][2]:
+            first = chunks[-1][1]
+            combined = self._alternation(first, self._patterns[first:])
+            if combined is not None:
+                chunks[-1] = (combined, first, True)
+                return
+        combined = self._alternation(index, [pattern])
+        chunks.append((compiled, index, False) if combined is None else (combined, index, True))
+
+    def match(self, name: str) -> Optional[Any]:
+        """Value registered for name, or None."""
+        for compiled, first, grouped in self._chunks:
+            found = compiled.fullmatch(name)
+            if found is not None:
+                return self._values[int(found.lastgroup[len("_route"):]) if grouped else first]
+        return self._prefixes.longest_match(name)
+
+    def map_values(self, transform: Callable[[Any], Any]) -> None:
+        """Replace every registered value by transform(value)."""
+        prefixes = PrefixTrie()
+        for prefix, value in self._prefixes.items():
+            prefixes.insert(prefix, transform(value))
+        self._prefixes = prefixes
+        self._values = [transform(value) for value in self._values]
+
+    def __len__(self) -> int:
+        return len(self._prefixes) + len(self._patterns)
+
+    @staticmethod
+    def _alternation(first: int, patterns: List[str]) -> Optional[Pattern]:
+        """One regex over patterns numbered from first, or None if they cannot be combined."""
+        try:
+            return re.compile("|".join(
+                f"(?P<_route{index}>{pattern})" for index, pattern in enumerate(patterns, first)
+            ))
+        except re.error:
+            return None
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+Multi-core batch updates for large inventories.
+Items are independent, so the inventory is split into contiguous shards
+that worker processes age in parallel. The name id, sell_in and quality
+columns are copied once into a shared memory block that stays resident
+for the lifetime of the instance: workers write results in place and
+neither Item objects nor columns travel between processes on later days.
+"""
+
+import os
+import weakref
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, List, Optional, Tuple
+
+from gilded_rose import Item, ItemUpdaterFactory, QualityUpdater
+from item_store import ItemStore
+
+
+COLUMN_COUNT = 3  # name_ids, sell_in, quality
+COLUMN_ITEM_SIZE = array("i").itemsize
+
+
+def _age_shard(
+    shared_memory_name: str,
+    size: int,
+    start: int,
+    stop: int,
+    updater_factory: ItemUpdaterFactory,
+    days: int,
+) -> None:
+    """Worker entry point: age rows [start, stop) of the shared columns."""
+    shared_memory = SharedMemory(name=shared_memory_name)
+    columns = shared_memory.buf.cast("i")
+    try:
+        _age_rows(columns, size, start, stop, updater_factory, days)
+    finally:
+        columns.release()
+        shared_memory.close()
+
+
+def _age_rows(
+    columns: memoryview,
+    size: int,
+    start: int,
+    stop: int,
+    updater_factory: ItemUpdaterFactory,
+    days: int,
+) -> None:
+    """
+    Age a range of rows straight on the raw columns.
+    One day is each strategy's fused step(); longer jumps use its advance()
+    on a single scratch item, which is the closed form for the built-ins.
+    Kept separate so the column slices are gone before the block is closed.
+    """
+    sell_in_column = columns[size + start:size + stop]
+    quality_column = columns[2 * size + start:2 * size + stop]
+    name_ids = columns[start:stop].tolist()
+    sell_ins = sell_in_column.tolist()
+    qualities = quality_column.tolist()
+    get_updater_by_id = updater_factory.get_updater_by_id
+    updaters = {name_id: get_updater_by_id(name_id) for name_id in set(name_ids)}
+    if days == 1:
+        steps = {name_id: updater.step for name_id, updater in updaters.items()}
+        for row, name_id in enumerate(name_ids):
+            sell_ins[row], qualities[row] = steps[name_id](sell_ins[row], qualities[row])
+    else:
+        scratch = Item("", 0, 0)
+        for row, name_id in enumerate(name_ids):
+            scratch.sell_in, scratch.quality = sell_ins[row], qualities[row]
+            updaters[name_id].advance(scratch, days)
+            sell_ins[row], qualities[row] = scratch.sell_in, scratch.quality
+    sell_in_column[:] = array("i", sell_ins)
+    quality_column[:] = array("i", qualities)
+    sell_in_column.release()
+    quality_column.release()
+
+
+def _release_block(shared_memory: SharedMemory, views: List[memoryview]) -> None:
+    for view in views:
+        view.release()
+    shared_memory.close()
+    shared_memory.unlink()
+
+
+class ParallelGildedRose:
+    """
+    GildedRose that shards the inventory across a process pool.
+
+    - Items are copied once into an ItemStore over a shared memory block;
+      self.items is that store and the original Item objects are not updated
+    - Each worker ages a contiguous shard of the raw columns in place
+    - Shards never overlap, so the outcome is deterministic
+
+    Small inventories (below two shards) are aged in-process on the same
+    columns. The block is released by close() or when the instance is
+    garbage collected.
+    """
+
+    MIN_SHARD_SIZE = 50_000  # Below this, process start-up costs more than it saves
+
+    def __init__(
+        self,
+        items: Iterable[Item],
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        min_shard_size: int = MIN_SHARD_SIZE,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.min_shard_size = min_shard_size
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._updater_factory = ItemUpdaterFactory()
+        self._load(items)
+
+    @property
+    def items(self) -> ItemStore:
+        """The inventory, as views over the shared columns."""
+        return self._store
+
+    def register_strategy(self, item_name: str, updater: QualityUpdater) -> None:
+        """Register a strategy; it is shipped to the workers on the next call."""
+        self._updater_factory.register_strategy(item_name, updater)
+
+    def update_quality(self) -> None:
+        """Update quality for all items in inventory."""
+        self.advance(1)
+
+    def advance(self, days: int) -> None:
+        """Age every item by the given number of days."""
+        if days < 0:
+            raise ValueError(f"days must be non-negative, got {days}")
+        if days == 0 or not self._size:
+            return
+        shards = self._shards(self._size)
+        if len(shards) == 1:
+            _age_rows(self._columns, self._size, 0, self._size, self._updater_factory, days)
+        else:
+            self._advance_in_workers(days, shards)
+
+    def close(self) -> None:
+        """Release the shared columns and shut down the pool if this instance created it."""
+        self._release()
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "ParallelGildedRose":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _load(self, items: Iterable[Item]) -> None:
+        """Copy the items into a new shared block and wrap it in an ItemStore."""
+        intern = self._updater_factory.names.intern
+        name_ids, sell_ins, qualities = array("i"), array("i"), array("i")
+        for item in items:
+            name_ids.append(intern(item.name))
+            sell_ins.append(item.sell_in)
+            qualities.append(item.quality)
+        size = self._size = len(name_ids)
+        # A block cannot be empty, so an empty inventory still gets one slot
+        self._shared_memory = SharedMemory(
+            create=True, size=max(1, COLUMN_COUNT * size) * COLUMN_ITEM_SIZE
+        )
+        columns = self._columns = self._shared_memory.buf.cast("i")
+        columns[:size] = name_ids
+        columns[size:2 * size] = sell_ins
+        columns[2 * size:3 * size] = qualities
+        views = [columns[:size], columns[size:2 * size], columns[2 * size:3 * size]]
+        self._store = ItemStore.from_buffers(self._updater_factory.names, *views)
+        self._release = weakref.finalize(
+            self, _release_block, self._shared_memory, views + [columns]
+        )
+
+    def _shards(self, size: int) -> List[Tuple[int, int]]:
+        """Split [0, size) into at most `workers` contiguous ranges."""
+        shard_size = max(self.min_shard_size, -(-size // self.workers))
+        return [(start, min(start + shard_size, size)) for start in range(0, size, shard_size)]
+
+    def _advance_in_workers(self, days: int, shards: List[Tuple[int, int]]) -> None:
+        executor = self._get_executor()
+        futures = [
+            executor.submit(
+                _age_shard, self._shared_memory.name, self._size, start, stop,
+                self._updater_factory, days,
+            )
+            for start, stop in shards
+        ]
+        for future in futures:
+            future.result()  # Re-raise worker errors
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+Inventory stored in SQLite and aged inside the database.
+Rows of the built-in strategies are updated by one set-based UPDATE whose
+CASE expressions encode the same rules as the strategy classes, so they
+never travel through Python. Only rows whose strategy has no SQL form
+(custom strategies) are read, aged with their Python strategy and written
+back. Both parts run in one transaction per day.
+
+Usage:
+    with SQLiteInventory("inventory.db") as inventory:
+        inventory.add_items(items)
+        inventory.update_quality()
+"""
+
+import sqlite3
+from typing import Dict, Iterable, List, Optional
+
+from gilded_rose import (
+    AgedBrieUpdater,
+    BackstagePassUpdater,
+    ConjuredItemUpdater,
+    Item,
+    ItemUpdaterFactory,
+    NormalItemUpdater,
+    QualityUpdater,
+    SulfurasUpdater,
+)
+
+
+# Category codes stored in items.category
+CUSTOM = -1  # Aged in Python
+NORMAL = 0
+AGED_BRIE = 1
+BACKSTAGE_PASS = 2
+SULFURAS = 3
+CONJURED = 4
+
+CATEGORY_BY_STRATEGY = {
+    NormalItemUpdater: NORMAL,
+    AgedBrieUpdater: AGED_BRIE,
+    BackstagePassUpdater: BACKSTAGE_PASS,
+    SulfurasUpdater: SULFURAS,
+    ConjuredItemUpdater: CONJURED,
+}
+
+CUSTOM_CHUNK_SIZE = 10_000  # Custom rows aged per round trip
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    sell_in INTEGER NOT NULL,
+    quality INTEGER NOT NULL,
+    category INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_by_category ON items (category);
+CREATE INDEX IF NOT EXISTS items_by_name ON items (name, category);
+"""
+
+# Every right-hand side sees the row before the update, so "expired after
+# today" is sell_in < 1 and the second degradation is applied to the
+# clamped first one, exactly like update_quality() then update_sell_in().
+DAILY_UPDATE = """
+UPDATE items SET
+    quality = CASE category
+        WHEN :normal THEN
+            CASE WHEN sell_in < 1
+                THEN MAX(:minimum, MAX(:minimum, MIN(quality - :normal_step, :maximum)) - :normal_step)
+                ELSE MAX(:minimum, MIN(quality - :normal_step, :maximum))
+            END
+        WHEN :conjured THEN
+            CASE WHEN sell_in < 1
+                THEN MAX(:minimum, MAX(:minimum, MIN(quality - :conjured_step, :maximum)) - :conjured_step)
+                ELSE MAX(:minimum, MIN(quality - :conjured_step, :maximum))
+            END
+        WHEN :aged_brie THEN
+            CASE WHEN sell_in < 1
+                THEN MIN(:maximum, MAX(:minimum, MIN(quality + 1, :maximum)) + 1)
+                ELSE MAX(:minimum, MIN(quality + 1, :maximum))
+            END
+        WHEN :backstage_pass THEN
+            CASE
+                WHEN sell_in < 1 THEN :minimum
+                WHEN sell_in < :critical_zone THEN MAX(:minimum, MIN(quality + 3, :maximum))
+                WHEN sell_in < :urgent_zone THEN MAX(:minimum, MIN(quality + 2, :maximum))
+                ELSE MAX(:minimum, MIN(quality + 1, :maximum))
+            END
+    END,
+    sell_in = sell_in - 1
+WHERE category IN (:normal, :conjured, :aged_brie, :backstage_pass)
+"""
+
+DAILY_UPDATE_PARAMETERS = {
+    "normal": NORMAL,
+    "conjured": CONJURED,
+    "aged_brie": AGED_BRIE,
+    "backstage_pass": BACKSTAGE_PASS,
+    "minimum": QualityUpdater.MINIMUM_QUALITY,
+    "maximum": QualityUpdater.MAXIMUM_QUALITY,
+    "normal_step": NormalItemUpdater.DEGRADATION,
+    "conjured_step": ConjuredItemUpdater.DEGRADATION,
+    "critical_zone": BackstagePassUpdater.DAYS_CRITICAL_ZONE,
+    "urgent_zone": BackstagePassUpdater.DAYS_URGENT_ZONE,
+}
+
+
+def category_for(updater: QualityUpdater) -> int:
+    """SQL category of a strategy; only the exact built-in types have one."""
+    return CATEGORY_BY_STRATEGY.get(type(updater), CUSTOM)
+
+
+class SQLiteInventory:
+    """
+    Items table with a category column resolved once per distinct name.
+    Strategy changes re-categorize the rows of the names whose category
+    changed, found through the (name, category) index.
+    """
+
+    def __init__(self, path: str = ":memory:", updater_factory: Optional[ItemUpdaterFactory] = None):
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        self.updater_factory = updater_factory or ItemUpdaterFactory()
+
+    def add_items(self, items: Iterable[Item]) -> None:
+        categories: Dict[str, int] = {}
+
+        def row(item: Item) -> tuple:
+            category = categories.get(item.name)
+            if category is None:
+                category = categories[item.name] = self._category_of(item.name)
+            return item.name, item.sell_in, item.quality, category
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO items (name, sell_in, quality, category) VALUES (?, ?, ?, ?)",
+                (row(item) for item in items),
+            )
+
+    def add_item(self, item: Item) -> None:
+        self.add_items([item])
+
+    def register_strategy(self, item_name: str, updater: QualityUpdater) -> None:
+        """Register a strategy and re-categorize every stored name."""
+        self.updater_factory.register_strategy(item_name, updater)
+        self._recategorize()
+
+    def update_quality(self) -> None:
+        """One day for every row, committed as a single transaction."""
+        with self.connection:
+            self._run_day()
+
+    def advance(self, days: int) -> None:
+        """Several daily rolls committed together."""
+        if days < 0:
+            raise ValueError(f"days must be non-negative, got {days}")
+        with self.connection:
+            for _ in range(days):
+                self._run_day()
+
+    def items(self) -> List[Item]:
+        """Every row as an Item, in insertion order."""
+        return [
+            Item(name, sell_in, quality)
+            for name, sell_in, quality in self.connection.execute(
+                "SELECT name, sell_in, quality FROM items ORDER BY id"
+            )
+        ]
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "SQLiteInventory":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _run_day(self) -> None:
+        self.connection.execute(DAILY_UPDATE, DAILY_UPDATE_PARAMETERS)
+        self._run_custom_day()
+
+    def _run_custom_day(self) -> None:
+        """
+        Age custom rows with their Python strategies, chunk by chunk in id
+        order. Each chunk is grouped by strategy and passed to update_batch().
+        """
+        get_updater = self.updater_factory.get_updater
+        last_id = -1
+        while True:
+            rows = self.connection.execute(
+                "SELECT id, name, sell_in, quality FROM items"
+                " WHERE category = ? AND id > ? ORDER BY id LIMIT ?",
+                (CUSTOM, last_id, CUSTOM_CHUNK_SIZE),
+            ).fetchall()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            items = [Item(name, sell_in, quality) for _, name, sell_in, quality in rows]
+            groups: Dict[int, tuple] = {}
+            for item in items:
+                updater = get_updater(item.name)
+                groups.setdefault(id(updater), (updater, []))[1].append(item)
+            for updater, group in groups.values():
+                updater.update_batch(group)
+            self.connection.executemany(
+                "UPDATE items SET sell_in = ?, quality = ? WHERE id = ?",
+                [(item.sell_in, item.quality, row[0]) for item, row in zip(items, rows)],
+            )
+
+    def _recategorize(self) -> None:
+        changed = []
+        for name, stored in self.connection.execute("SELECT DISTINCT name, category FROM items"):
+            category = self._category_of(name)
+            if category != stored:
+                changed.append((category, name))
+        with self.connection:
+            self.connection.executemany("UPDATE items SET category = ? WHERE name = ?", changed)
+
+    def _category_of(self, name: str) -> int:
+        return category_for(self.updater_factory.get_updater(name))
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Compile strategies into transition tables.
+A strategy's daily update is a pure function of (sell_in, quality), so it
+can be evaluated once for every state in a window and stored. Afterwards
+a day is one table lookup per item, whatever the strategy does, which
+makes strategies added with register_strategy as cheap as the built-ins.
+Strategies that already have a native step() (the built-ins) are fast
+as they are and are left uncompiled.
+
+States outside the window (sell_in far from the sell-by date, quality
+outside 0..80) fall back to the original strategy.
+
+Usage:
+    gilded_rose.map_strategies(compile_strategy)
+
+map_strategies only sees the strategies registered so far. Register later
+strategies already compiled (compile_strategy(updater)), or call
+map_strategies again.
+"""
+
+from typing import List, Sequence, Tuple
+
+from gilded_rose import Item, QualityUpdater
+
+
+DEFAULT_SELL_IN_RANGE = (-10, 60)  # Inclusive sell_in window covered by each table
+TABLE_MAX_QUALITY = 80             # Covers Sulfuras' legendary quality
+
+
+class CompiledUpdater(QualityUpdater):
+    """
+    Table-driven replacement for a strategy.
+
+    Each phase keeps its own table, so update_quality() and
+    update_sell_in() change exactly what the source's do, and a third
+    table holds the fused day used by step() and update_batch().
+    Strategies must not depend on anything but sell_in and quality.
+    """
+
+    def __init__(
+        self,
+        source: QualityUpdater,
+        sell_in_range: Tuple[int, int] = DEFAULT_SELL_IN_RANGE,
+        max_quality: int = TABLE_MAX_QUALITY,
+    ):
+        self.source = source
+        self.low, self.high = sell_in_range
+        self.max_quality = max_quality
+        self._span = max_quality + 1
+        self._quality_phase: List[int] = []
+        self._sell_in_phase: List[Tuple[int, int]] = []
+        self._day: List[Tuple[int, int]] = []
+        scratch = Item("", 0, 0)
+        for sell_in in range(self.low, self.high + 1):
+            for quality in range(self._span):
+                scratch.sell_in, scratch.quality = sell_in, quality
+                source.update_quality(scratch)
+                self._quality_phase.append(scratch.quality)
+                source.update_sell_in(scratch)
+                self._day.append((scratch.sell_in, scratch.quality))
+                scratch.sell_in, scratch.quality = sell_in, quality
+                source.update_sell_in(scratch)
+                self._sell_in_phase.append((scratch.sell_in, scratch.quality))
+
+    def update_quality(self, item: Item) -> None:
+        """The source's quality phase, from the table."""
+        row = self._row(item.sell_in, item.quality)
+        if row is None:
+            self.source.update_quality(item)
+        else:
+            item.quality = self._quality_phase[row]
+
+    def update_sell_in(self, item: Item) -> None:
+        """The source's sell_in phase (expiry effects included), from the table."""
+        row = self._row(item.sell_in, item.quality)
+        if row is None:
+            self.source.update_sell_in(item)
+        else:
+            item.sell_in, item.quality = self._sell_in_phase[row]
+
+    def step(self, sell_in: int, quality: int) -> Tuple[int, int]:
+        """One full day as a single lookup; the source's step() outside the window."""
+        row = self._row(sell_in, quality)
+        if row is None:
+            return self.source.step(sell_in, quality)
+        return self._day[row]
+
+    def update_batch(self, items: Sequence[Item]) -> None:
+        """step() inlined over the whole batch."""
+        low, high, span, max_quality = self.low, self.high, self._span, self.max_quality
+        day, step = self._day, self.source.step
+        for item in items:
+            sell_in, quality = item.sell_in, item.quality
+            if low <= sell_in <= high and 0 <= quality <= max_quality:
+                item.sell_in, item.quality = day[(sell_in - low) * span + quality]
+            else:
+                item.sell_in, item.quality = step(sell_in, quality)
+
+    def advance(self, item: Item, days: int) -> None:
+        """Use the source's closed form when it has one, else look up day by day."""
+        if type(self.source).advance is QualityUpdater.advance:
+            step = self.step
+            for _ in range(days):
+                item.sell_in, item.quality = step(item.sell_in, item.quality)
+        else:
+            self.source.advance(item, days)
+
+    def linear_window(self, sell_in: int, quality: int) -> Tuple[int, int, int]:
+        return self.source.linear_window(sell_in, quality)
+
+    def __repr__(self) -> str:
+        return f"CompiledUpdater({type(self.source).__name__})"
+
+    def _row(self, sell_in: int, quality: int):
+        """Table row of a state, or None outside the window."""
+        if self.low <= sell_in <= self.high and 0 <= quality <= self.max_quality:
+            return (sell_in - self.low) * self._span + quality
+        return None
+
+
+def compile_strategy(
+    updater: QualityUpdater,
+    sell_in_range: Tuple[int, int] = DEFAULT_SELL_IN_RANGE,
+    max_quality: int = TABLE_MAX_QUALITY,
+) -> QualityUpdater:
+    """
+    Table-driven version of updater. Strategies with a native step(),
+    compiled ones included, are returned as is.
+    """
+    if updater.has_native_step():
+        return updater
+    return CompiledUpdater(updater, sell_in_range, max_quality)
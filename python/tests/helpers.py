@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Inventories and helpers shared by the test modules."""
+import random
+
+from gilded_rose import AgedBrieUpdater, Item
+
+
+ITEM_NAMES = [
+    "Normal Item",
+    "Aged Brie",
+    "Backstage passes to a TAFKAL80ETC concert",
+    "Sulfuras, Hand of Ragnaros",
+    "Conjured Mana Cake",
+]
+
+
+def sample_items():
+    """Small inventory covering every strategy, expiry and both clamps."""
+    return [
+        Item("+5 Dexterity Vest", 10, 20),
+        Item("Aged Brie", 2, 0),
+        Item("Elixir of the Mongoose", -3, 7),
+        Item("Normal Item", 0, 1),                                   # expires, clamps at 0
+        Item("Sulfuras, Hand of Ragnaros", 0, 80),
+        Item("Backstage passes to a TAFKAL80ETC concert", 15, 20),
+        Item("Backstage passes to a TAFKAL80ETC concert", 5, 49),    # clamps at 50
+        Item("Backstage passes to a TAFKAL80ETC concert", 0, 30),    # concert passes: drops to 0
+        Item("Aged Brie", 5, 50),                                    # clamps at 50
+        Item("Conjured Mana Cake", 3, 6),
+        Item("Poção de Mana ✨", 3, 6),
+    ]
+
+
+def random_items(count, seed, names=ITEM_NAMES, sell_in_range=(-5, 20), quality_range=(0, 50), qualities=None):
+    """
+    Seeded random inventory. Qualities are drawn from quality_range, or
+    picked from qualities when given.
+    """
+    rng = random.Random(seed)
+    return [
+        Item(
+            rng.choice(names),
+            rng.randint(*sell_in_range),
+            rng.choice(qualities) if qualities else rng.randint(*quality_range),
+        )
+        for _ in range(count)
+    ]
+
+
+def as_tuples(items):
+    return [(item.name, item.sell_in, item.quality) for item in items]
+
+
+class DoubleBrieUpdater(AgedBrieUpdater):
+    """Aged Brie gaining 2 per day; module level so worker processes can unpickle it."""
+
+    def update_quality(self, item):
+        item.quality = self.clamp_quality(item.quality + 2)
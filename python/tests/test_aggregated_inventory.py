@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+from collections import Counter
+
+import pytest
+
+from aggregated_inventory import AggregatedInventory, CountedItem
+from gilded_rose import GildedRose, Item, QualityUpdater
+from tests.helpers import random_items
+
+
+def random_units(count=2000, seed=13):
+    """Many units spread over few distinct states."""
+    return random_items(count, seed, sell_in_range=(-2, 12), qualities=[0, 1, 2, 10, 48, 50])
+
+
+def as_counter(items):
+    return Counter((item.name, item.sell_in, item.quality) for item in items)
+
+
+class TestAggregatedInventory:
+    """Tests for the counted-row inventory."""
+
+    def test_identical_units_share_a_row(self):
+        inventory = AggregatedInventory([Item("Aged Brie", 5, 10)] * 1000)
+        inventory.add("Aged Brie", 5, 10, count=500)
+        inventory.add("Aged Brie", 4, 10)
+
+        assert len(inventory) == 2
+        assert inventory.unit_count == 1501
+        assert repr(inventory.rows[0]) == "Aged Brie, 5, 10 x1500"
+
+    def test_days_match_individual_units(self):
+        units = random_units()
+        inventory = AggregatedInventory(units)
+        gilded_rose = GildedRose(units)
+
+        for day in range(20):
+            inventory.update_quality()
+            gilded_rose.update_quality()
+            assert as_counter(inventory.expand()) == as_counter(units), day
+        assert len(inventory) < len(units) / 5
+
+    def test_advance_matches_individual_units(self):
+        units = random_units()
+        inventory = AggregatedInventory(units)
+        inventory.advance(15)
+        GildedRose(units).advance(15)
+
+        assert as_counter(inventory.to_items()) == as_counter(units)
+
+    def test_converging_rows_are_merged(self):
+        """Two batches that both hit quality 0 become one row."""
+        inventory = AggregatedInventory()
+        inventory.add("Normal Item", 5, 1, count=3)
+        inventory.add("Normal Item", 5, 2, count=4)
+        inventory.advance(2)
+
+        assert [(row.sell_in, row.quality, row.count) for row in inventory.rows] == [(3, 0, 7)]
+        inventory.add("Normal Item", 3, 0)
+        assert inventory.rows[0].count == 8
+
+    def test_custom_strategy(self):
+        class FlatUpdater(QualityUpdater):
+            def update_quality(self, item):
+                item.quality = 7
+
+            def update_sell_in(self, item):
+                self.decrease_sell_in(item)
+
+        inventory = AggregatedInventory()
+        inventory.add("Flat", 3, 1, count=2)
+        inventory.add("Flat", 3, 9, count=5)
+        inventory.register_strategy("Flat", FlatUpdater())
+        inventory.update_quality()
+
+        assert [(row.sell_in, row.quality, row.count) for row in inventory.rows] == [(2, 7, 7)]
+
+    def test_rejects_non_positive_counts(self):
+        with pytest.raises(ValueError):
+            AggregatedInventory().add("Aged Brie", 1, 1, count=0)
+
+    def test_counted_item_is_an_item(self):
+        assert isinstance(CountedItem("Aged Brie", 1, 1, 3), Item)
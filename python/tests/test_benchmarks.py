@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+import json
+
+from benchmarks.runner import (
+    MIXES,
+    SULFURAS,
+    benchmark_key,
+    build_inventory,
+    find_regressions,
+    main,
+    run_benchmarks,
+)
+
+
+def fixed_timer(seconds):
+    """Fake timer so the runner logic is tested without real timings."""
+    return lambda size, mix, days, repeat: seconds
+
+
+class TestBenchmarkRunner:
+    """Tests for the benchmark runner."""
+
+    def test_inventory_is_deterministic_and_respects_mix(self):
+        """Same seed, same inventory; single-type mixes hold one name."""
+        first = build_inventory(200, "realistic")
+        second = build_inventory(200, "realistic")
+
+        assert [repr(item) for item in first] == [repr(item) for item in second]
+        assert {item.name for item in build_inventory(50, "all-backstage")} == set(MIXES["all-backstage"])
+        assert all(item.quality == 80 for item in first if item.name == SULFURAS)
+
+    def test_results_report_throughput_per_combination(self):
+        """Every size/mix/days combination gets an item-days/s figure."""
+        results = run_benchmarks([10, 20], ["all-normal"], [1, 5], timer=fixed_timer(0.5), log=lambda line: None)
+
+        assert set(results) == {
+            benchmark_key(size, "all-normal", days) for size in (10, 20) for days in (1, 5)
+        }
+        assert results[benchmark_key(20, "all-normal", 5)]["item_days_per_second"] == 200
+
+    def test_regressions_beyond_threshold_are_reported(self):
+        """Only drops larger than the threshold count as regressions."""
+        baseline = {"a": {"item_days_per_second": 100.0}, "b": {"item_days_per_second": 100.0}}
+        results = {
+            "a": {"item_days_per_second": 95.0},
+            "b": {"item_days_per_second": 80.0},
+            "new": {"item_days_per_second": 1.0},
+        }
+
+        regressions = find_regressions(results, baseline, threshold=0.1)
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith("b:")
+
+    def test_main_fails_against_faster_baseline(self, tmp_path):
+        """The command exits with 1 when the stored baseline is much faster."""
+        output = tmp_path / "results.json"
+        arguments = ["--sizes", "50", "--mixes", "all-normal", "--days", "1", "--repeat", "1"]
+        assert main(arguments + ["--output", str(output)]) == 0
+
+        document = json.loads(output.read_text())
+        for result in document["results"].values():
+            result["item_days_per_second"] *= 1000
+        output.write_text(json.dumps(document))
+
+        assert main(arguments + ["--baseline", str(output)]) == 1
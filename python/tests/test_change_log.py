@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+from change_log import ChangeLog, ChangeLogReader
+from gilded_rose import GildedRose, Item, QualityUpdater
+from tests.helpers import DoubleBrieUpdater, as_tuples, random_items
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return str(tmp_path / "inventory.log")
+
+
+def record_history(log_path, items, days):
+    """Run days updates with a change log and return the state after each day."""
+    history = [as_tuples(items)]
+    with ChangeLog(log_path) as change_log:
+        gilded_rose = GildedRose(items, change_log=change_log)
+        for _ in range(days):
+            gilded_rose.update_quality()
+            history.append(as_tuples(items))
+    return history
+
+
+class TestChangeLog:
+    """Tests for the daily change log and its replay."""
+
+    def test_state_at_reconstructs_every_day(self, log_path):
+        history = record_history(log_path, random_items(200, seed=11), 30)
+        reader = ChangeLogReader(log_path)
+
+        assert reader.last_day == 30
+        for day, expected in enumerate(history):
+            assert as_tuples(reader.state_at(day)) == expected, day
+
+    def test_only_deviating_items_are_logged(self, log_path):
+        """Items that keep their daily change produce no entries."""
+        items = [Item("Normal Item", 20, 40), Item("Sulfuras, Hand of Ragnaros", 0, 80)]
+        record_history(log_path, items, 10)
+
+        assert list(ChangeLogReader(log_path).changes(1, 10)) == []
+
+    def test_changes_report_expiry_and_clamps(self, log_path):
+        items = [Item("Normal Item", 1, 5), Item("Aged Brie", 10, 49)]
+        record_history(log_path, items, 4)
+
+        assert list(ChangeLogReader(log_path).changes(1, 4)) == [
+            (2, 0, -1, 2),  # Expired: quality drops by 2
+            (2, 1, 8, 50),  # Brie stops at the cap
+            (4, 0, -3, 0),  # Worthless: quality stays at 0
+        ]
+
+    def test_advance_and_added_items_write_checkpoints(self, log_path):
+        items = random_items(20, seed=11)
+        with ChangeLog(log_path) as change_log:
+            gilded_rose = GildedRose(items, change_log=change_log)
+            gilded_rose.update_quality()
+            gilded_rose.advance(5)
+            gilded_rose.add_item(Item("Aged Brie", 3, 3))
+            gilded_rose.update_quality()
+            expected = as_tuples(items)
+        reader = ChangeLogReader(log_path)
+
+        assert reader.last_day == 7
+        assert as_tuples(reader.state_at(7)) == expected
+
+    def test_custom_strategy_changes_are_picked_up(self, log_path):
+        class DoubleAgingUpdater(QualityUpdater):
+            def update_quality(self, item):
+                item.quality = self.clamp_quality(item.quality - 2)
+
+            def update_sell_in(self, item):
+                self.decrease_sell_in(item)
+
+        items = random_items(50, seed=11)
+        history = [as_tuples(items)]
+        with ChangeLog(log_path) as change_log:
+            gilded_rose = GildedRose(items, change_log=change_log)
+            gilded_rose.update_quality()
+            gilded_rose.register_strategy("Normal Item", DoubleAgingUpdater())
+            for _ in range(5):
+                gilded_rose.update_quality()
+            history.append(as_tuples(items))
+
+        assert as_tuples(ChangeLogReader(log_path).state_at(6)) == history[-1]
+
+    def test_checkpoints_use_overriding_subclass_rules(self, log_path):
+        """Checkpointed changes never come from the parent's linear window."""
+        items = [Item("Aged Brie", 10, 0)]
+        with ChangeLog(log_path) as change_log:
+            gilded_rose = GildedRose(items, change_log=change_log)
+            gilded_rose.register_strategy("Aged Brie", DoubleBrieUpdater())
+            gilded_rose.advance(1)
+            for _ in range(4):
+                gilded_rose.update_quality()
+        reader = ChangeLogReader(log_path)
+
+        assert as_tuples(items) == [("Aged Brie", 5, 10)]
+        assert as_tuples(reader.state_at(5)) == [("Aged Brie", 5, 10)]
+
+    def test_reopening_appends_to_the_history(self, log_path):
+        """A second ChangeLog on the same path continues from the last day."""
+        items = random_items(50, seed=11)
+        history = record_history(log_path, items, 3)
+        with ChangeLog(log_path) as change_log:
+            assert change_log.day == 3
+            gilded_rose = GildedRose(items, change_log=change_log)
+            for _ in range(2):
+                gilded_rose.update_quality()
+                history.append(as_tuples(items))
+        reader = ChangeLogReader(log_path)
+
+        assert reader.last_day == 5
+        for day, expected in enumerate(history):
+            assert as_tuples(reader.state_at(day)) == expected, day
+
+    def test_reopening_drops_a_torn_record(self, log_path):
+        items = random_items(20, seed=11)
+        history = record_history(log_path, items, 2)
+        with open(log_path, "ab") as handle:
+            handle.write(b"\x02\x03\x00")  # Header of a record cut short by a crash
+        with ChangeLog(log_path) as change_log:
+            gilded_rose = GildedRose(items, change_log=change_log)
+            gilded_rose.update_quality()
+            history.append(as_tuples(items))
+        reader = ChangeLogReader(log_path)
+
+        assert reader.last_day == 3
+        assert as_tuples(reader.state_at(2)) == history[2]
+        assert as_tuples(reader.state_at(3)) == history[3]
+
+    def test_rejects_other_files_and_unlogged_days(self, log_path):
+        with open(log_path, "wb") as handle:
+            handle.write(b"name,sell_in,quality\n")
+        with pytest.raises(ValueError):
+            ChangeLogReader(log_path)
+        with pytest.raises(ValueError):
+            ChangeLog(log_path)  # Never overwrites another file
+        with open(log_path, "rb") as handle:
+            assert handle.read() == b"name,sell_in,quality\n"
+        os.remove(log_path)
+        record_history(log_path, random_items(5, seed=11), 1)
+        with pytest.raises(ValueError):
+            ChangeLogReader(log_path).state_at(-1)
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from gilded_rose import Item, GildedRose, QualityUpdater, ItemUpdaterFactory, NameRegistry
+from columnar_inventory import ColumnarInventory, NORMAL, AGED_BRIE, BACKSTAGE_PASS, SULFURAS, CONJURED
+from tests.helpers import ITEM_NAMES, as_tuples, random_items
+
+
+class TestColumnarInventory:
+    """Tests for the vectorized NumPy engine."""
+
+    def test_categories_are_resolved_per_name(self):
+        """Each built-in strategy maps to its category code."""
+        inventory = ColumnarInventory.from_items([Item(name, 5, 10) for name in ITEM_NAMES])
+
+        assert inventory.categories.tolist() == [NORMAL, AGED_BRIE, BACKSTAGE_PASS, SULFURAS, CONJURED]
+
+    def test_duplicate_names_share_one_id(self):
+        """Rows with the same name point at one registry entry."""
+        inventory = ColumnarInventory.from_items([Item("Aged Brie", day, 0) for day in range(3)])
+
+        assert len(inventory.names) == 1
+        assert inventory.name_ids.tolist() == [0, 0, 0]
+
+    def test_update_quality_matches_strategies_over_many_days(self):
+        """Vectorized daily updates are identical to GildedRose."""
+        items = random_items(500, seed=7, quality_range=(-2, 52))
+        inventory = ColumnarInventory.from_items(items)
+        gilded_rose = GildedRose(items)
+
+        for _ in range(25):
+            gilded_rose.update_quality()
+            inventory.update_quality()
+            assert as_tuples(inventory.to_items()) == as_tuples(items)
+
+    @pytest.mark.parametrize("days", [0, 1, 4, 11, 30])
+    def test_advance_matches_strategies(self, days):
+        """Vectorized closed form is identical to GildedRose.advance()."""
+        items = random_items(500, seed=days, quality_range=(-2, 52))
+        inventory = ColumnarInventory.from_items(items)
+        GildedRose(items).advance(days)
+        inventory.advance(days)
+
+        assert as_tuples(inventory.to_items()) == as_tuples(items)
+
+    def test_custom_strategy_is_rejected(self):
+        """Strategies without a vectorized rule cannot be loaded."""
+
+        class CustomUpdater(QualityUpdater):
+            def update_quality(self, item):
+                pass
+
+            def update_sell_in(self, item):
+                pass
+
+        factory = ItemUpdaterFactory()
+        factory.register_strategy("Custom", CustomUpdater())
+
+        with pytest.raises(ValueError):
+            ColumnarInventory.from_items([Item("Custom", 1, 1)], factory)
+
+    def test_mismatched_columns_are_rejected(self):
+        """All columns must describe the same number of rows."""
+        with pytest.raises(ValueError):
+            ColumnarInventory(
+                NameRegistry(), np.array([0]), np.array([1, 2]), np.array([1]), np.array([0])
+            )
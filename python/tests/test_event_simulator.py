@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from gilded_rose import GildedRose, Item, ItemUpdaterFactory, QualityUpdater
+from event_simulator import EventDrivenSimulator, TimingWheel
+from tests.helpers import DoubleBrieUpdater, as_tuples, random_items
+
+
+WIDE_RANGES = {"sell_in_range": (-5, 25), "quality_range": (-1, 52)}
+
+
+class AlternatingUpdater(QualityUpdater):
+    """Custom strategy without a linear window."""
+
+    def update_quality(self, item):
+        item.quality = self.clamp_quality(item.quality + (1 if item.sell_in % 2 else -1))
+
+    def update_sell_in(self, item):
+        self.decrease_sell_in(item)
+
+
+class TestTimingWheel:
+    """Tests for the bucketed event calendar."""
+
+    def test_pops_days_in_order_with_all_entries(self):
+        """Days come out in order; entries of a day stay together."""
+        wheel = TimingWheel()
+        for day, entry in [(5, 1), (2, 2), (5, 3), (9, 4)]:
+            wheel.schedule(day, entry)
+
+        assert len(wheel) == 4
+        assert wheel.pop_next() == (2, [2])
+        assert wheel.pop_next() == (5, [1, 3])
+        assert wheel.next_day() == 9
+
+
+class TestEventDrivenSimulator:
+    """Tests for the regime-change simulator."""
+
+    def test_matches_daily_updates_at_every_day(self):
+        """The state on any day equals calling update_quality() that many times."""
+        items = random_items(300, seed=11, **WIDE_RANGES)
+        expected = random_items(300, seed=11, **WIDE_RANGES)
+        simulator = EventDrivenSimulator(items)
+        gilded_rose = GildedRose(expected)
+
+        for _ in range(40):
+            simulator.run(1)
+            gilded_rose.update_quality()
+            assert as_tuples(simulator.materialize()) == as_tuples(expected)
+
+    def test_long_run_in_one_call(self):
+        """A year-long run lands on the same state as daily updates."""
+        items = random_items(200, seed=5, **WIDE_RANGES)
+        expected = random_items(200, seed=5, **WIDE_RANGES)
+        simulator = EventDrivenSimulator(items)
+        simulator.run(365)
+        GildedRose(expected).advance(365)
+        assert as_tuples(simulator.materialize()) == as_tuples(expected)
+
+    def test_cost_scales_with_regime_changes(self):
+        """A normal item far from its bounds changes regime only a few times."""
+        simulator = EventDrivenSimulator([Item("Normal Item", 30, 50)])
+        simulator.run(365)
+
+        assert simulator.state(0) == (-335, 0)
+        assert simulator.events_processed <= 3
+
+    def test_custom_strategy_is_simulated_day_by_day(self):
+        """Strategies without a linear window still produce exact results."""
+        factory = ItemUpdaterFactory()
+        factory.register_strategy("Custom", AlternatingUpdater())
+        items = [Item("Custom", 7, 20)]
+        expected = [Item("Custom", 7, 20)]
+        simulator = EventDrivenSimulator(items, factory)
+        simulator.run(10)
+        gilded_rose = GildedRose(expected)
+        gilded_rose.register_strategy("Custom", AlternatingUpdater())
+        gilded_rose.advance(10)
+
+        assert as_tuples(simulator.materialize()) == as_tuples(expected)
+        assert simulator.events_processed == 10
+
+    def test_overriding_subclass_is_simulated_day_by_day(self):
+        """A subclass redefining a built-in's rules does not inherit its linear window."""
+        factory = ItemUpdaterFactory()
+        factory.register_strategy("Aged Brie", DoubleBrieUpdater())
+        simulator = EventDrivenSimulator([Item("Aged Brie", 10, 0)], factory)
+        simulator.run(5)
+
+        assert simulator.state(0) == (5, 10)
+        assert simulator.events_processed == 5
+
+    def test_rejects_negative_days(self):
+        with pytest.raises(ValueError):
+            EventDrivenSimulator([]).run(-1)
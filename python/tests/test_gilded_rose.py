@@ -1,6 +1,19 @@
 # -*- coding: utf-8 -*-
 import pytest
-from gilded_rose import Item, GildedRose
+from gilded_rose import (
+    AgedBrieUpdater,
+    BackstagePassUpdater,
+    ConjuredItemUpdater,
+    GildedRose,
+    Item,
+    ItemUpdaterFactory,
+    NameRegistry,
+    NormalItemUpdater,
+    QualityUpdater,
+    SulfurasUpdater,
+)
+from name_matcher import NameMatcher
+from tests.helpers import DoubleBrieUpdater, ITEM_NAMES
 
 
 class TestGildedRoseNormalItems:
@@ -212,6 +225,109 @@ class TestGildedRoseSulfuras:
         assert items[0].sell_in == initial_sell_in
 
 
+class TestGildedRoseConjuredItems:
+    """Tests for Conjured items, which degrade twice as fast as normal items."""
+
+    @pytest.mark.parametrize("initial_sell_in,initial_quality,expected_quality", [
+        (5, 10, 8),     # Before sell date: -2
+        (0, 10, 6),     # On sell date: -4
+        (-1, 10, 6),    # After sell date: -4
+        (5, 1, 0),      # Never negative
+        (-1, 3, 0),
+        (5, 0, 0),
+    ])
+    def test_conjured_item_degrades_twice_as_fast(self, initial_sell_in, initial_quality, expected_quality):
+        items = [Item("Conjured Mana Cake", initial_sell_in, initial_quality)]
+        GildedRose(items).update_quality()
+
+        assert items[0].quality == expected_quality
+        assert items[0].sell_in == initial_sell_in - 1
+
+    def test_conjured_prefix_is_matched(self):
+        """Any name starting with "Conjured" uses the Conjured strategy."""
+        factory = ItemUpdaterFactory()
+
+        assert isinstance(factory.get_updater("Conjured Mana Cake"), ConjuredItemUpdater)
+        assert isinstance(factory.get_updater("Conjured Elixir"), ConjuredItemUpdater)
+        assert isinstance(factory.get_updater("Mana Cake, Conjured"), NormalItemUpdater)
+        assert not isinstance(factory.get_updater("Mana Cake, Conjured"), ConjuredItemUpdater)
+
+    def test_exact_names_and_longer_prefixes_win(self):
+        factory = ItemUpdaterFactory()
+        brie = AgedBrieUpdater()
+        sulfuras = SulfurasUpdater()
+        factory.register_strategy("Conjured Brie", brie)
+        factory.register_prefix_strategy("Conjured Sulfuras", sulfuras)
+
+        assert factory.get_updater("Conjured Brie") is brie
+        assert factory.get_updater("Conjured Sulfuras, Hand") is sulfuras
+        assert isinstance(factory.get_updater("Conjured Cake"), ConjuredItemUpdater)
+
+    def test_prefix_lookups_are_cached(self):
+        """A prefix name is resolved once, then served from the cache."""
+        factory = ItemUpdaterFactory()
+        factory.get_updater("Conjured Mana Cake")
+        factory._patterns = NameMatcher()
+
+        assert isinstance(factory.get_updater("Conjured Mana Cake"), ConjuredItemUpdater)
+
+
+class TestPatternRouting:
+    """Tests for glob, regex and prefix strategy routing in the factory."""
+
+    def test_any_concert_uses_backstage_pass_rules(self):
+        factory = ItemUpdaterFactory()
+
+        assert isinstance(factory.get_updater("Backstage passes to a Metallica concert"),
+                          BackstagePassUpdater)
+
+    def test_glob_and_regex_strategies(self):
+        factory = ItemUpdaterFactory()
+        brie, sulfuras = AgedBrieUpdater(), SulfurasUpdater()
+        factory.register_glob_strategy("* Cheese, aged ?? years", brie)
+        factory.register_regex_strategy(r"Relic of .+ \(legendary\)", sulfuras)
+
+        assert factory.get_updater("Gouda Cheese, aged 12 years") is brie
+        assert factory.get_updater("Relic of Ragnaros (legendary)") is sulfuras
+        assert isinstance(factory.get_updater("Relic of Ragnaros"), NormalItemUpdater)
+
+    def test_patterns_win_over_prefixes_and_exact_names_over_patterns(self):
+        factory = ItemUpdaterFactory()
+        sulfuras = SulfurasUpdater()
+        factory.register_glob_strategy("* Brie*", sulfuras)
+
+        assert factory.get_updater("Conjured Brie Wheel") is sulfuras
+        assert factory.get_updater("Aged Brie") is not sulfuras
+        assert isinstance(factory.get_updater("Aged Brie"), AgedBrieUpdater)
+
+    def test_patterns_that_cannot_share_an_alternation(self):
+        """Inline global flags and reused group names are valid on their own."""
+        factory = ItemUpdaterFactory()
+        brie, sulfuras = AgedBrieUpdater(), SulfurasUpdater()
+        factory.register_regex_strategy(r"(?P<kind>Relic) of .+", sulfuras)
+        factory.register_regex_strategy(r"(?i)aged .*", brie)
+        factory.register_regex_strategy(r"(?P<kind>Wheel) of .+", brie)
+
+        assert isinstance(factory.get_updater("Elixir"), NormalItemUpdater)
+        assert factory.get_updater("AGED Gouda") is brie
+        assert factory.get_updater("Relic of Fire") is sulfuras
+        assert factory.get_updater("Wheel of Gouda") is brie
+
+    def test_matcher_runs_once_per_distinct_name(self):
+        """Binding many items evaluates the matcher per name, not per item or day."""
+        factory = ItemUpdaterFactory()
+        match = factory._patterns.match
+        calls = []
+        factory._patterns.match = lambda name: calls.append(name) or match(name)
+        items = [Item(f"Conjured Item {index % 100}", 5, 10) for index in range(5000)]
+        gilded_rose = GildedRose(items, updater_factory=factory)
+        for _ in range(3):
+            gilded_rose.update_quality()
+
+        assert len(calls) == 100
+        assert items[0].quality == 4
+
+
 class TestGildedRoseMultipleItems:
     """Tests for multiple items in one update."""
 
@@ -474,5 +590,409 @@ class TestGildedRoseSequentialUpdates:
         assert items[0].sell_in == 4
 
 
+def simulate_day_by_day(name, sell_in, quality, days):
+    """Reference result: call update_quality() once per day."""
+    items = [Item(name, sell_in, quality)]
+    gilded_rose = GildedRose(items)
+    for _ in range(days):
+        gilded_rose.update_quality()
+    return items[0].sell_in, items[0].quality
+
+
+class TestGildedRoseAdvance:
+    """Tests for the closed-form multi-day advance()."""
+
+    @pytest.mark.parametrize("item_name", ITEM_NAMES)
+    @pytest.mark.parametrize("days", [0, 1, 2, 5, 11, 30])
+    def test_advance_matches_daily_updates(self, item_name, days):
+        """advance(days) must equal calling update_quality() days times."""
+        for sell_in in range(-3, 16):
+            for quality in [-2, 0, 1, 2, 5, 25, 47, 49, 50, 51, 80]:
+                items = [Item(item_name, sell_in, quality)]
+                GildedRose(items).advance(days)
+
+                expected = simulate_day_by_day(item_name, sell_in, quality, days)
+                assert (items[0].sell_in, items[0].quality) == expected, (
+                    f"{item_name} sell_in={sell_in} quality={quality} days={days}"
+                )
+
+    def test_advance_backstage_pass_through_concert(self):
+        """Backstage pass advanced past the concert drops to 0."""
+        items = [Item("Backstage passes to a TAFKAL80ETC concert", 15, 20)]
+        GildedRose(items).advance(16)
+
+        assert items[0].quality == 0
+        assert items[0].sell_in == -1
+
+    def test_advance_backstage_pass_sums_tiers(self):
+        """15 days away for 15 days: 5 x 1 + 5 x 2 + 5 x 3 = 30."""
+        items = [Item("Backstage passes to a TAFKAL80ETC concert", 15, 10)]
+        GildedRose(items).advance(15)
+
+        assert items[0].quality == 40
+        assert items[0].sell_in == 0
+
+    def test_advance_custom_strategy_falls_back_to_daily_rules(self):
+        """Strategies without a closed form are replayed day by day."""
+
+        class DoubleSellInUpdater(QualityUpdater):
+            def update_quality(self, item):
+                item.quality = self.clamp_quality(item.quality + 5)
+
+            def update_sell_in(self, item):
+                item.sell_in -= 2
+
+        items = [Item("Custom", 10, 10)]
+        gilded_rose = GildedRose(items)
+        gilded_rose.register_strategy("Custom", DoubleSellInUpdater())
+        gilded_rose.advance(3)
+
+        assert items[0].sell_in == 4
+        assert items[0].quality == 25
+
+    def test_advance_subclass_of_built_in_falls_back_to_daily_rules(self):
+        """A subclass redefining a built-in's rules does not inherit its closed form."""
+        items = [Item("Aged Brie", 10, 0)]
+        gilded_rose = GildedRose(items)
+        gilded_rose.register_strategy("Aged Brie", DoubleBrieUpdater())
+        gilded_rose.advance(5)
+
+        assert (items[0].sell_in, items[0].quality) == (5, 10)
+
+    def test_advance_rejects_negative_days(self):
+        """Negative day counts are rejected."""
+        with pytest.raises(ValueError):
+            GildedRose([Item("Normal Item", 1, 1)]).advance(-1)
+
+
+class TestItemUpdaterFactory:
+    """Tests for strategy lookup and caching."""
+
+    def test_unknown_names_share_one_default_updater(self):
+        """The default strategy is not allocated per lookup."""
+        factory = ItemUpdaterFactory()
+        updater = factory.get_updater("Normal Item")
+
+        assert isinstance(updater, NormalItemUpdater)
+        assert factory.get_updater("Another Item") is updater
+        assert factory.get_updater("Normal Item") is updater
+
+    def test_known_names_return_registered_instance(self):
+        """Repeated lookups return the same strategy instance."""
+        factory = ItemUpdaterFactory()
+
+        assert factory.get_updater("Aged Brie") is factory.get_updater("Aged Brie")
+
+    def test_register_strategy_invalidates_cached_names(self):
+        """A cached default is replaced once a strategy is registered."""
+        factory = ItemUpdaterFactory()
+        factory.get_updater("Custom")
+        custom = AgedBrieUpdater()
+        factory.register_strategy("Custom", custom)
+
+        assert factory.get_updater("Custom") is custom
+
+    def test_resolved_name_cache_is_bounded(self):
+        """Open-ended item names cannot grow the cache without limit."""
+        factory = ItemUpdaterFactory()
+        for index in range(factory.MAX_RESOLVED_NAMES * 2 + 1):
+            factory.get_updater(f"Item {index}")
+
+        assert len(factory._resolved) <= factory.MAX_RESOLVED_NAMES
+
+    def test_map_strategies_replaces_every_strategy_once(self):
+        """Shared strategies, including the default, are transformed once each."""
+        factory = ItemUpdaterFactory()
+        brie = factory.get_updater("Aged Brie")
+        factory.register_strategy("Aged Cheddar", brie)
+        seen = []
+
+        def wrap(updater):
+            seen.append(updater)
+            return AgedBrieUpdater()
+
+        factory.map_strategies(wrap)
+
+        assert len(seen) == 5  # Three named strategies, the Conjured prefix, the default
+        assert factory.get_updater("Aged Brie") is factory.get_updater("Aged Cheddar")
+        assert factory.get_updater("Aged Brie") is not brie
+        assert isinstance(factory.get_updater("Normal Item"), AgedBrieUpdater)
+
+
+class TestGildedRoseStrategyBinding:
+    """Tests for the per-item strategy binding kept by GildedRose."""
+
+    def test_items_are_bound_once_at_construction(self):
+        """Each item is paired with its strategy in a parallel list."""
+        items = [Item("Normal Item", 5, 10), Item("Aged Brie", 5, 10)]
+        gilded_rose = GildedRose(items)
+
+        assert [type(updater) for updater in gilded_rose._updaters] == [
+            NormalItemUpdater,
+            AgedBrieUpdater,
+        ]
+
+    def test_add_item_binds_new_item(self):
+        """Items added later are updated by their own strategy."""
+        gilded_rose = GildedRose([Item("Normal Item", 5, 10)])
+        gilded_rose.add_item(Item("Aged Brie", 5, 10))
+        gilded_rose.update_quality()
+
+        assert [item.quality for item in gilded_rose.items] == [9, 11]
+
+    def test_items_appended_directly_are_picked_up(self):
+        """Appending to the shared list still updates the new item correctly."""
+        items = [Item("Normal Item", 5, 10)]
+        gilded_rose = GildedRose(items)
+        items.append(Item("Aged Brie", 5, 10))
+        gilded_rose.update_quality()
+
+        assert [item.quality for item in items] == [9, 11]
+
+    def test_replacing_items_rebinds(self):
+        """Assigning a new item list binds the new items."""
+        gilded_rose = GildedRose([Item("Normal Item", 5, 10)])
+        gilded_rose.items = [Item("Aged Brie", 5, 10)]
+        gilded_rose.update_quality()
+
+        assert gilded_rose.items[0].quality == 11
+
+    def test_register_strategy_rebinds_existing_items(self):
+        """A strategy registered later applies to items already bound."""
+        items = [Item("Custom", 5, 10)]
+        gilded_rose = GildedRose(items)
+        gilded_rose.register_strategy("Custom", AgedBrieUpdater())
+        gilded_rose.update_quality()
+
+        assert items[0].quality == 11
+
+
+class TestNameRegistry:
+    """Tests for name interning and id-based dispatch."""
+
+    def test_intern_assigns_stable_small_ids(self):
+        """Each distinct name gets the next id; repeats reuse it."""
+        registry = NameRegistry()
+
+        assert [registry.intern(name) for name in ["a", "b", "a", "c"]] == [0, 1, 0, 2]
+        assert registry.name_of(1) == "b"
+        assert len(registry) == 3
+        assert "c" in registry
+
+    def test_factory_dispatches_by_id(self):
+        """Ids map to the same strategies as names."""
+        factory = ItemUpdaterFactory()
+        brie_id = factory.names.intern("Aged Brie")
+        normal_id = factory.names.intern("Normal Item")
+
+        assert factory.get_updater_by_id(brie_id) is factory.get_updater("Aged Brie")
+        assert isinstance(factory.get_updater_by_id(normal_id), NormalItemUpdater)
+
+    def test_register_strategy_refreshes_id_table(self):
+        """Id dispatch follows newly registered strategies."""
+        factory = ItemUpdaterFactory()
+        custom_id = factory.names.intern("Custom")
+        factory.get_updater_by_id(custom_id)
+        custom = AgedBrieUpdater()
+        factory.register_strategy("Custom", custom)
+
+        assert factory.get_updater_by_id(custom_id) is custom
+
+    def test_gilded_rose_interns_each_name_once(self):
+        """Items with the same name share one registry entry."""
+        items = [Item("Normal Item", day, 10) for day in range(5)]
+        factory = ItemUpdaterFactory()
+        gilded_rose = GildedRose(items, updater_factory=factory)
+
+        assert list(gilded_rose._name_ids) == [0] * 5
+        assert len(factory.names) == 1
+
+
+class TestLinearWindow:
+    """Tests for the per-strategy regime description used by simulators."""
+
+    @pytest.mark.parametrize("item_name", ITEM_NAMES)
+    def test_window_matches_daily_updates(self, item_name):
+        """Inside a window every day changes sell_in and quality by the stated amounts."""
+        updater = ItemUpdaterFactory().get_updater(item_name)
+        for sell_in in range(-3, 16):
+            for quality in [-1, 0, 1, 2, 3, 25, 47, 48, 49, 50, 51, 80]:
+                sell_in_change, quality_change, days = updater.linear_window(sell_in, quality)
+                item = Item(item_name, sell_in, quality)
+                for day in range(1, min(days, 40) + 1):
+                    updater.update_quality(item)
+                    updater.update_sell_in(item)
+                    assert (item.sell_in, item.quality) == (
+                        sell_in + sell_in_change * day,
+                        quality + quality_change * day,
+                    ), f"{item_name} sell_in={sell_in} quality={quality} day={day}"
+
+    def test_frozen_items(self):
+        """Only items no update can change are frozen."""
+        assert SulfurasUpdater().is_frozen(Item("Sulfuras", 0, 80))
+        assert not NormalItemUpdater().is_frozen(Item("Normal Item", 5, 0))
+        assert not AgedBrieUpdater().is_frozen(Item("Aged Brie", -3, 50))
+
+    def test_custom_strategies_have_no_window(self):
+        """Without a linear window custom strategies are never skipped."""
+
+        class CustomUpdater(QualityUpdater):
+            def update_quality(self, item):
+                pass
+
+            def update_sell_in(self, item):
+                pass
+
+        updater = CustomUpdater()
+
+        assert updater.linear_window(5, 0) == (0, 0, 0)
+        assert not updater.is_frozen(Item("Custom", 5, 0))
+
+
+class TestFusedStep:
+    """Tests for the single-call step() contract."""
+
+    @pytest.mark.parametrize("item_name", ITEM_NAMES)
+    def test_step_matches_daily_rules(self, item_name):
+        updater = ItemUpdaterFactory().get_updater(item_name)
+        assert updater.has_native_step()
+        for sell_in in range(-3, 16):
+            for quality in [-2, 0, 1, 2, 3, 4, 25, 48, 49, 50, 51, 52, 60, 80]:
+                item = Item(item_name, sell_in, quality)
+                updater.update_quality(item)
+                updater.update_sell_in(item)
+
+                assert updater.step(sell_in, quality) == (item.sell_in, item.quality), (
+                    f"{item_name} sell_in={sell_in} quality={quality}"
+                )
+
+    def test_step_is_derived_for_legacy_strategies(self):
+        updater = DoubleBrieUpdater()
+
+        assert not updater.has_native_step()
+        assert updater.step(5, 10) == (4, 12)
+
+    def test_gilded_rose_keeps_legacy_overrides(self):
+        """A subclass overriding only the daily rules is not routed to its parent's step."""
+        items = [Item("Aged Brie", 5, 10), Item("Normal Item", 5, 10)]
+        gilded_rose = GildedRose(items)
+        gilded_rose.register_strategy("Aged Brie", DoubleBrieUpdater())
+        gilded_rose.update_quality()
+
+        assert [(item.sell_in, item.quality) for item in items] == [(4, 12), (4, 9)]
+
+    def test_overriding_rules_resets_every_fused_method(self):
+        """Advance and the linear window fall back to the generic versions too."""
+        updater = DoubleBrieUpdater()
+
+        for method_name in QualityUpdater.FUSED_METHODS:
+            assert getattr(DoubleBrieUpdater, method_name) is getattr(QualityUpdater, method_name)
+        assert updater.linear_window(10, 0) == (0, 0, 0)
+        assert not updater.is_frozen(Item("Aged Brie", 5, 50))
+
+    def test_overriding_clamp_quality_redefines_the_rules(self):
+        """A different clamp is not bypassed by the parent's closed form."""
+        class CappedNormalUpdater(NormalItemUpdater):
+            def clamp_quality(self, quality):
+                return max(0, min(quality, 30))
+
+        items = [Item("Normal Item", 5, 40)]
+        gilded_rose = GildedRose(items)
+        gilded_rose.register_strategy("Normal Item", CappedNormalUpdater())
+        gilded_rose.update_quality()
+        gilded_rose.advance(2)
+
+        assert not CappedNormalUpdater().has_native_step()
+        assert (items[0].sell_in, items[0].quality) == (2, 28)
+
+    def test_overriding_a_rule_helper_redefines_the_rules(self):
+        """Private helpers of the built-ins count as rules."""
+        class SpoilingBrieUpdater(AgedBrieUpdater):
+            def _improve_quality_additional_after_expiration(self, item):
+                item.quality = self.clamp_quality(item.quality - 10)
+
+        items = [Item("Aged Brie", 2, 50)]
+        gilded_rose = GildedRose(items)
+        gilded_rose.register_strategy("Aged Brie", SpoilingBrieUpdater())
+        gilded_rose.advance(4)
+
+        assert (items[0].sell_in, items[0].quality) == (-2, 31)
+
+
+class TestUpdateBatch:
+    """Tests for the per-strategy batch entry point."""
+
+    @pytest.mark.parametrize("item_name", ITEM_NAMES)
+    def test_batch_matches_daily_rules(self, item_name):
+        updater = ItemUpdaterFactory().get_updater(item_name)
+        states = [(sell_in, quality) for sell_in in range(-3, 16)
+                  for quality in [-2, 0, 1, 2, 3, 4, 25, 48, 49, 50, 51, 52, 60, 80]]
+        batch = [Item(item_name, sell_in, quality) for sell_in, quality in states]
+        updater.update_batch(batch)
+
+        for (sell_in, quality), item in zip(states, batch):
+            expected = Item(item_name, sell_in, quality)
+            updater.update_quality(expected)
+            updater.update_sell_in(expected)
+            assert (item.sell_in, item.quality) == (expected.sell_in, expected.quality)
+
+    def test_custom_strategies_fall_back_to_per_item_calls(self):
+        class CountingUpdater(QualityUpdater):
+            def __init__(self):
+                self.calls = 0
+
+            def update_quality(self, item):
+                self.calls += 1
+                item.quality = self.clamp_quality(item.quality + 5)
+
+            def update_sell_in(self, item):
+                self.decrease_sell_in(item)
+
+        updater = CountingUpdater()
+        items = [Item("Custom", 5, 10), Item("Normal Item", 5, 10), Item("Custom", 1, 48)]
+        gilded_rose = GildedRose(items)
+        gilded_rose.register_strategy("Custom", updater)
+        gilded_rose.update_quality()
+
+        assert updater.calls == 2
+        assert [(item.sell_in, item.quality) for item in items] == [(4, 15), (4, 9), (0, 50)]
+
+    def test_subclass_overriding_rules_does_not_inherit_the_batch_loop(self):
+        items = [Item("Aged Brie", 5, 10)]
+        DoubleBrieUpdater().update_batch(items)
+
+        assert (items[0].sell_in, items[0].quality) == (4, 12)
+
+    def test_groups_follow_added_items(self):
+        items = [Item("Aged Brie", 5, 10)]
+        gilded_rose = GildedRose(items)
+        gilded_rose.add_item(Item("Aged Brie", 3, 10))
+        items.append(Item("Normal Item", 3, 10))
+        gilded_rose.update_quality()
+
+        assert [(item.sell_in, item.quality) for item in items] == [(4, 11), (2, 11), (2, 9)]
+
+    def test_groups_follow_replaced_items(self):
+        """A slot assigned a new item is aged, with the new item's strategy."""
+        items = [Item("Aged Brie", 5, 10), Item("Normal Item", 5, 10)]
+        gilded_rose = GildedRose(items)
+        gilded_rose.update_quality()
+        items[0] = Item("Normal Item", 3, 20)
+        gilded_rose.update_quality()
+
+        assert [(item.sell_in, item.quality) for item in items] == [(2, 19), (3, 8)]
+
+    def test_groups_follow_remove_and_append(self):
+        """Removing one item and appending another keeps the length but not the rows."""
+        items = [Item("Aged Brie", 5, 10), Item("Normal Item", 5, 10)]
+        gilded_rose = GildedRose(items)
+        gilded_rose.update_quality()
+        items.remove(items[0])
+        items.append(Item("Aged Brie", 3, 20))
+        gilded_rose.update_quality()
+
+        assert [(item.sell_in, item.quality) for item in items] == [(3, 8), (2, 21)]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
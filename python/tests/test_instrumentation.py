@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+from gilded_rose import GildedRose, Item
+from instrumentation import UpdateInstrumentation
+from tests.helpers import as_tuples, sample_items
+
+
+BACKSTAGE_PASS = "Backstage passes to a TAFKAL80ETC concert"
+
+
+class TestUpdateInstrumentation:
+    """Tests for the optional update_quality instrumentation."""
+
+    def test_instrumented_update_matches_plain_update(self):
+        """Instrumentation does not change the outcome."""
+        items = sample_items()
+        expected = sample_items()
+        instrumented = GildedRose(items, instrumentation=UpdateInstrumentation())
+        plain = GildedRose(expected)
+
+        for _ in range(15):
+            instrumented.update_quality()
+            plain.update_quality()
+
+        assert as_tuples(items) == as_tuples(expected)
+
+    def test_counters_per_strategy(self):
+        """Processed items, clamps, expirations and drops are counted."""
+        instrumentation = UpdateInstrumentation()
+        GildedRose(sample_items(), instrumentation=instrumentation).update_quality()
+        counters = {name: c.as_dict() for name, c in instrumentation.counters.items()}
+
+        assert counters["NormalItemUpdater"] == {
+            "processed": 4, "clamps": 1, "expirations": 1, "backstage_drops": 0,
+        }
+        assert counters["AgedBrieUpdater"]["clamps"] == 1
+        assert counters["BackstagePassUpdater"] == {
+            "processed": 3, "clamps": 1, "expirations": 1, "backstage_drops": 1,
+        }
+        assert counters["SulfurasUpdater"]["processed"] == 1
+
+    def test_counters_accumulate_across_calls(self):
+        """Cumulative counters grow while each report covers one call."""
+        instrumentation = UpdateInstrumentation()
+        gilded_rose = GildedRose([Item("Normal Item", 5, 10)], instrumentation=instrumentation)
+        gilded_rose.update_quality()
+        gilded_rose.update_quality()
+
+        assert instrumentation.calls == 2
+        assert instrumentation.counters["NormalItemUpdater"].processed == 2
+        assert instrumentation.last_report.counters["NormalItemUpdater"].processed == 1
+        assert instrumentation.total_seconds >= instrumentation.last_report.duration >= 0
+
+    def test_hooks_receive_reports(self):
+        """Hooks are called after every update with the call's report."""
+        instrumentation = UpdateInstrumentation()
+        reports = []
+        instrumentation.add_hook(reports.append)
+        gilded_rose = GildedRose(sample_items(), instrumentation=instrumentation)
+        gilded_rose.update_quality()
+        instrumentation.remove_hook(reports.append)
+        gilded_rose.update_quality()
+
+        assert len(reports) == 1
+        assert reports[0].items == 11
+
+    def test_disabled_by_default(self):
+        """Without instrumentation GildedRose runs the plain loop."""
+        assert GildedRose([]).instrumentation is None
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+from gilded_rose import GildedRose, Item, QualityUpdater
+from instrumentation import UpdateInstrumentation
+from inventory_index import InventoryIndex
+from tests.helpers import DoubleBrieUpdater, random_items
+
+
+class SkipTwoDaysUpdater(QualityUpdater):
+    """Custom strategy whose sell_in does not move by exactly one."""
+
+    def update_quality(self, item):
+        item.quality = self.clamp_quality(item.quality - 3)
+
+    def update_sell_in(self, item):
+        item.sell_in -= 2
+
+
+def scan(items, sell_in_min=None, sell_in_max=None, quality_min=None, quality_max=None):
+    """Reference answer: a linear scan."""
+    def within(value, low, high):
+        return (low is None or value >= low) and (high is None or value <= high)
+
+    return [
+        item for item in items
+        if within(item.sell_in, sell_in_min, sell_in_max)
+        and within(item.quality, quality_min, quality_max)
+    ]
+
+
+QUERIES = [
+    {"sell_in_min": 0, "sell_in_max": 3},
+    {"sell_in_max": -1},
+    {"quality_max": 9},
+    {"quality_min": 45},
+    {"sell_in_min": 2, "sell_in_max": 10, "quality_min": 10, "quality_max": 30},
+]
+
+
+class TestInventoryIndex:
+    """Tests for the sell_in/quality range index."""
+
+    def test_queries_match_linear_scan_across_days(self):
+        """The index stays correct while GildedRose updates the items."""
+        items = random_items(400, seed=13)
+        index = InventoryIndex()
+        gilded_rose = GildedRose(items, index=index)
+
+        for _ in range(20):
+            for query in QUERIES:
+                assert index.query(**query) == scan(items, **query), query
+            gilded_rose.update_quality()
+
+    def test_combines_with_instrumentation(self):
+        """An instrumented day is indexed like a plain one."""
+        items = random_items(300, seed=13)
+        index, instrumentation = InventoryIndex(), UpdateInstrumentation()
+        gilded_rose = GildedRose(items, instrumentation=instrumentation, index=index)
+
+        for _ in range(10):
+            gilded_rose.update_quality()
+            for query in QUERIES:
+                assert index.query(**query) == scan(items, **query), query
+        assert instrumentation.calls == 10
+
+    def test_category_filter(self):
+        """Queries can be limited to one strategy category."""
+        items = random_items(200, seed=13)
+        index = InventoryIndex()
+        GildedRose(items, index=index).update_quality()
+        passes = [item for item in items if item.name.startswith("Backstage")]
+
+        assert index.expiring_within(5, category="BackstagePassUpdater") == scan(passes, 0, 5)
+        assert index.query(category="UnknownUpdater") == []
+
+    def test_convenience_queries(self):
+        """expiring_within and below_quality use inclusive/exclusive bounds."""
+        items = [Item("Normal Item", 3, 9), Item("Normal Item", 4, 10), Item("Normal Item", -1, 5)]
+        index = InventoryIndex()
+        GildedRose(items, index=index)
+
+        assert index.expiring_within(3) == [items[0]]
+        assert index.below_quality(10) == [items[0], items[2]]
+
+    def test_index_follows_add_item_and_advance(self):
+        """Items added later and multi-day jumps are reflected."""
+        items = random_items(50, seed=13)
+        index = InventoryIndex()
+        gilded_rose = GildedRose(items, index=index)
+        gilded_rose.add_item(Item("Aged Brie", 2, 40))
+        gilded_rose.advance(4)
+        gilded_rose.update_quality()
+
+        for query in QUERIES:
+            assert index.query(**query) == scan(items, **query), query
+
+    def test_custom_strategy_is_rekeyed(self):
+        """Items whose sell_in moves by more than one stay correctly indexed."""
+        items = [Item("Custom", 10, 20), Item("Normal Item", 10, 20)]
+        index = InventoryIndex()
+        gilded_rose = GildedRose(items, index=index)
+        gilded_rose.register_strategy("Custom", SkipTwoDaysUpdater())
+
+        for _ in range(3):
+            gilded_rose.update_quality()
+
+        assert index.query(sell_in_min=4, sell_in_max=4) == [items[0]]
+        assert index.query(quality_min=11, quality_max=11) == [items[0]]
+
+    def test_overriding_subclass_is_not_frozen_by_its_parent(self):
+        items = [Item("Aged Brie", 10, 0)]
+        index = InventoryIndex()
+        gilded_rose = GildedRose(items, index=index)
+        gilded_rose.register_strategy("Aged Brie", DoubleBrieUpdater())
+        gilded_rose.advance(5)
+
+        assert (items[0].sell_in, items[0].quality) == (5, 10)
+        assert index.query(sell_in_min=5, sell_in_max=5, quality_min=10, quality_max=10) == items
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from gilded_rose import GildedRose, Item
+from inventory_service import InventoryService, LatencyHistogram, run_batch, start_server
+from tests.helpers import DoubleBrieUpdater, as_tuples, sample_items
+
+
+def state_after(days):
+    items = sample_items()
+    GildedRose(items).advance(days)
+    return as_tuples(items)
+
+
+class TestInventoryService:
+    """Tests for batching and latency tracking in the asyncio service."""
+
+    def test_concurrent_updates_are_coalesced(self):
+        async def scenario():
+            service = InventoryService(batch_window=0.01)
+            service.create("main", sample_items())
+            days = await asyncio.gather(*(service.update("main") for _ in range(10)))
+            return service, days, await service.query("main")
+
+        service, days, (day, rows) = asyncio.run(scenario())
+
+        assert days == list(range(1, 11))
+        assert (day, rows) == (10, state_after(10))
+        assert service.batches == 2  # The ten updates, then the query
+        assert service.latency["update"].count == 10
+
+    def test_queries_see_their_place_in_the_batch(self):
+        async def scenario():
+            service = InventoryService(batch_window=0.01)
+            service.create("main", sample_items())
+            return await asyncio.gather(
+                service.update("main", 3), service.query("main"),
+                service.update("main", 2), service.query("main"),
+            )
+
+        results = asyncio.run(scenario())
+
+        assert results == [3, (3, state_after(3)), 5, (5, state_after(5))]
+
+    def test_heavy_batches_run_in_the_executor(self):
+        async def scenario(executor):
+            service = InventoryService(executor=executor, offload_threshold=0)
+            service.create("main", sample_items())
+            await service.update("main", 4)
+            return await service.query("main")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert asyncio.run(scenario(executor)) == (4, state_after(4))
+
+    def test_process_pool_results_reach_the_inventory(self):
+        """Batches aged in another process are applied to the served items."""
+        items = sample_items()
+
+        async def scenario(executor):
+            service = InventoryService(executor=executor, offload_threshold=0)
+            service.create("main", items)
+            await service.update("main", 4)
+            await service.update("main", 2)
+            return await service.query("main")
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            assert asyncio.run(scenario(executor)) == (6, state_after(6))
+        assert as_tuples(items) == state_after(6)
+
+    def test_errors(self):
+        async def scenario():
+            service = InventoryService()
+            service.create("main", sample_items())
+            with pytest.raises(ValueError):
+                service.create("main", [])
+            with pytest.raises(KeyError):
+                await service.update("missing")
+            with pytest.raises(ValueError):
+                await service.update("main", -1)
+
+        asyncio.run(scenario())
+
+    def test_run_batch_merges_consecutive_updates(self):
+        items = sample_items()
+        results = run_batch(GildedRose(items), 7, [("update", 1), ("update", 2)])
+
+        assert results == [8, 10]
+        assert as_tuples(items) == state_after(3)
+
+    def test_run_batch_uses_overriding_subclass_rules(self):
+        """Merged updates go through the subclass' own rules."""
+        items = [Item("Aged Brie", 10, 0)]
+        gilded_rose = GildedRose(items)
+        gilded_rose.register_strategy("Aged Brie", DoubleBrieUpdater())
+        results = run_batch(gilded_rose, 0, [("update", 2), ("update", 3), ("query", None)])
+
+        assert results == [2, 5, (5, [("Aged Brie", 5, 10)])]
+
+
+class TestLatencyHistogram:
+    def test_buckets_and_percentiles(self):
+        histogram = LatencyHistogram(bounds=(1, 10))
+        for seconds in (0.0005, 0.0005, 0.005, 0.5):
+            histogram.record(seconds)
+
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.percentile(0.5) == 1
+        assert histogram.percentile(0.75) == 10
+        assert histogram.percentile(1.0) == float("inf")
+        assert histogram.as_dict()["count"] == 4
+
+
+class TestJsonLinesServer:
+    def test_round_trip_over_a_socket(self):
+        async def scenario():
+            server = await start_server(InventoryService(), port=0)
+            host, port = server.sockets[0].getsockname()[:2]
+            reader, writer = await asyncio.open_connection(host, port)
+            requests = [
+                {"op": "create", "inventory": "main",
+                 "items": [list(row) for row in as_tuples(sample_items())]},
+                {"op": "update", "inventory": "main", "days": 2},
+                {"op": "query", "inventory": "main"},
+                {"op": "query", "inventory": "missing"},
+                {"op": "stats"},
+            ]
+            responses = []
+            for request in requests:
+                writer.write(json.dumps(request).encode("utf-8") + b"\n")
+                await writer.drain()
+                responses.append(json.loads(await reader.readline()))
+            writer.close()
+            await writer.wait_closed()
+            server.close()
+            await server.wait_closed()
+            return responses
+
+        created, updated, queried, missing, stats = asyncio.run(scenario())
+
+        assert created == {"ok": True}
+        assert updated == {"ok": True, "day": 2}
+        assert queried["day"] == 2
+        assert [tuple(row) for row in queried["items"]] == state_after(2)
+        assert missing["ok"] is False
+        assert stats["stats"]["latency"]["query"]["count"] == 1
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from gilded_rose import GildedRose, Item
+from item_store import ItemStore
+from inventory_snapshot import load_snapshot, read_snapshot_header, save_snapshot
+from tests.helpers import as_tuples, sample_items
+
+
+class TestInventorySnapshot:
+    """Tests for the binary snapshot format."""
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_round_trip(self, tmp_path, compress):
+        """Items, including non-ASCII names, come back unchanged."""
+        path = str(tmp_path / "inventory.grs")
+        save_snapshot(sample_items(), path, compress=compress, day=12)
+        header = read_snapshot_header(path)
+
+        assert as_tuples(load_snapshot(path)) == as_tuples(sample_items())
+        assert (header.count, header.name_count, header.day) == (11, 8, 12)
+        assert header.compressed == compress
+
+    def test_names_are_stored_once(self, tmp_path):
+        """Repeated names share one string table entry."""
+        path = tmp_path / "inventory.grs"
+        save_snapshot([Item("Aged Brie", day, 0) for day in range(1000)], str(path))
+
+        assert path.stat().st_size < 1000 * 3 * 4 + 100
+
+    def test_compression_shrinks_repetitive_inventories(self, tmp_path):
+        """The compressed form is smaller for typical inventories."""
+        items = [Item("Aged Brie", 5, 10) for _ in range(1000)]
+        plain, compressed = tmp_path / "plain.grs", tmp_path / "compressed.grs"
+        save_snapshot(items, str(plain))
+        save_snapshot(items, str(compressed), compress=True)
+
+        assert compressed.stat().st_size < plain.stat().st_size / 10
+
+    def test_loaded_store_works_with_gilded_rose(self, tmp_path):
+        """A mapped snapshot is updated in memory without touching the file."""
+        path = str(tmp_path / "inventory.grs")
+        save_snapshot(sample_items(), path)
+        store = load_snapshot(path)
+        expected = sample_items()
+        GildedRose(store).advance(3)
+        GildedRose(expected).advance(3)
+
+        assert as_tuples(store) == as_tuples(expected)
+        assert as_tuples(load_snapshot(path)) == as_tuples(sample_items())
+
+    def test_loaded_store_accepts_new_items(self, tmp_path):
+        """Adding to a mapped snapshot copies its columns out of the mapping."""
+        path = str(tmp_path / "inventory.grs")
+        save_snapshot(sample_items(), path)
+        gilded_rose = GildedRose(load_snapshot(path))
+        gilded_rose.add_item(Item("Aged Brie", 5, 10))
+        gilded_rose.update_quality()
+        expected = sample_items() + [Item("Aged Brie", 5, 10)]
+        GildedRose(expected).update_quality()
+
+        assert as_tuples(gilded_rose.items) == as_tuples(expected)
+        assert as_tuples(load_snapshot(path)) == as_tuples(sample_items())
+
+    def test_item_store_is_saved_from_its_columns(self, tmp_path):
+        """ItemStore inventories are written directly."""
+        path = str(tmp_path / "inventory.grs")
+        save_snapshot(ItemStore.from_items(sample_items()), path)
+
+        assert as_tuples(load_snapshot(path)) == as_tuples(sample_items())
+
+    def test_rejects_other_files(self, tmp_path):
+        """Files without the snapshot magic number are rejected."""
+        path = tmp_path / "inventory.csv"
+        path.write_text("name,sell_in,quality\nAged Brie,1,1\n")
+
+        with pytest.raises(ValueError):
+            load_snapshot(str(path))
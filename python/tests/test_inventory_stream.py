@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+import io
+
+import pytest
+
+from gilded_rose import GildedRose, Item, ItemUpdaterFactory
+from inventory_stream import (
+    age_file,
+    read_csv,
+    read_jsonl,
+    update_stream,
+    write_csv,
+    write_jsonl,
+)
+from tests.helpers import DoubleBrieUpdater, as_tuples, sample_items
+
+
+class TestUpdateStream:
+    """Tests for the streaming update."""
+
+    def test_stream_matches_gilded_rose(self):
+        """Streaming N days equals GildedRose.advance(N)."""
+        expected = sample_items()
+        GildedRose(expected).advance(6)
+
+        assert as_tuples(update_stream(sample_items(), days=6)) == as_tuples(expected)
+
+    def test_stream_uses_overriding_subclass_rules(self):
+        """A subclass redefining its parent's rules is not aged by the parent's closed form."""
+        factory = ItemUpdaterFactory()
+        factory.register_strategy("Aged Brie", DoubleBrieUpdater())
+        aged = list(update_stream([Item("Aged Brie", 10, 0)], days=5, updater_factory=factory))
+
+        assert as_tuples(aged) == [("Aged Brie", 5, 10)]
+
+    def test_stream_is_lazy(self):
+        """Items are pulled from the source only as the output is consumed."""
+        pulled = []
+
+        def source():
+            for item in sample_items():
+                pulled.append(item.name)
+                yield item
+
+        stream = update_stream(source())
+        next(stream)
+
+        assert pulled == ["+5 Dexterity Vest"]
+
+    def test_stream_rejects_negative_days(self):
+        """Negative day counts are rejected."""
+        with pytest.raises(ValueError):
+            list(update_stream(sample_items(), days=-1))
+
+
+class TestInventoryFormats:
+    """Tests for the CSV and JSON Lines readers and writers."""
+
+    @pytest.mark.parametrize("reader,writer", [(read_csv, write_csv), (read_jsonl, write_jsonl)])
+    def test_round_trip(self, reader, writer):
+        """Written items are read back unchanged, across chunk boundaries."""
+        buffer = io.StringIO()
+        written = writer(sample_items(), buffer, chunk_size=3)
+        buffer.seek(0)
+
+        assert written == 11
+        assert as_tuples(reader(buffer)) == as_tuples(sample_items())
+
+    def test_csv_layout(self):
+        """CSV output has a header and one row per item."""
+        buffer = io.StringIO()
+        write_csv([Item("Aged Brie", 2, 0)], buffer)
+
+        assert buffer.getvalue() == "name,sell_in,quality\nAged Brie,2,0\n"
+
+    def test_age_file_converts_between_formats(self, tmp_path):
+        """A CSV file is aged into a JSON Lines file."""
+        source = tmp_path / "inventory.csv"
+        target = tmp_path / "aged.jsonl"
+        with open(source, "w", newline="") as handle:
+            write_csv(sample_items(), handle)
+
+        age_file(str(source), str(target), days=3)
+        expected = sample_items()
+        GildedRose(expected).advance(3)
+
+        with open(target) as handle:
+            assert as_tuples(read_jsonl(handle)) == as_tuples(expected)
+
+    def test_age_file_rejects_unknown_format(self, tmp_path):
+        """Only .csv and .jsonl are supported."""
+        with pytest.raises(ValueError):
+            age_file(str(tmp_path / "inventory.txt"), str(tmp_path / "out.csv"), days=1)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from gilded_rose import CompactItem, GildedRose, Item
+from item_store import ItemStore
+from tests.helpers import sample_items
+
+
+class TestCompactItem:
+    """Tests for the __slots__ Item variant."""
+
+    def test_compact_item_has_no_instance_dict(self):
+        """Fields live in slots, not in a per-instance __dict__."""
+        item = CompactItem("Normal Item", 5, 10)
+
+        assert not hasattr(item, "__dict__")
+        assert (item.name, item.sell_in, item.quality) == ("Normal Item", 5, 10)
+
+    def test_compact_item_representation(self):
+        """Representation matches Item."""
+        assert repr(CompactItem("Test Item", 5, 25)) == repr(Item("Test Item", 5, 25))
+
+    def test_compact_items_work_with_gilded_rose(self):
+        """GildedRose updates CompactItem like Item."""
+        items = [CompactItem("Aged Brie", 1, 10)]
+        GildedRose(items).advance(2)
+
+        assert (items[0].sell_in, items[0].quality) == (-1, 13)
+
+
+class TestItemStore:
+    """Tests for the array-backed item store."""
+
+    def test_names_are_interned(self):
+        """Duplicate names are stored once in the string table."""
+        store = ItemStore.from_items(sample_items())
+
+        assert len(store) == 11
+        assert len(store.names) == 8
+        assert list(store.name_ids) == [0, 1, 2, 3, 4, 5, 5, 5, 1, 6, 7]
+
+    def test_views_read_and_write_through(self):
+        """Writes through a view land in the buffers."""
+        store = ItemStore()
+        view = store.add("Normal Item", 3, 4)
+        view.quality = 9
+        view.sell_in -= 1
+
+        assert (store[0].sell_in, store[0].quality) == (2, 9)
+        assert repr(store[-1]) == "Normal Item, 2, 9"
+
+    def test_index_out_of_range(self):
+        """Indexing past the end raises IndexError."""
+        with pytest.raises(IndexError):
+            ItemStore()[0]
+
+    def test_gilded_rose_on_store_matches_list(self):
+        """A store is drop-in for GildedRose, daily and multi-day."""
+        items = sample_items()
+        store = ItemStore.from_items(sample_items())
+        gilded_rose_items = GildedRose(items)
+        gilded_rose_store = GildedRose(store)
+
+        for _ in range(12):
+            gilded_rose_items.update_quality()
+            gilded_rose_store.update_quality()
+        gilded_rose_items.advance(5)
+        gilded_rose_store.advance(5)
+
+        assert [repr(item) for item in store] == [repr(item) for item in items]
+
+    def test_add_item_appends_to_store(self):
+        """GildedRose.add_item works on a store."""
+        store = ItemStore()
+        gilded_rose = GildedRose(store)
+        gilded_rose.add_item(Item("Aged Brie", 5, 10))
+        gilded_rose.update_quality()
+
+        assert repr(store.to_items()[0]) == "Aged Brie, 4, 11"
+
+    def test_fixed_size_buffers_reject_new_rows(self):
+        """A store over foreign buffers is never silently detached from them."""
+        source = ItemStore.from_items(sample_items())
+        sell_in = memoryview(source.sell_in)
+        store = ItemStore.from_buffers(source.names, source.name_ids, sell_in, source.quality)
+
+        with pytest.raises(ValueError):
+            GildedRose(store).add_item(Item("Aged Brie", 5, 10))
+        assert len(store) == len(sample_items())
+
+    def test_growable_buffers_are_copied_on_first_append(self):
+        source = ItemStore.from_items(sample_items())
+        store = ItemStore.from_buffers(
+            source.names, memoryview(source.name_ids), memoryview(source.sell_in),
+            memoryview(source.quality), growable=True,
+        )
+        store.append(Item("Aged Brie", 5, 10))
+        store[0].quality = 1
+
+        assert len(store) == len(sample_items()) + 1
+        assert repr(store[-1]) == "Aged Brie, 5, 10"
+        assert source[0].quality == sample_items()[0].quality
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from gilded_rose import GildedRose, Item, QualityUpdater
+from inventory_snapshot import load_snapshot, read_snapshot_header, save_snapshot
+from mapped_inventory import MappedInventory
+from tests.helpers import DoubleBrieUpdater, as_tuples, sample_items
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    path = str(tmp_path / "inventory.grs")
+    save_snapshot(sample_items(), path)
+    return path
+
+
+class TestMappedInventory:
+    """Tests for in-place updates of a mapped snapshot file."""
+
+    def test_update_quality_matches_gilded_rose(self, snapshot_path):
+        """Each day in place equals a regular GildedRose day."""
+        expected = sample_items()
+        gilded_rose = GildedRose(expected)
+        with MappedInventory(snapshot_path) as inventory:
+            for _ in range(20):
+                inventory.update_quality()
+                gilded_rose.update_quality()
+                assert as_tuples(inventory.items) == as_tuples(expected)
+
+    def test_changes_and_day_reach_the_file(self, snapshot_path):
+        """Committed days are visible to a fresh reader of the file."""
+        expected = sample_items()
+        GildedRose(expected).advance(3)
+        with MappedInventory(snapshot_path) as inventory:
+            inventory.update_quality()
+            inventory.advance(2)
+
+        assert read_snapshot_header(snapshot_path).day == 3
+        assert as_tuples(load_snapshot(snapshot_path)) == as_tuples(expected)
+
+    def test_days_alternate_between_column_pairs(self, snapshot_path):
+        """Readers follow the header to whichever pair holds the committed day."""
+        expected = sample_items()
+        gilded_rose = GildedRose(expected)
+        for day in range(1, 4):
+            with MappedInventory(snapshot_path) as inventory:
+                inventory.update_quality()
+            gilded_rose.update_quality()
+            assert read_snapshot_header(snapshot_path).slot == day % 2
+            assert as_tuples(load_snapshot(snapshot_path)) == as_tuples(expected)
+
+    def test_reopening_continues_from_the_stored_day(self, snapshot_path):
+        with MappedInventory(snapshot_path) as inventory:
+            inventory.update_quality()
+        with MappedInventory(snapshot_path) as inventory:
+            inventory.update_quality()
+            assert inventory.day == 2
+
+    def test_custom_strategy(self, snapshot_path):
+        class FrozenUpdater(QualityUpdater):
+            def update_quality(self, item):
+                pass
+
+            def update_sell_in(self, item):
+                pass
+
+        with MappedInventory(snapshot_path) as inventory:
+            inventory.register_strategy("Aged Brie", FrozenUpdater())
+            inventory.advance(5)
+            assert (inventory.items[1].sell_in, inventory.items[1].quality) == (2, 0)
+
+    def test_advance_uses_overriding_subclass_rules(self, tmp_path):
+        path = str(tmp_path / "brie.grs")
+        save_snapshot([Item("Aged Brie", 10, 0)], path)
+        with MappedInventory(path) as inventory:
+            inventory.register_strategy("Aged Brie", DoubleBrieUpdater())
+            inventory.advance(5)
+            assert (inventory.items[0].sell_in, inventory.items[0].quality) == (5, 10)
+
+    def test_crash_before_commit_keeps_the_last_day(self, snapshot_path, monkeypatch):
+        """Rows written for a day that never committed are not visible on reopen."""
+        expected = sample_items()
+        GildedRose(expected).update_quality()
+        inventory = MappedInventory(snapshot_path)
+        inventory.update_quality()
+
+        def crash(days):
+            raise OSError("power lost")
+
+        monkeypatch.setattr(inventory, "_commit", crash)
+        with pytest.raises(OSError):
+            inventory.advance(5)
+        inventory.close()
+
+        assert read_snapshot_header(snapshot_path).day == 1
+        with MappedInventory(snapshot_path) as inventory:
+            assert inventory.day == 1
+            assert as_tuples(inventory.items) == as_tuples(expected)
+
+    def test_rejects_compressed_snapshots(self, tmp_path):
+        path = str(tmp_path / "compressed.grs")
+        save_snapshot(sample_items(), path, compress=True)
+
+        with pytest.raises(ValueError):
+            MappedInventory(path)
+
+    def test_negative_days_rejected(self, snapshot_path):
+        with MappedInventory(snapshot_path) as inventory:
+            with pytest.raises(ValueError):
+                inventory.advance(-1)
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+import re
+
+import pytest
+
+from name_matcher import LRUCache, NameMatcher, PrefixTrie
+
+
+class TestLRUCache:
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+
+    def test_hit_and_miss_counters(self):
+        cache = LRUCache(maxsize=4)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("missing")
+
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.get("missing", "default") == "default"
+
+
+class TestPrefixTrie:
+    def test_longest_prefix_wins(self):
+        trie = PrefixTrie()
+        trie.insert("Con", "short")
+        trie.insert("Conjured", "long")
+
+        assert trie.longest_match("Conjured Cake") == "long"
+        assert trie.longest_match("Concert") == "short"
+        assert trie.longest_match("Brie") is None
+        assert sorted(trie.items()) == [("Con", "short"), ("Conjured", "long")]
+        assert len(trie) == 2
+
+
+class TestNameMatcher:
+    def test_patterns_in_registration_order_then_prefixes(self):
+        matcher = NameMatcher()
+        matcher.add_prefix("Conjured", "prefix")
+        matcher.add_glob("Conjured *Cake", "glob")
+        matcher.add_regex(r"Conjured (Mana|Fire) Cake", "regex")
+
+        assert matcher.match("Conjured Mana Cake") == "glob"
+        assert matcher.match("Conjured Bread") == "prefix"
+        assert matcher.match("Bread") is None
+        assert len(matcher) == 3
+
+    def test_regexes_must_match_the_whole_name(self):
+        matcher = NameMatcher()
+        matcher.add_regex(r"(?P<kind>Relic) of \w+", "relic")
+
+        assert matcher.match("Relic of Fire") == "relic"
+        assert matcher.match("Relic of Fire and Ice") is None
+
+    def test_patterns_that_do_not_combine_keep_their_order(self):
+        matcher = NameMatcher()
+        matcher.add_regex(r"(?P<kind>\w+) Cake", "cake")
+        matcher.add_regex(r"(?i)conjured .*", "conjured")
+        matcher.add_regex(r"(?P<kind>\w+) Bread", "bread")
+        matcher.add_glob("Conjured *", "glob")
+
+        assert matcher.match("Mana Cake") == "cake"
+        assert matcher.match("CONJURED Mana Cake") == "conjured"
+        assert matcher.match("Rye Bread") == "bread"
+        assert matcher.match("Conjured Rye Bread") == "conjured"
+        assert matcher.match("Elixir") is None
+        assert len(matcher) == 4
+
+    def test_invalid_regex_is_rejected_at_registration(self):
+        with pytest.raises(re.error):
+            NameMatcher().add_regex("(", "broken")
+
+    def test_map_values(self):
+        matcher = NameMatcher()
+        matcher.add_prefix("A", 1)
+        matcher.add_glob("B*", 2)
+        matcher.map_values(lambda value: value * 10)
+
+        assert (matcher.match("Apple"), matcher.match("Brie")) == (10, 20)
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+from gilded_rose import GildedRose, Item, QualityUpdater
+from item_store import ItemStore
+from parallel_gilded_rose import ParallelGildedRose
+from tests.helpers import DoubleBrieUpdater, as_tuples, random_items
+
+
+class PlusFiveUpdater(QualityUpdater):
+    """Custom strategy; module level so worker processes can unpickle it."""
+
+    def update_quality(self, item):
+        item.quality = self.clamp_quality(item.quality + 5)
+
+    def update_sell_in(self, item):
+        self.decrease_sell_in(item)
+
+
+@pytest.fixture(scope="module")
+def parallel_factory():
+    """Build ParallelGildedRose instances that always use two worker shards."""
+    created = []
+
+    def build(items):
+        gilded_rose = ParallelGildedRose(items, workers=2, min_shard_size=1)
+        created.append(gilded_rose)
+        return gilded_rose
+
+    yield build
+    for gilded_rose in created:
+        gilded_rose.close()
+
+
+class TestParallelGildedRose:
+    """Tests for the process-pool sharding mode."""
+
+    def test_shards_cover_inventory(self):
+        """Shards are contiguous, ordered and cover every row once."""
+        gilded_rose = ParallelGildedRose([], workers=3, min_shard_size=1)
+
+        assert gilded_rose._shards(10) == [(0, 4), (4, 8), (8, 10)]
+
+    def test_small_inventory_stays_in_process(self):
+        """Below two shards no pool is started."""
+        items = random_items(20, seed=3)
+        expected = random_items(20, seed=3)
+        gilded_rose = ParallelGildedRose(items, workers=4)
+        gilded_rose.update_quality()
+        GildedRose(expected).update_quality()
+
+        assert gilded_rose._executor is None
+        assert as_tuples(gilded_rose.items) == as_tuples(expected)
+        gilded_rose.close()
+
+    def test_workers_match_serial_updates(self, parallel_factory):
+        """Sharded multi-day results are identical to GildedRose."""
+        items = random_items(400, seed=3)
+        expected = random_items(400, seed=3)
+        gilded_rose = parallel_factory(items)
+        gilded_rose.advance(7)
+        GildedRose(expected).advance(7)
+
+        assert as_tuples(gilded_rose.items) == as_tuples(expected)
+
+    def test_columns_stay_resident_across_days(self, parallel_factory):
+        """Daily updates work on the same shared block; the originals are left alone."""
+        items = random_items(400, seed=3)
+        expected = random_items(400, seed=3)
+        gilded_rose = parallel_factory(items)
+        block_name = gilded_rose._shared_memory.name
+        serial = GildedRose(expected)
+        for _ in range(5):
+            gilded_rose.update_quality()
+            serial.update_quality()
+
+        assert gilded_rose._shared_memory.name == block_name
+        assert isinstance(gilded_rose.items.sell_in, memoryview)
+        assert as_tuples(gilded_rose.items) == as_tuples(expected)
+        assert as_tuples(items) == as_tuples(random_items(400, seed=3))
+
+    def test_workers_use_registered_strategies(self, parallel_factory):
+        """Custom strategies are shipped to the workers."""
+        items = [Item("Custom", 5, 10), Item("Normal Item", 5, 10)]
+        gilded_rose = parallel_factory(items)
+        gilded_rose.register_strategy("Custom", PlusFiveUpdater())
+        gilded_rose.update_quality()
+
+        assert as_tuples(gilded_rose.items) == [("Custom", 4, 15), ("Normal Item", 4, 9)]
+
+    def test_workers_use_overriding_subclass_rules(self, parallel_factory):
+        """Workers do not age a rule-overriding subclass with its parent's closed form."""
+        items = [Item("Aged Brie", 10, 0), Item("Normal Item", 10, 10)]
+        gilded_rose = parallel_factory(items)
+        gilded_rose.register_strategy("Aged Brie", DoubleBrieUpdater())
+        gilded_rose.advance(5)
+        gilded_rose.update_quality()
+
+        assert as_tuples(gilded_rose.items) == [("Aged Brie", 4, 12), ("Normal Item", 4, 4)]
+
+    def test_accepts_an_item_store(self, parallel_factory):
+        """An ItemStore inventory is copied into the shared columns like a list."""
+        store = ItemStore.from_items(random_items(50, seed=3))
+        expected = random_items(50, seed=3)
+        gilded_rose = parallel_factory(store)
+        gilded_rose.update_quality()
+        GildedRose(expected).update_quality()
+
+        assert as_tuples(gilded_rose.items) == as_tuples(expected)
+
+    def test_close_releases_the_block(self):
+        gilded_rose = ParallelGildedRose([Item("Normal Item", 1, 1)])
+        name = gilded_rose._shared_memory.name
+        gilded_rose.close()
+
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=name)
+
+    def test_rejects_negative_days(self):
+        """Negative day counts are rejected."""
+        with pytest.raises(ValueError):
+            ParallelGildedRose([Item("Normal Item", 1, 1)]).advance(-1)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from gilded_rose import GildedRose, Item, QualityUpdater
+from sqlite_inventory import CUSTOM, NORMAL, SQLiteInventory
+from tests.helpers import ITEM_NAMES, as_tuples, random_items
+
+
+class SpicedWineUpdater(QualityUpdater):
+    """Custom strategy with no SQL form: +2 per day, -3 once expired."""
+
+    def update_quality(self, item):
+        change = -3 if item.sell_in <= 0 else 2
+        item.quality = self.clamp_quality(item.quality + change)
+
+    def update_sell_in(self, item):
+        self.decrease_sell_in(item)
+
+
+def spiced_items(count=500):
+    """Every SQL category plus custom rows, with qualities on and past the clamps."""
+    return random_items(
+        count, seed=17, names=ITEM_NAMES + ["Spiced Wine"], sell_in_range=(-3, 15),
+        qualities=[-1, 0, 1, 2, 3, 25, 49, 50, 51, 80],
+    )
+
+
+@pytest.fixture
+def inventory():
+    with SQLiteInventory() as inventory:
+        yield inventory
+
+
+class TestSQLiteInventory:
+    """Tests for the set-based SQL daily roll."""
+
+    def test_sql_roll_matches_gilded_rose(self, inventory):
+        expected = spiced_items()
+        gilded_rose = GildedRose(expected)
+        gilded_rose.register_strategy("Spiced Wine", SpicedWineUpdater())
+        inventory.register_strategy("Spiced Wine", SpicedWineUpdater())
+        inventory.add_items(spiced_items())
+
+        for day in range(20):
+            inventory.update_quality()
+            gilded_rose.update_quality()
+            assert as_tuples(inventory.items()) == as_tuples(expected), day
+
+    def test_advance_matches_daily_updates(self, inventory):
+        expected = spiced_items()
+        GildedRose(expected).advance(12)
+        inventory.add_items(spiced_items())
+        inventory.advance(12)
+
+        assert as_tuples(inventory.items()) == as_tuples(expected)
+
+    def test_register_strategy_recategorizes_stored_rows(self, inventory):
+        inventory.add_item(Item("Spiced Wine", 5, 10))
+        category = "SELECT category FROM items"
+        assert inventory.connection.execute(category).fetchone()[0] == NORMAL
+
+        inventory.register_strategy("Spiced Wine", SpicedWineUpdater())
+
+        assert inventory.connection.execute(category).fetchone()[0] == CUSTOM
+        inventory.update_quality()
+        assert as_tuples(inventory.items()) == [("Spiced Wine", 4, 12)]
+
+    def test_register_strategy_only_rewrites_names_whose_category_changed(self, inventory):
+        inventory.add_items(spiced_items())
+        spiced_rows = sum(item.name == "Spiced Wine" for item in spiced_items())
+        changes = inventory.connection.total_changes
+
+        inventory.register_strategy("Spiced Wine", SpicedWineUpdater())
+        inventory.register_strategy("Spiced Wine", SpicedWineUpdater())
+
+        assert inventory.connection.total_changes - changes == spiced_rows
+
+    def test_day_is_one_transaction(self, inventory):
+        """A failing custom strategy rolls back the SQL part of the day too."""
+        class BrokenUpdater(QualityUpdater):
+            def update_quality(self, item):
+                raise RuntimeError("broken")
+
+            def update_sell_in(self, item):
+                pass
+
+        inventory.add_items([Item("Aged Brie", 5, 10), Item("Broken", 5, 10)])
+        inventory.register_strategy("Broken", BrokenUpdater())
+
+        with pytest.raises(RuntimeError):
+            inventory.update_quality()
+        assert as_tuples(inventory.items()) == [("Aged Brie", 5, 10), ("Broken", 5, 10)]
+
+    def test_persists_to_a_file(self, tmp_path):
+        path = str(tmp_path / "inventory.db")
+        with SQLiteInventory(path) as inventory:
+            inventory.add_item(Item("Aged Brie", 2, 0))
+            inventory.update_quality()
+        with SQLiteInventory(path) as inventory:
+            assert as_tuples(inventory.items()) == [("Aged Brie", 1, 1)]
+            assert len(inventory) == 1
+
+    def test_negative_days_rejected(self, inventory):
+        with pytest.raises(ValueError):
+            inventory.advance(-1)
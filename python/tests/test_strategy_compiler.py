@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+from gilded_rose import AgedBrieUpdater, GildedRose, Item, NormalItemUpdater, QualityUpdater
+from strategy_compiler import CompiledUpdater, compile_strategy
+from tests.helpers import ITEM_NAMES, as_tuples, random_items
+
+
+class SpicedWineUpdater(QualityUpdater):
+    """Custom strategy: gains 2 per day until expiry, then loses 3."""
+
+    def update_quality(self, item):
+        change = -3 if item.sell_in <= 0 else 2
+        item.quality = self.clamp_quality(item.quality + change)
+
+    def update_sell_in(self, item):
+        self.decrease_sell_in(item)
+
+
+def spiced_items(count=300):
+    """States inside and outside the compiled window, plus Sulfuras."""
+    items = random_items(count, seed=5, names=ITEM_NAMES + ["Spiced Wine"], sell_in_range=(-15, 70))
+    items.append(Item("Sulfuras, Hand of Ragnaros", -1, 80))
+    return items
+
+
+def inventory(items):
+    gilded_rose = GildedRose(items)
+    gilded_rose.register_strategy("Spiced Wine", SpicedWineUpdater())
+    return gilded_rose
+
+
+class TestStrategyCompiler:
+    """Tests for table-driven strategies."""
+
+    def test_compiled_days_match_the_original_strategies(self):
+        """Inside and outside the table window, results are unchanged."""
+        items, expected = spiced_items(), spiced_items()
+        compiled, plain = inventory(items), inventory(expected)
+        compiled.map_strategies(compile_strategy)
+
+        for day in range(40):
+            compiled.update_quality()
+            plain.update_quality()
+            assert as_tuples(items) == as_tuples(expected), day
+
+    def test_only_strategies_without_a_native_step_are_compiled(self):
+        gilded_rose = inventory(spiced_items(50))
+        gilded_rose.map_strategies(compile_strategy)
+        updaters = {item.name: updater for item, updater in zip(gilded_rose.items, gilded_rose._updaters)}
+
+        assert isinstance(updaters["Spiced Wine"], CompiledUpdater)
+        assert isinstance(updaters["Aged Brie"], AgedBrieUpdater)
+        assert compile_strategy(AgedBrieUpdater()).has_native_step()
+
+    def test_advance_matches_daily_updates(self):
+        items, expected = spiced_items(), spiced_items()
+        compiled, plain = inventory(items), inventory(expected)
+        compiled.map_strategies(compile_strategy)
+        compiled.advance(25)
+        for _ in range(25):
+            plain.update_quality()
+
+        assert as_tuples(items) == as_tuples(expected)
+
+    def test_each_phase_does_its_own_part(self):
+        """update_quality and update_sell_in keep the source's two-phase contract."""
+        source, compiled = SpicedWineUpdater(), compile_strategy(SpicedWineUpdater())
+        for sell_in, quality in [(3, 10), (0, 10), (-1, 2), (70, 10), (3, 90)]:
+            expected, item = Item("Spiced Wine", sell_in, quality), Item("Spiced Wine", sell_in, quality)
+            source.update_quality(expected)
+            compiled.update_quality(item)
+            assert (item.sell_in, item.quality) == (expected.sell_in, expected.quality)
+            source.update_sell_in(expected)
+            compiled.update_sell_in(item)
+            assert (item.sell_in, item.quality) == (expected.sell_in, expected.quality)
+
+    def test_compiled_built_in_keeps_expiry_in_the_sell_in_phase(self):
+        updater = CompiledUpdater(NormalItemUpdater())
+        item = Item("Normal Item", 0, 10)
+        updater.update_quality(item)
+        assert (item.sell_in, item.quality) == (0, 9)
+
+        updater.update_sell_in(item)
+        assert (item.sell_in, item.quality) == (-1, 8)
+
+    def test_update_batch_matches_step(self):
+        updater = compile_strategy(SpicedWineUpdater())
+        items = spiced_items()
+        expected = [updater.source.step(item.sell_in, item.quality) for item in items]
+        updater.update_batch(items)
+
+        assert [(item.sell_in, item.quality) for item in items] == expected
+
+    def test_compiling_twice_keeps_the_table(self):
+        updater = CompiledUpdater(AgedBrieUpdater(), sell_in_range=(-2, 2))
+
+        assert compile_strategy(updater) is updater
+        assert updater.linear_window(5, 10) == AgedBrieUpdater().linear_window(5, 10)
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from gilded_rose import AgedBrieUpdater, GildedRose, Item, ItemUpdaterFactory
+from tests.helpers import DoubleBrieUpdater
+from trajectory_cache import TrajectoryCache
+
+
+def advanced(name, sell_in, quality, days):
+    items = [Item(name, sell_in, quality)]
+    GildedRose(items).advance(days)
+    return items[0].sell_in, items[0].quality
+
+
+class TestTrajectoryCache:
+    """Tests for memoized projections."""
+
+    def test_projection_matches_advance(self):
+        cache = TrajectoryCache()
+        for name in ["Normal Item", "Aged Brie", "Backstage passes to a TAFKAL80ETC concert",
+                     "Sulfuras, Hand of Ragnaros", "Conjured Mana Cake"]:
+            for days in [0, 1, 7, 30]:
+                assert cache.project(name, 8, 20, days) == advanced(name, 8, 20, days)
+
+    def test_repeated_states_are_hits(self):
+        """Names sharing a strategy share entries too."""
+        cache = TrajectoryCache()
+        cache.project("Elixir of the Mongoose", 5, 7, 10)
+        cache.project("+5 Dexterity Vest", 5, 7, 10)
+        cache.project("Elixir of the Mongoose", 5, 7, 11)
+
+        assert (cache.hits, cache.misses) == (1, 2)
+        assert cache.hit_rate == pytest.approx(1 / 3)
+        assert len(cache) == 2
+
+    def test_register_strategy_invalidates_entries(self):
+        factory = ItemUpdaterFactory()
+        cache = TrajectoryCache(factory)
+        assert cache.project("Cheese", 5, 10, 3) == (2, 7)
+
+        factory.register_strategy("Cheese", AgedBrieUpdater())
+
+        assert cache.project("Cheese", 5, 10, 3) == (2, 13)
+        assert len(cache) == 1
+
+    def test_projection_uses_overriding_subclass_rules(self):
+        factory = ItemUpdaterFactory()
+        factory.register_strategy("Aged Brie", DoubleBrieUpdater())
+
+        assert TrajectoryCache(factory).project("Aged Brie", 10, 0, 5) == (5, 10)
+
+    def test_entries_are_bounded(self):
+        cache = TrajectoryCache(max_entries=10)
+        for quality in range(50):
+            cache.project("Aged Brie", 5, quality, 3)
+
+        assert len(cache) == 10
+
+    def test_project_items_leaves_originals_alone(self):
+        items = [Item("Aged Brie", 2, 0), Item("Aged Brie", 2, 0)]
+        projected = TrajectoryCache().project_items(items, 5)
+
+        assert [(item.sell_in, item.quality) for item in projected] == [(-3, 8), (-3, 8)]
+        assert (items[0].sell_in, items[0].quality) == (2, 0)
+
+    def test_negative_days_rejected(self):
+        with pytest.raises(ValueError):
+            TrajectoryCache().project("Aged Brie", 1, 1, -1)
@@ -21,13 +21,14 @@ def main():
     import sys
     if len(sys.argv) > 1:
         days = int(sys.argv[1]) + 1
+    gilded_rose = GildedRose(items)
     for day in range(days):
         print("-------- day %s --------" % day)
         print("name, sellIn, quality")
         for item in items:
             print(item)
         print("")
-        GildedRose(items).update_quality()
+        gilded_rose.update_quality()
 
 
 if __name__ == "__main__":
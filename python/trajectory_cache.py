@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Memoized multi-day projections.
+"What does this item look like in N days?" depends only on the item's
+strategy, sell_in, quality and N, so answers are cached per
+(strategy, sell_in, quality, days) in a bounded LRU cache. Catalogs with
+many repeated states turn repeated projections into dictionary hits.
+
+The cache watches its factory's version and starts over as soon as a
+strategy is registered or replaced.
+
+Usage:
+    cache = TrajectoryCache()
+    sell_in, quality = cache.project("Aged Brie", 2, 0, days=30)
+"""
+
+from typing import Iterable, List, Optional, Tuple
+
+from gilded_rose import Item, ItemUpdaterFactory
+from name_matcher import LRUCache
+
+
+DEFAULT_MAX_ENTRIES = 65_536
+
+
+class TrajectoryCache:
+    """
+    LRU cache of advance() results.
+    Strategies must depend only on sell_in and quality, which holds for
+    every built-in strategy.
+    """
+
+    def __init__(
+        self,
+        updater_factory: Optional[ItemUpdaterFactory] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.updater_factory = updater_factory or ItemUpdaterFactory()
+        self._entries = LRUCache(max_entries)
+        self._version = self.updater_factory.version
+
+    def project(self, name: str, sell_in: int, quality: int, days: int) -> Tuple[int, int]:
+        """(sell_in, quality) of an item with this name and state after days."""
+        if days < 0:
+            raise ValueError(f"days must be non-negative, got {days}")
+        factory = self.updater_factory
+        if factory.version != self._version:
+            self._entries.clear()
+            self._version = factory.version
+        updater = factory.get_updater(name)
+        # The factory keeps every live strategy referenced, so its id is stable
+        key = (id(updater), sell_in, quality, days)
+        result = self._entries.get(key)
+        if result is None:
+            scratch = Item(name, sell_in, quality)
+            updater.advance(scratch, days)
+            result = (scratch.sell_in, scratch.quality)
+            self._entries.put(key, result)
+        return result
+
+    def project_items(self, items: Iterable[Item], days: int) -> List[Item]:
+        """New Items showing each item after days; the originals are untouched."""
+        return [
+            Item(item.name, *self.project(item.name, item.sell_in, item.quality, days))
+            for item in items
+        ]
+
+    @property
+    def hits(self) -> int:
+        return self._entries.hits
+
+    @property
+    def misses(self) -> int:
+        return self._entries.misses
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)